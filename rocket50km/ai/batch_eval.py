@@ -0,0 +1,128 @@
+"""Batched policy evaluation: N flights, one policy forward per control step.
+
+All episodes run side by side in one batch sim (the same physics, action
+repeat, observations and reward as ``RealisticRocketVecEnv`` /
+``RocketVecEnv``). Every control step stacks the N observations into one
+``policy.predict`` call, and each flight freezes when it lands or hits
+``max_sim_time``. The sims are deterministic, so with a deterministic policy
+N nominal episodes are N copies of one flight: pass a dispersion spec
+(see dispersion.py) to fly N different rockets, or ``deterministic=False``.
+
+Run from rocket50km/:
+    python -m ai.batch_eval --episodes 256 --spec dispersion_spec.json
+"""
+import argparse
+import csv
+import json
+import time
+
+import numpy as np
+
+from ai.vec_env import RealisticRocketVecEnv, RocketVecEnv
+from dispersion import DISPERSABLE_FIELDS, nominal_values, sample_parameters, summarize, validate_spec
+
+SIMS = {"realistic": RealisticRocketVecEnv, "simple": RocketVecEnv}
+POLICIES = ("best_model/best_model", "ppo_rocket_final.zip")
+EPISODE_COLUMNS = ("return", "apogee", "max_g", "landing_speed", "flight_time", "landed")
+STANDARD_GRAVITY = 9.80665
+
+
+def load_policy(path):
+    from stable_baselines3 import PPO
+    return PPO.load(path, device="cpu")
+
+
+def rollout(policy, n_episodes, sim="realistic", spec=None, seed=0, deterministic=True, physics_steps=None):
+    """Fly ``n_episodes`` flights with ``policy`` (anything with an SB3-style
+    ``predict(obs, deterministic=...)``); returns a dict of per-episode arrays.
+
+    ``spec`` disperses the rocket parameters per flight, drawn from
+    ``default_rng(seed)``.
+    """
+    env = SIMS[sim](n_episodes, physics_steps)
+    batch = env.sim
+    samples = {}
+    if spec:
+        if sim != "realistic":
+            raise ValueError("dispersion specs apply to the realistic sim only")
+        samples = sample_parameters(validate_spec(spec), n_episodes, np.random.default_rng(seed), nominal_values())
+        for field, values in samples.items():
+            setattr(batch, DISPERSABLE_FIELDS[field], values)
+    if not deterministic and hasattr(policy, "set_random_seed"):
+        policy.set_random_seed(seed)
+    obs = env.reset()  # picks up the dispersed propellant and drag coefficient
+
+    returns = np.zeros(n_episodes)
+    max_acc = np.zeros(n_episodes)
+    running = np.ones(n_episodes, dtype=bool)
+    steps = 0
+    while running.any():
+        actions, _ = policy.predict(obs, deterministic=deterministic)
+        steps += 1
+        for _ in range(env.physics_steps):
+            batch.step(actions, running)
+            returns += np.where(running, env._get_reward(), 0.0)
+            max_acc = np.where(running, np.maximum(max_acc, np.abs(batch.acceleration)), max_acc)
+            running &= ~batch.done & (batch.time < batch.max_sim_time)
+            if not running.any():
+                break
+        obs = env._get_obs()
+
+    return {
+        **samples,
+        "return": returns,
+        "apogee": batch.max_altitude.copy(),
+        "max_g": max_acc / STANDARD_GRAVITY,
+        "landing_speed": np.abs(batch.landing_velocity),
+        "flight_time": batch.time.copy(),
+        "landed": batch.landed.copy(),
+        "policy_calls": steps,
+    }
+
+
+def evaluate(path, n_episodes, sim="realistic", spec=None, seed=0, deterministic=True):
+    """Load and roll out one saved policy; returns ``(episodes, summary, episodes_per_sec)``."""
+    policy = load_policy(path)
+    start = time.perf_counter()
+    episodes = rollout(policy, n_episodes, sim, spec, seed, deterministic)
+    elapsed = time.perf_counter() - start
+    summary = summarize({name: episodes[name] for name in EPISODE_COLUMNS})
+    return episodes, summary, n_episodes / elapsed
+
+
+def write_episodes(path, episodes):
+    columns = [name for name, values in episodes.items() if np.ndim(values) == 1]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(zip(*(episodes[name].tolist() for name in columns)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate saved PPO policies on N flights at once")
+    parser.add_argument("--policy", nargs="+", default=list(POLICIES))
+    parser.add_argument("--episodes", type=int, default=256)
+    parser.add_argument("--sim", choices=SIMS, default="realistic")
+    parser.add_argument("--spec", default=None, help="dispersion spec JSON (per-flight rocket parameters)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stochastic", action="store_true", help="sample actions instead of the policy mean")
+    parser.add_argument("--csv", default=None, help="per-episode results; one file per policy, {name} is substituted")
+    args = parser.parse_args()
+
+    spec = None
+    if args.spec:
+        with open(args.spec) as f:
+            spec = json.load(f)
+
+    for path in args.policy:
+        episodes, summary, rate = evaluate(path, args.episodes, args.sim, spec, args.seed, not args.stochastic)
+        print(f"\n🚀 {path}: {args.episodes} episodes, {episodes['policy_calls']} policy calls, "
+              f"{rate:,.0f} episodes/s")
+        for name in EPISODE_COLUMNS:
+            s = summary[name]
+            print(f"  {name:14s} mean {s['mean']:11.2f}  std {s['std']:10.2f}  "
+                  f"p5 {s['p5']:11.2f}  p95 {s['p95']:11.2f}")
+        if args.csv:
+            out = args.csv.format(name=path.replace("/", "_").removesuffix(".zip"))
+            write_episodes(out, episodes)
+            print(f"  per-episode results: {out}")
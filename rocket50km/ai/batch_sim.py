@@ -0,0 +1,316 @@
+import numpy as np
+
+from ai.realistic_env import rocket_cfg, engine_cfg, sim_cfg, env_cfg, atmosphere
+from physics import AtmosphereModel
+from sim_state import VERTICAL_FIELDS, BatchSnapshotState
+
+EARTH_RADIUS = 6371000
+
+
+def _throttle_column(actions, n):
+    actions = np.asarray(actions, dtype=float)
+    if actions.ndim == 2:
+        actions = actions[:, 0]
+    return np.broadcast_to(actions, (n,))
+
+
+class BatchRealisticRocketSim(BatchSnapshotState):
+    """Steps N independent RealisticRocketSim flights at once.
+
+    Every state field is a float/bool array of shape (N,). Rockets that have
+    landed are frozen exactly like the scalar sim, which returns early once
+    ``done`` is set. Per-rocket parameters (thrust, isp, dry_mass, ...) are
+    set once in ``__init__`` and survive ``reset()``, so they can be
+    overwritten for sweeps.
+    """
+
+    def __init__(self, n_rockets, atmosphere_model=None):
+        n = self.n_rockets = int(n_rockets)
+        self.atmosphere = atmosphere_model if atmosphere_model is not None else atmosphere
+
+        self.propellant_mass = np.full(n, float(rocket_cfg["propellant_mass"]))
+        self.dry_mass = np.full(n, float(rocket_cfg["dry_mass"]))
+        self.cross_section_area = np.full(n, float(rocket_cfg["cross_section_area"]))
+        self.base_drag_coeff = np.full(n, float(rocket_cfg["drag_coeff"]))
+        self.chute_drag_coeff = 15.0
+
+        self.thrust = np.full(n, float(engine_cfg["thrust"]))
+        self.isp = np.full(n, float(engine_cfg["isp"]))
+        self.gravity = env_cfg["gravity"]
+        self.min_throttle = engine_cfg["min_throttle"]
+        # Multiplier on the profile wind, for dispersion runs
+        self.wind_scale = np.ones(n)
+
+        self.time_step = sim_cfg["time_step"]
+        self.max_sim_time = sim_cfg["max_sim_time"]
+        self.parachute_altitude = 10000
+
+        self.reset()
+
+    def _initial_state(self):
+        n = self.n_rockets
+        return {
+            "time": np.zeros(n),
+            "altitude": np.zeros(n),
+            "velocity": np.zeros(n),
+            "acceleration": np.zeros(n),
+            "throttle": np.ones(n),
+            "pitch_angle": np.full(n, 90.0),
+            "downrange": np.zeros(n),
+            "horizontal_velocity": np.zeros(n),
+            "fuel_mass": self.propellant_mass.copy(),
+            "mass": self.propellant_mass + self.dry_mass,
+            "drag_coeff": self.base_drag_coeff.copy(),
+            "parachute_deployed": np.zeros(n, dtype=bool),
+            "done": np.zeros(n, dtype=bool),
+            "landed": np.zeros(n, dtype=bool),
+            "max_altitude": np.zeros(n),
+            "landing_velocity": np.zeros(n),
+        }
+
+    def reset(self, mask=None):
+        """Reset every rocket, or only those selected by a boolean ``mask``."""
+        for name, value in self._initial_state().items():
+            if mask is None:
+                setattr(self, name, value)
+            else:
+                getattr(self, name)[mask] = value[mask]
+
+    def get_air_density(self, altitude):
+        return self.atmosphere.density(altitude)
+
+    def get_wind_speed(self, altitude):
+        return self.atmosphere.wind_speed(altitude) * self.wind_scale
+
+    def get_gravity(self, altitude):
+        return 9.80665 * (EARTH_RADIUS / (EARTH_RADIUS + altitude)) ** 2
+
+    def update_pitch(self, active):
+        alt = self.altitude
+        pitch = np.where(
+            alt < 1000, 90.0,
+            np.where(alt < 10000, 90.0 - 45.0 * ((alt - 1000) / 9000.0), 45.0)
+        )
+        self.pitch_angle = np.where(active, pitch, self.pitch_angle)
+
+    def step(self, actions, mask=None):
+        """Advance every rocket that has not landed by one ``time_step``.
+
+        ``actions`` is a throttle per rocket, shape (N,) or (N, k) where the
+        first column is the throttle, or a scalar applied to all rockets.
+        A boolean ``mask`` additionally freezes the unselected rockets.
+        """
+        active = ~self.done if mask is None else mask & ~self.done
+        if not active.any():
+            return self.get_state()
+
+        throttle = np.clip(_throttle_column(actions, self.n_rockets), self.min_throttle, 1.0)
+        self.throttle = np.where(active, throttle, self.throttle)
+
+        self.update_pitch(active)
+
+        deploy = active & ~self.parachute_deployed & (self.altitude <= self.parachute_altitude) & (self.velocity < 0)
+        self.parachute_deployed |= deploy
+        self.drag_coeff = np.where(deploy, self.chute_drag_coeff, self.drag_coeff)
+
+        g = self.get_gravity(self.altitude)
+        rho = self.get_air_density(self.altitude)
+        wind_speed = self.get_wind_speed(self.altitude)
+        dt = self.time_step
+
+        # Fuel burn; a step that would overdraw the tank empties it with zero thrust
+        has_fuel = self.fuel_mass > 0
+        flow_rate = self.thrust / (self.isp * g)
+        fuel_burn = flow_rate * dt * throttle
+        overdraw = fuel_burn > self.fuel_mass
+        fuel_burn = np.where(overdraw, self.fuel_mass, fuel_burn)
+        throttle = np.where(overdraw, 0.0, throttle)
+        burning = active & has_fuel
+        fuel_mass = np.where(burning, self.fuel_mass - fuel_burn, self.fuel_mass)
+        mass = np.where(has_fuel, self.dry_mass + fuel_mass, self.dry_mass)
+        thrust_force = np.where(has_fuel, self.thrust * throttle, 0.0)
+
+        pitch_rad = np.radians(self.pitch_angle)
+        thrust_vertical = thrust_force * np.sin(pitch_rad)
+        thrust_horizontal = thrust_force * np.cos(pitch_rad)
+
+        # Vertical
+        drag = 0.5 * rho * self.velocity**2 * self.drag_coeff * self.cross_section_area
+        drag = np.where(self.velocity > 0, -drag, drag)
+        acceleration = (thrust_vertical - mass * g + drag) / mass
+        velocity = self.velocity + acceleration * dt
+        altitude = self.altitude + velocity * dt
+
+        # Horizontal
+        relative_horizontal_velocity = self.horizontal_velocity - wind_speed
+        drag_horizontal = 0.5 * rho * relative_horizontal_velocity**2 * self.drag_coeff * self.cross_section_area
+        drag_horizontal = np.where(relative_horizontal_velocity > 0, -drag_horizontal, drag_horizontal)
+        horiz_acc = (thrust_horizontal + drag_horizontal) / mass
+        horizontal_velocity = self.horizontal_velocity + horiz_acc * dt
+        downrange = self.downrange + horizontal_velocity * dt
+
+        time = self.time + dt
+
+        self.fuel_mass = fuel_mass
+        self.mass = np.where(active, mass, self.mass)
+        self.acceleration = np.where(active, acceleration, self.acceleration)
+        self.velocity = np.where(active, velocity, self.velocity)
+        self.altitude = np.where(active, altitude, self.altitude)
+        self.horizontal_velocity = np.where(active, horizontal_velocity, self.horizontal_velocity)
+        self.downrange = np.where(active, downrange, self.downrange)
+        self.time = np.where(active, time, self.time)
+        self.max_altitude = np.maximum(self.max_altitude, self.altitude)
+
+        touchdown = active & (self.altitude <= 0) & (self.time > 2)
+        self.landing_velocity[touchdown] = self.velocity[touchdown]
+        self.altitude[touchdown] = 0.0
+        self.velocity[touchdown] = 0.0
+        self.done |= touchdown
+        self.landed |= touchdown
+
+        return self.get_state()
+
+    def run(self, throttle=1.0):
+        """Step until every rocket has landed or hit ``max_sim_time``."""
+        while True:
+            running = ~self.done & (self.time < self.max_sim_time)
+            if not running.any():
+                break
+            self.step(throttle)
+            # Rockets past max_sim_time stop like a truncated env episode
+            self.done |= ~self.landed & (self.time >= self.max_sim_time)
+        return self.get_state()
+
+    def get_state(self):
+        return {
+            "altitude": self.altitude,
+            "velocity": self.velocity,
+            "acceleration": self.acceleration,
+            "fuel_mass": self.fuel_mass,
+            "x": self.downrange,
+            "vx": self.horizontal_velocity,
+            "pitch": self.pitch_angle
+        }
+
+
+class BatchRocketSimulator(BatchSnapshotState):
+    """Steps N independent RocketSimulator flights at once (1-D, constant air density)."""
+
+    SNAPSHOT_FIELDS = VERTICAL_FIELDS
+
+    def __init__(self, n_rockets):
+        n = self.n_rockets = int(n_rockets)
+
+        self.propellant_mass = np.full(n, float(rocket_cfg["propellant_mass"]))
+        self.dry_mass = np.full(n, float(rocket_cfg["dry_mass"]))
+        self.cross_section_area = np.full(n, float(rocket_cfg["cross_section_area"]))
+        self.base_drag_coeff = np.full(n, float(rocket_cfg["drag_coeff"]))
+        self.thrust = np.full(n, float(engine_cfg["thrust"]))
+        self.isp = np.full(n, float(engine_cfg["isp"]))
+        self.gravity = env_cfg["gravity"]
+        self.air_density = env_cfg["air_density"]
+        self.wind_speed = env_cfg["wind_speed"]
+        self.atmosphere = AtmosphereModel.constant(self.air_density, self.wind_speed)
+        self.min_throttle = engine_cfg["min_throttle"]
+        self.time_step = sim_cfg["time_step"]
+        self.max_sim_time = sim_cfg["max_sim_time"]
+
+        # Parachute settings
+        self.parachute_altitude = 10000  # deploy when falling below 10 km
+        self.chute_drag_coeff = 20.0      # high drag with parachute
+
+        self.reset()
+
+    def _initial_state(self):
+        n = self.n_rockets
+        return {
+            "time": np.zeros(n),
+            "altitude": np.zeros(n),
+            "velocity": np.zeros(n),
+            "acceleration": np.zeros(n),
+            "throttle": np.ones(n),
+            "fuel_mass": self.propellant_mass.copy(),
+            "mass": self.propellant_mass + self.dry_mass,
+            "drag_coeff": self.base_drag_coeff.copy(),
+            "parachute_deployed": np.zeros(n, dtype=bool),
+            "done": np.zeros(n, dtype=bool),
+            "landed": np.zeros(n, dtype=bool),
+            "max_altitude": np.zeros(n),
+            "landing_velocity": np.zeros(n),
+        }
+
+    def reset(self, mask=None):
+        """Reset every rocket, or only those selected by a boolean ``mask``."""
+        for name, value in self._initial_state().items():
+            if mask is None:
+                setattr(self, name, value)
+            else:
+                getattr(self, name)[mask] = value[mask]
+
+    def step(self, actions, mask=None):
+        active = ~self.done if mask is None else mask & ~self.done
+        if not active.any():
+            return self.get_state()
+
+        throttle = np.clip(_throttle_column(actions, self.n_rockets), self.min_throttle, 1.0)
+
+        deploy = active & ~self.parachute_deployed & (self.altitude <= self.parachute_altitude) & (self.velocity < 0)
+        self.parachute_deployed |= deploy
+        self.drag_coeff = np.where(deploy, self.chute_drag_coeff, self.drag_coeff)
+
+        dt = self.time_step
+        has_fuel = self.fuel_mass > 0
+        flow_rate = self.thrust / (self.isp * self.gravity)
+        fuel_burn = flow_rate * dt * throttle
+        overdraw = fuel_burn > self.fuel_mass
+        fuel_burn = np.where(overdraw, self.fuel_mass, fuel_burn)
+        throttle = np.where(overdraw | ~has_fuel, 0.0, throttle)
+        fuel_mass = np.where(active & has_fuel, self.fuel_mass - fuel_burn, self.fuel_mass)
+        mass = np.where(has_fuel, self.dry_mass + fuel_mass, self.dry_mass)
+        actual_thrust = self.thrust * throttle
+
+        # Drag force (direction opposes velocity)
+        rho = self.atmosphere.density(self.altitude)
+        drag_force = 0.5 * rho * self.velocity**2 * self.drag_coeff * self.cross_section_area
+        drag_force = np.where(self.velocity > 0, -drag_force, drag_force)
+
+        acceleration = (actual_thrust - mass * self.gravity + drag_force) / mass
+        velocity = self.velocity + acceleration * dt
+        altitude = self.altitude + velocity * dt
+
+        self.throttle = np.where(active, throttle, self.throttle)
+        self.fuel_mass = fuel_mass
+        self.mass = np.where(active, mass, self.mass)
+        self.acceleration = np.where(active, acceleration, self.acceleration)
+        self.velocity = np.where(active, velocity, self.velocity)
+        self.altitude = np.where(active, altitude, self.altitude)
+        self.time = np.where(active, self.time + dt, self.time)
+        self.max_altitude = np.maximum(self.max_altitude, self.altitude)
+
+        touchdown = active & (self.altitude <= 0) & (self.time > 2)
+        self.landing_velocity[touchdown] = self.velocity[touchdown]
+        self.altitude[touchdown] = 0.0
+        self.velocity[touchdown] = 0.0
+        self.acceleration[touchdown] = 0.0
+        self.done |= touchdown
+        self.landed |= touchdown
+
+        return self.get_state()
+
+    def run(self, throttle=1.0):
+        """Step until every rocket has landed or hit ``max_sim_time``."""
+        while True:
+            running = ~self.done & (self.time < self.max_sim_time)
+            if not running.any():
+                break
+            self.step(throttle)
+            self.done |= ~self.landed & (self.time >= self.max_sim_time)
+        return self.get_state()
+
+    def get_state(self):
+        return {
+            "altitude": self.altitude,
+            "velocity": self.velocity,
+            "acceleration": self.acceleration,
+            "fuel_mass": self.fuel_mass,
+        }
@@ -0,0 +1,52 @@
+import time
+
+from stable_baselines3.common.callbacks import BaseCallback
+
+
+class ThroughputCallback(BaseCallback):
+    """Logs data-collection and update throughput to the SB3 logger (and so to tensorboard).
+
+    Per PPO iteration:
+      time/rollout_s         wall time of ``collect_rollouts``
+      time/update_s          wall time of the preceding ``train()`` (gradient updates)
+      time/rollout_steps_per_sec  env steps / rollout time
+      time/steps_per_sec     env steps / total wall time since ``learn`` started
+
+    An iteration's update ends when the next rollout starts, so ``update_s``
+    is logged one iteration late; the last update is printed at the end.
+    """
+
+    def __init__(self, verbose=0):
+        super().__init__(verbose)
+        self._learn_start = None
+        self._rollout_start = None
+        self._rollout_end = None
+        self._rollout_first_step = 0
+
+    def _on_training_start(self):
+        self._learn_start = time.perf_counter()
+        self._start_timesteps = self.num_timesteps
+
+    def _on_rollout_start(self):
+        now = time.perf_counter()
+        if self._rollout_end is not None:
+            self.logger.record("time/update_s", now - self._rollout_end)
+        self._rollout_start = now
+        self._rollout_first_step = self.num_timesteps
+
+    def _on_step(self):
+        return True
+
+    def _on_rollout_end(self):
+        now = time.perf_counter()
+        self._rollout_end = now
+        rollout = now - self._rollout_start
+        self.logger.record("time/rollout_s", rollout)
+        self.logger.record("time/rollout_steps_per_sec", (self.num_timesteps - self._rollout_first_step) / rollout)
+        self.logger.record("time/steps_per_sec", (self.num_timesteps - self._start_timesteps) / (now - self._learn_start))
+
+    def _on_training_end(self):
+        if self._rollout_end is not None and self.verbose:
+            print(f"last update: {time.perf_counter() - self._rollout_end:.2f} s, "
+                  f"{(self.num_timesteps - self._start_timesteps) / (time.perf_counter() - self._learn_start):,.0f} "
+                  f"steps/s overall")
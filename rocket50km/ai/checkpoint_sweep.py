@@ -0,0 +1,156 @@
+"""Evaluate every PPO checkpoint in a directory on the same seeded flights.
+
+Each checkpoint flies ``n_episodes`` rockets through ``ai.batch_eval``.
+Their parameters are dispersed with the dispersion spec and drawn from
+``seed``, so every checkpoint sees exactly the same set of flights.
+Checkpoints are spread over a process pool. Results go to a JSON index keyed
+by the file's SHA-256 and the evaluation settings. A re-run only evaluates
+new or changed checkpoints, and the index is rewritten after each one, so an
+interrupted sweep keeps its progress.
+
+Run from rocket50km/:
+    python -m ai.checkpoint_sweep --episodes 64
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from ai.realistic_env import sim_cfg
+from dispersion import SPEC_PATH
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+CHECKPOINT_DIR = os.path.join(ROOT, "checkpoints")
+PATTERN = "ppo_rocket_*_steps.zip"
+INDEX_NAME = "sweep_index.json"
+TARGET_ALTITUDE = sim_cfg["target_altitude"]
+
+
+def checkpoint_steps(path):
+    match = re.search(r"_(\d+)_steps\.zip$", os.path.basename(path))
+    return int(match.group(1)) if match else -1
+
+
+def list_checkpoints(directory=CHECKPOINT_DIR, pattern=PATTERN):
+    """Checkpoint paths in training order."""
+    return sorted(glob.glob(os.path.join(directory, pattern)), key=lambda p: (checkpoint_steps(p), p))
+
+
+def file_hash(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def settings_key(settings):
+    """Short hash of the evaluation settings; results are only reused under identical settings."""
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _init_worker():
+    # One torch thread per process; the pool provides the parallelism
+    import torch
+    torch.set_num_threads(1)
+
+
+def evaluate_checkpoint(path, n_episodes, seed, spec, sim="realistic"):
+    """Roll one checkpoint out on ``n_episodes`` seeded flights; returns its index entry (minus the hash)."""
+    from ai.batch_eval import load_policy, rollout
+
+    start = time.perf_counter()
+    episodes = rollout(load_policy(path), n_episodes, sim, spec, seed)
+    apogee_error = episodes["apogee"] - TARGET_ALTITUDE
+    return {
+        "checkpoint": os.path.basename(path),
+        "steps": checkpoint_steps(path),
+        "mean_return": float(episodes["return"].mean()),
+        "std_return": float(episodes["return"].std()),
+        "mean_apogee": float(episodes["apogee"].mean()),
+        "mean_apogee_error": float(apogee_error.mean()),
+        "mean_abs_apogee_error": float(np.abs(apogee_error).mean()),
+        "landed_fraction": float(episodes["landed"].mean()),
+        "wall_time": time.perf_counter() - start,
+    }
+
+
+def load_index(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def write_index(path, results, settings):
+    with open(path, "w") as f:
+        json.dump({"settings": settings, "target_altitude": TARGET_ALTITUDE, "results": results}, f, indent=2)
+
+
+def sweep(directory=CHECKPOINT_DIR, n_episodes=64, seed=0, spec=None, sim="realistic", workers=None,
+          index_path=None):
+    """Evaluate the checkpoints of ``directory`` not already in the index.
+
+    Returns the index entries of every checkpoint currently present, best
+    mean return first.
+    """
+    index_path = index_path or os.path.join(directory, INDEX_NAME)
+    settings = {"n_episodes": n_episodes, "seed": seed, "spec": spec, "sim": sim}
+    key = settings_key(settings)
+    results = load_index(index_path)
+
+    paths = list_checkpoints(directory)
+    hashes = {path: f"{file_hash(path)}:{key}" for path in paths}
+    todo = [path for path in paths if hashes[path] not in results]
+    print(f"{len(paths)} checkpoints, {len(paths) - len(todo)} cached, {len(todo)} to evaluate")
+
+    def store(path, entry):
+        results[hashes[path]] = entry
+        write_index(index_path, results, settings)
+        print(f"  {entry['checkpoint']:32s} return {entry['mean_return']:12.1f} ± {entry['std_return']:10.1f}  "
+              f"apogee error {entry['mean_apogee_error']:10.1f} m  ({entry['wall_time']:.1f} s)")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(todo) <= 1:
+        for path in todo:
+            store(path, evaluate_checkpoint(path, n_episodes, seed, spec, sim))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = {pool.submit(evaluate_checkpoint, path, n_episodes, seed, spec, sim): path for path in todo}
+            for future in as_completed(futures):
+                store(futures[future], future.result())
+
+    current = [results[hashes[path]] for path in paths]
+    return sorted(current, key=lambda entry: entry["mean_return"], reverse=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate every PPO checkpoint on the same seeded flights")
+    parser.add_argument("--dir", default=CHECKPOINT_DIR)
+    parser.add_argument("--episodes", type=int, default=64, help="seeded flights per checkpoint")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spec", default=SPEC_PATH, help="dispersion spec for the flights ('' for nominal)")
+    parser.add_argument("--sim", choices=("realistic", "simple"), default="realistic")
+    parser.add_argument("--workers", type=int, default=None, help="default: one per CPU core")
+    parser.add_argument("--index", default=None, help=f"default: <dir>/{INDEX_NAME}")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    spec = None
+    if args.spec:
+        with open(args.spec) as f:
+            spec = json.load(f)
+
+    start = time.perf_counter()
+    ranked = sweep(args.dir, args.episodes, args.seed, spec, args.sim, args.workers, args.index)
+    print(f"\n🏁 Swept {len(ranked)} checkpoints in {time.perf_counter() - start:.1f} s "
+          f"(target altitude {TARGET_ALTITUDE} m)")
+    for rank, entry in enumerate(ranked[:args.top], 1):
+        print(f"{rank:3d}. {entry['checkpoint']:32s} return {entry['mean_return']:12.1f} ± {entry['std_return']:10.1f}  "
+              f"|apogee error| {entry['mean_abs_apogee_error']:10.1f} m  landed {entry['landed_fraction']:.0%}")
@@ -1,25 +1,27 @@
 # ai/eval_policy.py
 import sys
 import os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
 
 import json
-import time
+import argparse
 import traceback
-from launch_feasibility.model.predict import predict_launch_feasibility
-from stable_baselines3 import PPO
-from ai.realistic_env import RealisticRocketEnv as RocketEnv
-import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
+from launch_feasibility.service import predict_launch_feasibility
+from clock import RealTimeClock, add_clock_arguments, clock_from_args
 
+LAUNCH_INPUT_PATH = os.path.join(ROOT, "launch_input.json")
+POLICY_PATH = os.path.join(ROOT, "best_model", "best_model")
 
 
-def evaluate_policy():
+
+def evaluate_policy(clock=None, service_url=None):
+    clock = clock if clock is not None else RealTimeClock()
     print("\n🧪 Running AI Prelaunch Feasibility Check...")
 
     # Load launch input
     try:
-        with open("launch_input.json", "r") as f:
+        with open(LAUNCH_INPUT_PATH, "r") as f:
             launch_data = json.load(f)
     except Exception as e:
         print("❌ Failed to load launch_input.json:", e)
@@ -27,7 +29,7 @@ def evaluate_policy():
 
     # Run model prediction
     try:
-        result = predict_launch_feasibility(**launch_data)
+        result = predict_launch_feasibility(service_url=service_url, **launch_data)
     except Exception as e:
         print("❌ Unexpected error during prediction:", e)
         traceback.print_exc()
@@ -52,9 +54,15 @@ def evaluate_policy():
 
     print("\n🚀 Launch Feasible — Initiating RL Simulation...")
 
+    # Heavy imports only once the launch is a go
+    from stable_baselines3 import PPO
+    from ai.realistic_env import RealisticRocketEnv as RocketEnv
+    import matplotlib.pyplot as plt
+    from matplotlib.gridspec import GridSpec
+
     # RL SIMULATION PART
     env = RocketEnv()
-    model = PPO.load("best_model/best_model")
+    model = PPO.load(POLICY_PATH)
     obs, _ = env.reset()
     done = False
 
@@ -96,8 +104,6 @@ def evaluate_policy():
     frame = 0
 
     while not done:
-        loop_start = time.time()
-
         action, _ = model.predict(obs, deterministic=True)
         obs, reward, terminated, truncated, _ = env.step(action)
         env.render()
@@ -138,15 +144,20 @@ def evaluate_policy():
             plt.pause(0.001)
 
         frame += 1
-        time.sleep(max(0, env.time_step - (time.time() - loop_start)))
+        clock.tick(env.control_time_step)
         done = terminated or truncated
 
     print(f"\n✅ Final Altitude: {env.rocket.max_altitude:.1f} m")
     print(f"✅ Flight Duration: {env.rocket.time:.1f} s")
+    print(f"⏱️  Clock: {clock.summary()}")
 
     plt.ioff()
     plt.show()
 
 
 if __name__ == "__main__":
-    evaluate_policy()
+    parser = add_clock_arguments(argparse.ArgumentParser())
+    parser.add_argument("--service", default=None,
+                        help="feasibility service URL (default: $FEASIBILITY_SERVICE_URL, else score in-process)")
+    args = parser.parse_args()
+    evaluate_policy(clock_from_args(args), service_url=args.service)
@@ -0,0 +1,93 @@
+"""Export a PPO MlpPolicy actor to a flat ``.npz`` for ``NumpyPolicyController``.
+
+Only the deterministic action path is kept: the ``mlp_extractor`` policy
+layers and ``action_net`` (the Gaussian mean), the action bounds that
+``PPO.predict`` clips to and, optionally, the observation statistics of a
+saved ``VecNormalize``. The controller in controller.py rebuilds the forward
+pass with NumPy, so flying the policy needs neither torch nor
+stable-baselines3.
+
+Run from rocket50km/:
+    python -m ai.export_policy                                   # ppo_rocket_final.zip -> ai/policy_actor.npz
+    python -m ai.export_policy --policy ai/rocket_policy.zip --vec-normalize ai/vec_normalize.pkl --out ai/rocket_policy_actor.npz
+"""
+import argparse
+import json
+import os
+import pickle
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DEFAULT_POLICY = os.path.join(ROOT, "ppo_rocket_final.zip")
+ACTOR_PATH = os.path.join(ROOT, "ai", "policy_actor.npz")
+
+# torch.nn activation class -> NumpyPolicyController activation name
+ACTIVATIONS = {"ReLU": "relu", "Tanh": "tanh", "Identity": "linear"}
+
+
+def actor_layers(policy):
+    """``[(weight (in, out), bias, activation)]`` of the deterministic actor of an SB3 ``ActorCriticPolicy``."""
+    import torch
+
+    if policy.squash_output:
+        raise ValueError("squashed (tanh-bounded) policies are not supported")
+    if type(policy.features_extractor).__name__ != "FlattenExtractor":
+        raise ValueError(f"unsupported features extractor {type(policy.features_extractor).__name__}")
+
+    modules = [*policy.mlp_extractor.policy_net, policy.action_net]
+    layers = []
+    for module in modules:
+        if isinstance(module, torch.nn.Linear):
+            layers.append([module.weight.detach().cpu().numpy().T, module.bias.detach().cpu().numpy(), "linear"])
+        elif type(module).__name__ in ACTIVATIONS and layers:
+            layers[-1][2] = ACTIVATIONS[type(module).__name__]
+        else:
+            raise ValueError(f"unsupported actor module {module}")
+    return [tuple(layer) for layer in layers]
+
+
+def export(model, path=ACTOR_PATH, vec_normalize=None):
+    """Write the actor of a loaded PPO ``model`` (and ``vec_normalize`` obs stats, if given) to ``path``."""
+    layers = actor_layers(model.policy)
+    arrays = {}
+    for n, (weight, bias, _) in enumerate(layers):
+        arrays[f"layer{n}_weight"] = weight
+        arrays[f"layer{n}_bias"] = bias
+
+    obs_dim = model.observation_space.shape[0]
+    if vec_normalize is not None:
+        if not vec_normalize.norm_obs:
+            vec_normalize = None
+        elif vec_normalize.obs_rms.mean.shape != (obs_dim,):
+            raise ValueError(f"VecNormalize stats have shape {vec_normalize.obs_rms.mean.shape}, "
+                             f"the policy observes ({obs_dim},)")
+    if vec_normalize is not None:
+        arrays.update(obs_mean=vec_normalize.obs_rms.mean, obs_var=vec_normalize.obs_rms.var,
+                      clip_obs=np.array(vec_normalize.clip_obs), epsilon=np.array(vec_normalize.epsilon))
+
+    meta = {"activations": [activation for _, _, activation in layers], "obs_dim": obs_dim,
+            "normalize_obs": vec_normalize is not None}
+    np.savez(path, meta=np.array(json.dumps(meta)), action_low=model.action_space.low,
+             action_high=model.action_space.high, **arrays)
+    return path
+
+
+def load_vec_normalize(path):
+    # Only the pickled statistics are needed, not an env to wrap
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+if __name__ == "__main__":
+    from stable_baselines3 import PPO
+
+    parser = argparse.ArgumentParser(description="Export a PPO actor for the NumPy policy controller")
+    parser.add_argument("--policy", default=DEFAULT_POLICY)
+    parser.add_argument("--vec-normalize", default=None, help="VecNormalize pickle the policy was trained with")
+    parser.add_argument("--out", default=ACTOR_PATH)
+    args = parser.parse_args()
+
+    vec_normalize = load_vec_normalize(args.vec_normalize) if args.vec_normalize else None
+    path = export(PPO.load(args.policy, device="cpu"), args.out, vec_normalize)
+    print(f"✅ Exported {args.policy} actor to {path} ({os.path.getsize(path) / 1024:.0f} KB)")
@@ -0,0 +1,120 @@
+import atexit
+import csv
+import itertools
+import os
+import weakref
+
+import numpy as np
+
+LOG_COLUMNS = [
+    "time", "altitude", "velocity", "acceleration", "fuel_mass",
+    "pitch_angle", "throttle", "parachute", "downrange", "horizontal_velocity"
+]
+# Decimal places per column, matching the original per-step CSV rows
+LOG_DECIMALS = [2, 2, 2, 3, 2, 2, 2, 0, 2, 2]
+PARACHUTE_COLUMN = LOG_COLUMNS.index("parachute")
+
+# Safe for parallel workers: one file per env and per episode
+PER_EPISODE_TEMPLATE = "flight_log_env{env_id}_ep{episode:05d}.csv"
+
+# Default env_id suffix: unique per logger, so loggers in one process
+# (e.g. a DummyVecEnv) never share a file
+_logger_ids = itertools.count()
+# Flushed at exit without keeping every logger (and its buffer) alive
+_live_loggers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_loggers():
+    for logger in list(_live_loggers):
+        logger.flush()
+
+
+class NullFlightLogger:
+    """Discards every row. Use for training rollouts and sweeps."""
+
+    enabled = False
+    rows_written = 0
+
+    def start_episode(self):
+        pass
+
+    def log(self, row):
+        pass
+
+    def end_episode(self):
+        pass
+
+    def flush(self):
+        pass
+
+
+class BufferedFlightLogger:
+    """Collects rows in a preallocated array and writes them in bulk.
+
+    The array is flushed to disk when it fills up and when an episode ends, so a
+    600 s flight costs a handful of file opens instead of one per step.
+    ``path`` may contain ``{env_id}`` and ``{episode}`` placeholders; without
+    them every episode truncates and rewrites the same file. ``env_id``
+    defaults to ``<pid>-<n>``, unique per logger instance.
+    """
+
+    enabled = True
+
+    def __init__(self, path, env_id=None, capacity=4096):
+        self.path = path
+        self.env_id = f"{os.getpid()}-{next(_logger_ids)}" if env_id is None else env_id
+        self.capacity = capacity
+        self._buffer = np.zeros((capacity, len(LOG_COLUMNS)))
+        self._count = 0
+        self._episode = -1
+        self._header_pending = False
+        self.rows_written = 0
+        _live_loggers.add(self)
+
+    def __del__(self):
+        # Rows still buffered when the logger is dropped go to disk, not away
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    @classmethod
+    def per_episode(cls, log_dir, env_id=None, capacity=4096):
+        os.makedirs(log_dir, exist_ok=True)
+        return cls(os.path.join(log_dir, PER_EPISODE_TEMPLATE), env_id=env_id, capacity=capacity)
+
+    @property
+    def current_path(self):
+        return self.path.format(env_id=self.env_id, episode=max(self._episode, 0))
+
+    def start_episode(self):
+        if self._header_pending or self._count:
+            self.end_episode()
+        self._episode += 1
+        self._header_pending = True
+
+    def log(self, row):
+        if self._count == self.capacity:
+            self.flush()
+        self._buffer[self._count] = row
+        self._count += 1
+
+    def end_episode(self):
+        self.flush()
+
+    def flush(self):
+        if not self._header_pending and not self._count:
+            return
+        mode = 'w' if self._header_pending else 'a'
+        rows = self._buffer[:self._count]
+        columns = [np.round(rows[:, i], d).tolist() for i, d in enumerate(LOG_DECIMALS)]
+        columns[PARACHUTE_COLUMN] = [int(v) for v in columns[PARACHUTE_COLUMN]]
+        with open(self.current_path, mode, newline='') as f:
+            writer = csv.writer(f)
+            if self._header_pending:
+                writer.writerow(LOG_COLUMNS)
+            writer.writerows(zip(*columns))
+        self.rows_written += self._count
+        self._count = 0
+        self._header_pending = False
@@ -4,7 +4,12 @@ from gym import spaces
 import numpy as np
 import json
 import os
-import csv
+import time
+from ai.flight_logger import BufferedFlightLogger
+from integrator import integrate_flight
+from physics import AtmosphereModel
+from profiler import NULL_PROFILER
+from sim_state import SnapshotState
 
 # Load config
 config_path = os.path.join(os.path.dirname(__file__), '..', 'config.json')
@@ -16,18 +21,33 @@ engine_cfg = cfg["engine"]
 sim_cfg = cfg["simulation"]
 env_cfg = cfg["environment"]
 
-# Load RocketPy-generated atmosphere
+# Load RocketPy-generated atmosphere (interpolated, no 1 km steps)
 env_profile_path = os.path.join(os.path.dirname(__file__), '..', 'rocketpy_env', 'env_profile.json')
-with open(env_profile_path, 'r') as f:
-    env_profile = json.load(f)
-
-density_lookup = {int(k): v for k, v in env_profile["air_density"].items()}
-wind_lookup = {int(k): v for k, v in env_profile["wind_speed"].items()}
+atmosphere = AtmosphereModel.from_profile(env_profile_path)
 
 LOG_PATH = os.path.join(os.path.dirname(__file__), '..', 'flight_log.csv')
 
-class RealisticRocketSim:
-    def __init__(self):
+class RealisticRocketSim(SnapshotState):
+    # Fixed attribute layout: no per-instance __dict__ to grow on the hot path
+    __slots__ = (
+        "logger", "atmosphere", "profiler", "step_time", "log_time",
+        "time", "altitude", "velocity", "acceleration", "throttle", "pitch_angle",
+        "downrange", "horizontal_velocity", "fuel_mass", "dry_mass", "mass",
+        "cross_section_area", "drag_coeff", "base_drag_coeff", "chute_drag_coeff",
+        "thrust", "isp", "gravity", "min_throttle", "time_step", "max_sim_time",
+        "parachute_deployed", "parachute_altitude", "done", "landed", "max_altitude",
+    )
+
+    def __init__(self, logger=None, atmosphere_model=None, profiler=None):
+        # Defaults to the legacy single flight_log.csv, written in bulk
+        self.logger = logger if logger is not None else BufferedFlightLogger(LOG_PATH)
+        self.atmosphere = atmosphere_model if atmosphere_model is not None else atmosphere
+        # Opt-in per-phase timing (profiler.PhaseProfiler)
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+        # Wall time inside advance, and the logging share of it (see logging_overhead);
+        # only accumulated while a logger or profiler is active
+        self.step_time = 0.0
+        self.log_time = 0.0
         self.reset()
 
     def reset(self):
@@ -64,21 +84,13 @@ class RealisticRocketSim:
         self.landed = False
         self.max_altitude = 0.0
 
-        # Reset CSV log
-        with open(LOG_PATH, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "time", "altitude", "velocity", "acceleration", "fuel_mass",
-                "pitch_angle", "throttle", "parachute", "downrange", "horizontal_velocity"
-            ])
+        self.logger.start_episode()
 
     def get_air_density(self, altitude):
-        alt = int(min(50000, max(0, round(altitude, -3))))
-        return density_lookup.get(alt, 1.2)
+        return self.atmosphere.density(altitude)
 
     def get_wind_speed(self, altitude):
-        alt = int(min(50000, max(0, round(altitude, -3))))
-        return wind_lookup.get(alt, 0.0)
+        return self.atmosphere.wind_speed(altitude)
 
     def get_gravity(self, altitude):
         R = 6371000
@@ -93,9 +105,19 @@ class RealisticRocketSim:
             self.pitch_angle = 45.0
 
     def step(self, action):
+        self.advance(action)
+        return self.get_state()
+
+    def advance(self, action):
+        """``step`` without building the state dict; use ``observe`` to read the result."""
         if self.done:
-            return self.get_state()
+            return
 
+        profiling = self.profiler.enabled
+        # No clock reads at all unless logging_overhead or the profiler needs them
+        timing = profiling or self.logger.enabled
+        if timing:
+            step_start = time.perf_counter()
         throttle = float(np.clip(action[0], self.min_throttle, 1.0))
         self.throttle = throttle
 
@@ -106,8 +128,12 @@ class RealisticRocketSim:
             self.drag_coeff = self.chute_drag_coeff
 
         g = self.get_gravity(self.altitude)
+        if profiling:
+            atmosphere_start = time.perf_counter()
         rho = self.get_air_density(self.altitude)
         wind_speed = self.get_wind_speed(self.altitude)
+        if profiling:
+            atmosphere_time = time.perf_counter() - atmosphere_start
 
         if self.fuel_mass > 0:
             flow_rate = self.thrust / (self.isp * g)
@@ -146,28 +172,115 @@ class RealisticRocketSim:
         self.time += self.time_step
         self.max_altitude = max(self.max_altitude, self.altitude)
 
-        with open(LOG_PATH, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                round(self.time, 2),
-                round(self.altitude, 2),
-                round(self.velocity, 2),
-                round(self.acceleration, 3),
-                round(self.fuel_mass, 2),
-                round(self.pitch_angle, 2),
-                round(self.throttle, 2),
-                int(self.parachute_deployed),
-                round(self.downrange, 2),
-                round(self.horizontal_velocity, 2)
-            ])
+        if timing:
+            log_start = time.perf_counter()
+        if self.logger.enabled:
+            self.logger.log((
+                self.time, self.altitude, self.velocity, self.acceleration, self.fuel_mass,
+                self.pitch_angle, self.throttle, self.parachute_deployed, self.downrange,
+                self.horizontal_velocity
+            ))
 
         if self.altitude <= 0 and self.time > 2:
             self.altitude = 0
             self.velocity = 0
             self.done = True
             self.landed = True
+            self.logger.end_episode()
+
+        if timing:
+            step_end = time.perf_counter()
+            self.step_time += step_end - step_start
+            self.log_time += step_end - log_start
+            if profiling:
+                self.profiler.add("atmosphere", atmosphere_time)
+                self.profiler.add("physics", log_start - step_start - atmosphere_time)
+                self.profiler.add("logging", step_end - log_start)
+
+    def observe(self, out):
+        """Write [altitude, velocity, acceleration, fuel_mass] into the float32 buffer ``out``."""
+        out[0] = self.altitude
+        out[1] = self.velocity
+        out[2] = self.acceleration
+        out[3] = self.fuel_mass
+        return out
+
+    def derivatives(self, t, y, throttle, burning, chute):
+        """Continuous-time form of ``step`` for y = [altitude, velocity, downrange, vx, fuel_mass]."""
+        altitude, velocity, downrange, vx, fuel = y
+        g = self.get_gravity(altitude)
+        rho = self.get_air_density(altitude)
+        wind_speed = self.get_wind_speed(altitude)
+        drag_coeff = self.chute_drag_coeff if chute else self.base_drag_coeff
+
+        if altitude < 1000:
+            pitch = 90.0
+        elif altitude < 10000:
+            pitch = 90.0 - 45.0 * ((altitude - 1000) / 9000.0)
+        else:
+            pitch = 45.0
 
-        return self.get_state()
+        if burning:
+            throttle = min(max(throttle(t, y) if callable(throttle) else throttle, self.min_throttle), 1.0)
+            thrust_force = self.thrust * throttle
+            fuel_rate = self.thrust / (self.isp * g) * throttle
+            mass = self.dry_mass + fuel
+        else:
+            thrust_force = fuel_rate = 0.0
+            mass = self.dry_mass
+
+        pitch_rad = math.radians(pitch)
+        drag = 0.5 * rho * velocity**2 * drag_coeff * self.cross_section_area
+        drag *= -1 if velocity > 0 else 1
+        acc = (thrust_force * math.sin(pitch_rad) - mass * g + drag) / mass
+
+        relative_vx = vx - wind_speed
+        drag_horizontal = 0.5 * rho * relative_vx**2 * drag_coeff * self.cross_section_area
+        drag_horizontal *= -1 if relative_vx > 0 else 1
+        horiz_acc = (thrust_force * math.cos(pitch_rad) + drag_horizontal) / mass
+
+        return np.array([velocity, acc, vx, horiz_acc, -fuel_rate])
+
+    def fly_adaptive(self, throttle=1.0, rtol=1e-6, atol=1e-6):
+        """Fly the rest of the flight with the adaptive RK45 integrator instead of ``step``.
+
+        Continues from the current state (e.g. after some ``step`` calls or
+        a ``restore``) up to ``max_sim_time``. ``throttle`` is a constant or
+        a callable ``throttle(t, y)``. MECO, apogee, parachute deployment and
+        touchdown times are found by root finding rather than rounded to
+        ``time_step`` and reported as absolute sim times. The sim is left in
+        its landed state; returns the event times and integrator statistics.
+        """
+        y0 = [self.altitude, self.velocity, self.downrange, self.horizontal_velocity, self.fuel_mass]
+        t, y, event_times, event_states, stats = integrate_flight(
+            lambda tt, yy, burning, chute: self.derivatives(tt, yy, throttle, burning, chute),
+            y0, self.max_sim_time, self.parachute_altitude, rtol=rtol, atol=atol,
+            t0=self.time, chute=self.parachute_deployed
+        )
+        self.time = t
+        self.altitude, self.velocity, self.downrange, self.horizontal_velocity, self.fuel_mass = map(float, y)
+        self.mass = self.dry_mass + self.fuel_mass
+        if "apogee" in event_states:
+            self.max_altitude = max(self.max_altitude, float(event_states["apogee"][0]))
+        if "parachute" in event_times:
+            self.parachute_deployed = True
+            self.drag_coeff = self.chute_drag_coeff
+        if "touchdown" in event_times:
+            self.altitude = 0
+            self.velocity = 0
+            self.done = True
+            self.landed = True
+        return {"events": event_times, **stats}
+
+    def logging_overhead(self):
+        """Share of ``advance`` wall time spent logging (rows plus the end-of-flight flush).
+
+        Both totals are taken inside ``advance`` with the same clock, so
+        flushes started by ``reset()`` do not count.
+        """
+        if self.step_time == 0:
+            return 0.0
+        return self.log_time / self.step_time
 
     def get_state(self):
         return {
@@ -181,9 +294,28 @@ class RealisticRocketSim:
         }
 
 class RealisticRocketEnv(gym.Env):
-    def __init__(self):
+    """Gym env around RealisticRocketSim.
+
+    ``step`` writes the observation into one float32 buffer that the next
+    ``step`` overwrites (DummyVecEnv copies it out); copy it to keep it. The
+    final observation of an episode and ``reset`` return fresh arrays.
+
+    With a ``profiler`` (profiler.PhaseProfiler) the sim and the env time
+    every phase; that episode's totals (since ``reset``) are returned in
+    ``info["profile"]`` at its end. The profiler's own totals keep growing.
+    """
+
+    def __init__(self, logger=None, compiled=False, physics_steps=None, profiler=None):
         super().__init__()
-        self.rocket = RealisticRocketSim()
+        if compiled:
+            from ai.step_kernels import make_realistic_sim
+            self.rocket = make_realistic_sim(logger=logger)
+        else:
+            self.rocket = RealisticRocketSim(logger=logger)
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+        self.rocket.profiler = self.profiler
+        # Profiler totals at the start of the episode: info["profile"] covers this episode only
+        self._profile_mark = None
         self.observation_space = spaces.Box(
             low=np.array([0.0, -500.0, -100.0, 0.0], dtype=np.float32),
             high=np.array([100000.0, 3000.0, 100.0, rocket_cfg["propellant_mass"]], dtype=np.float32),
@@ -195,18 +327,47 @@ class RealisticRocketEnv(gym.Env):
             dtype=np.float32
         )
         self.time_step = sim_cfg["time_step"]
+        # Action repeat: physics steps per policy decision
+        self.physics_steps = physics_steps or sim_cfg["physics_steps_per_rl_step"]
+        self.control_time_step = self.time_step * self.physics_steps
+        self._obs = np.zeros(4, dtype=np.float32)
 
     def reset(self, *, seed=None, options=None):
         self.rocket.reset()
+        self._profile_mark = self.profiler.mark()
         return self._get_obs(), {}
 
     def step(self, action):
-        self.rocket.step(action)
-        obs = self._get_obs()
-        reward = self._get_reward()
-        terminated = self.rocket.done
-        truncated = self.rocket.time >= self.rocket.max_sim_time
-        return obs, reward, terminated, truncated, {}
+        rocket = self.rocket
+        profiler = self.profiler
+        profiling = profiler.enabled
+        reward = 0.0
+        for _ in range(self.physics_steps):
+            rocket.advance(action)
+            if profiling:
+                reward_start = time.perf_counter()
+            reward += self._get_reward()
+            if profiling:
+                profiler.add("reward", time.perf_counter() - reward_start)
+            terminated = rocket.done
+            truncated = rocket.time >= rocket.max_sim_time
+            if terminated or truncated:
+                break
+        if profiling:
+            observe_start = time.perf_counter()
+        obs = rocket.observe(self._obs)
+        if profiling:
+            profiler.add("observation", time.perf_counter() - observe_start)
+        info = {}
+        if terminated or truncated:
+            obs = obs.copy()
+            if not terminated:
+                # A landing already ended the log episode; a timeout must flush it too
+                rocket.logger.end_episode()
+            info["logging_overhead"] = rocket.logging_overhead()
+            if profiling:
+                info["profile"] = profiler.report(since=self._profile_mark)
+        return obs, reward, terminated, truncated, info
 
     def render(self, mode="human"):
         chute = "✅ Parachute" if self.rocket.parachute_deployed else "🟦 No Chute"
@@ -215,8 +376,7 @@ class RealisticRocketEnv(gym.Env):
               f"Pitch: {self.rocket.pitch_angle:.1f}° | {chute}")
 
     def _get_obs(self):
-        s = self.rocket.get_state()
-        return np.array([s["altitude"], s["velocity"], s["acceleration"], s["fuel_mass"]], dtype=np.float32)
+        return self.rocket.observe(np.empty(4, dtype=np.float32))
 
     def _get_reward(self):
         if self.rocket.landed:
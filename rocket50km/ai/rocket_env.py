@@ -1,9 +1,14 @@
 import math
 import json
 import os
+import time
 import gym
 from gym import spaces
 import numpy as np
+from integrator import integrate_flight
+from physics import AtmosphereModel
+from profiler import NULL_PROFILER
+from sim_state import VERTICAL_FIELDS, SnapshotState
 
 # Load configuration from JSON
 config_path = os.path.join(os.path.dirname(__file__), '..', 'config.json')
@@ -15,8 +20,21 @@ engine_cfg = cfg["engine"]
 sim_cfg = cfg["simulation"]
 env_cfg = cfg["environment"]
 
-class RocketSimulator:
-    def __init__(self):
+class RocketSimulator(SnapshotState):
+    SNAPSHOT_FIELDS = VERTICAL_FIELDS
+
+    # Fixed attribute layout: no per-instance __dict__ to grow on the hot path
+    __slots__ = (
+        "time", "altitude", "velocity", "acceleration", "throttle", "fuel_mass",
+        "dry_mass", "mass", "cross_section_area", "drag_coeff", "thrust", "isp",
+        "gravity", "air_density", "wind_speed", "atmosphere", "min_throttle",
+        "time_step", "max_sim_time", "done", "landed", "max_altitude",
+        "parachute_deployed", "parachute_altitude", "chute_drag_coeff", "profiler",
+    )
+
+    def __init__(self, profiler=None):
+        # Opt-in per-phase timing (profiler.PhaseProfiler)
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
         self.reset()
 
     def reset(self):
@@ -35,6 +53,7 @@ class RocketSimulator:
         self.gravity = env_cfg["gravity"]
         self.air_density = env_cfg["air_density"]
         self.wind_speed = env_cfg["wind_speed"]
+        self.atmosphere = AtmosphereModel.constant(self.air_density, self.wind_speed)
         self.min_throttle = engine_cfg["min_throttle"]
         self.time_step = sim_cfg["time_step"]
         self.max_sim_time = sim_cfg["max_sim_time"]
@@ -61,10 +80,21 @@ class RocketSimulator:
             "fuel_mass": self.fuel_mass,
         }
 
+    def observe(self, out):
+        """Write [altitude, velocity, acceleration, fuel_mass] into the float32 buffer ``out``."""
+        out[0] = self.altitude
+        out[1] = self.velocity
+        out[2] = self.acceleration
+        out[3] = self.fuel_mass
+        return out
+
     def update(self, throttle=None):
         if self.done:
             return
 
+        profiling = self.profiler.enabled
+        if profiling:
+            step_start = time.perf_counter()
         if throttle is not None:
             self.throttle = max(self.min_throttle, min(throttle, 1.0))
 
@@ -90,7 +120,12 @@ class RocketSimulator:
             self.mass = self.dry_mass
 
         # Drag force (direction opposes velocity)
-        drag_force = 0.5 * self.air_density * self.velocity**2 * self.drag_coeff * self.cross_section_area
+        if profiling:
+            atmosphere_start = time.perf_counter()
+        rho = self.atmosphere.density(self.altitude)
+        if profiling:
+            atmosphere_time = time.perf_counter() - atmosphere_start
+        drag_force = 0.5 * rho * self.velocity**2 * self.drag_coeff * self.cross_section_area
         drag_force *= -1 if self.velocity > 0 else 1
 
         net_force = actual_thrust - (self.mass * self.gravity) + drag_force
@@ -110,11 +145,79 @@ class RocketSimulator:
             self.done = True
             self.landed = True
 
+        if profiling:
+            self.profiler.add("atmosphere", atmosphere_time)
+            self.profiler.add("physics", time.perf_counter() - step_start - atmosphere_time)
+
+    def derivatives(self, t, y, throttle, burning, chute):
+        """Continuous-time form of ``update`` for y = [altitude, velocity, fuel_mass]."""
+        altitude, velocity, fuel = y
+        drag_coeff = self.chute_drag_coeff if chute else rocket_cfg["drag_coeff"]
+
+        if burning:
+            throttle = max(self.min_throttle, min(throttle(t, y) if callable(throttle) else throttle, 1.0))
+            actual_thrust = self.thrust * throttle
+            fuel_rate = self.thrust / (self.isp * self.gravity) * throttle
+            mass = self.dry_mass + fuel
+        else:
+            actual_thrust = fuel_rate = 0.0
+            mass = self.dry_mass
+
+        drag_force = 0.5 * self.atmosphere.density(altitude) * velocity**2 * drag_coeff * self.cross_section_area
+        drag_force *= -1 if velocity > 0 else 1
+        acc = (actual_thrust - mass * self.gravity + drag_force) / mass
+        return np.array([velocity, acc, -fuel_rate])
+
+    def fly_adaptive(self, throttle=1.0, rtol=1e-6, atol=1e-6):
+        """Fly the rest of the flight with the adaptive RK45 integrator instead of ``update``.
+
+        Continues from the current state up to ``max_sim_time``. Returns exact
+        MECO/apogee/parachute/touchdown times (absolute sim time) and
+        integrator statistics.
+        """
+        t, y, event_times, event_states, stats = integrate_flight(
+            lambda tt, yy, burning, chute: self.derivatives(tt, yy, throttle, burning, chute),
+            [self.altitude, self.velocity, self.fuel_mass], self.max_sim_time,
+            self.parachute_altitude, rtol=rtol, atol=atol,
+            t0=self.time, chute=self.parachute_deployed
+        )
+        self.time = t
+        self.altitude, self.velocity, self.fuel_mass = map(float, y)
+        self.mass = self.dry_mass + self.fuel_mass
+        if "apogee" in event_states:
+            self.max_altitude = max(self.max_altitude, float(event_states["apogee"][0]))
+        if "parachute" in event_times:
+            self.parachute_deployed = True
+            self.drag_coeff = self.chute_drag_coeff
+        if "touchdown" in event_times:
+            self.altitude = 0
+            self.velocity = 0
+            self.acceleration = 0
+            self.done = True
+            self.landed = True
+        return {"events": event_times, **stats}
+
 
 class RocketEnv(gym.Env):
-    def __init__(self):
+    """Gym env around RocketSimulator.
+
+    ``step`` returns a reused float32 observation buffer, like
+    ``RealisticRocketEnv``; copy it to keep it past the next ``step``.
+    A ``profiler`` reports the episode's totals (since ``reset``) in
+    ``info["profile"]`` at episode end.
+    """
+
+    def __init__(self, compiled=False, physics_steps=None, profiler=None):
         super(RocketEnv, self).__init__()
-        self.rocket = RocketSimulator()
+        if compiled:
+            from ai.step_kernels import make_rocket_simulator
+            self.rocket = make_rocket_simulator()
+        else:
+            self.rocket = RocketSimulator()
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+        self.rocket.profiler = self.profiler
+        # Profiler totals at the start of the episode: info["profile"] covers this episode only
+        self._profile_mark = None
 
         # Observation: [altitude, velocity, acceleration, fuel_mass]
         low = np.array([0.0, -500.0, -100.0, 0.0], dtype=np.float32)
@@ -129,32 +232,53 @@ class RocketEnv(gym.Env):
         )
 
         self.time_step = sim_cfg["time_step"]
+        # Action repeat: physics steps per policy decision
+        self.physics_steps = physics_steps or sim_cfg["physics_steps_per_rl_step"]
+        self.control_time_step = self.time_step * self.physics_steps
+        self._obs = np.zeros(4, dtype=np.float32)
 
     def reset(self, *, seed=None, options=None):
         self.rocket.reset()
+        self._profile_mark = self.profiler.mark()
         obs = self._get_obs()
         return obs, {}
 
     def step(self, action):
-        self.rocket.step(action)
-        obs = self._get_obs()
-        reward = self._get_reward()
-        terminated = self.rocket.done
-        truncated = self.rocket.time >= sim_cfg["max_sim_time"]
-        return obs, reward, terminated, truncated, {}
+        # Repeat the action, summing the per-physics-step reward, until done
+        rocket = self.rocket
+        profiler = self.profiler
+        profiling = profiler.enabled
+        throttle = action[0] if isinstance(action, (list, np.ndarray)) else action
+        reward = 0.0
+        for _ in range(self.physics_steps):
+            rocket.update(throttle)
+            if profiling:
+                reward_start = time.perf_counter()
+            reward += self._get_reward()
+            if profiling:
+                profiler.add("reward", time.perf_counter() - reward_start)
+            terminated = rocket.done
+            truncated = rocket.time >= sim_cfg["max_sim_time"]
+            if terminated or truncated:
+                break
+        if profiling:
+            observe_start = time.perf_counter()
+        obs = rocket.observe(self._obs)
+        if profiling:
+            profiler.add("observation", time.perf_counter() - observe_start)
+        info = {}
+        if terminated or truncated:
+            obs = obs.copy()
+            if profiling:
+                info["profile"] = profiler.report(since=self._profile_mark)
+        return obs, reward, terminated, truncated, info
 
     def render(self, mode="human"):
         status = "✅ Parachute" if self.rocket.parachute_deployed else "🟦 No Chute"
         print(f"Time: {self.rocket.time:.1f}s | Alt: {self.rocket.altitude:.1f} m | Vel: {self.rocket.velocity:.1f} m/s | Fuel: {self.rocket.fuel_mass:.1f} kg | {status}")
 
     def _get_obs(self):
-        state = self.rocket.get_state()
-        return np.array([
-            state["altitude"],
-            state["velocity"],
-            state["acceleration"],
-            state["fuel_mass"]
-        ], dtype=np.float32)
+        return self.rocket.observe(np.empty(4, dtype=np.float32))
 
     def _get_reward(self):
         if self.rocket.landed:
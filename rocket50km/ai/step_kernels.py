@@ -0,0 +1,309 @@
+import math
+import time
+
+import numpy as np
+
+from ai.realistic_env import RealisticRocketSim
+from ai.rocket_env import RocketSimulator
+from sim_state import BOOL_FIELDS, STATE_FIELDS, STATE_SIZE
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pure-Python fallback: same kernels, just not compiled
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+EARTH_RADIUS = 6371000.0
+
+# Flat state vector shared by both kernels: the sims' snapshot layout (sim_state.STATE_FIELDS)
+(TIME, ALTITUDE, VELOCITY, ACCELERATION, THROTTLE, PITCH, DOWNRANGE, HVEL, FUEL, MASS,
+ DRAG_COEFF, PARACHUTE, DONE, LANDED, MAX_ALTITUDE) = range(len(STATE_FIELDS))
+
+PARAM_FIELDS = (
+    "dry_mass", "cross_section_area", "chute_drag_coeff", "thrust", "isp",
+    "min_throttle", "time_step", "parachute_altitude", "gravity",
+)
+(P_DRY_MASS, P_AREA, P_CHUTE_CD, P_THRUST, P_ISP, P_MIN_THROTTLE, P_TIME_STEP,
+ P_CHUTE_ALT, P_GRAVITY) = range(len(PARAM_FIELDS))
+
+# Column order of ai.flight_logger.LOG_COLUMNS
+LOG_INDEX = np.array([TIME, ALTITUDE, VELOCITY, ACCELERATION, FUEL, PITCH, THROTTLE, PARACHUTE, DOWNRANGE, HVEL])
+# Env observation: [altitude, velocity, acceleration, fuel_mass]
+OBS_INDEX = np.array([ALTITUDE, VELOCITY, ACCELERATION, FUEL])
+
+
+@njit(cache=True)
+def _lookup(grid, table, altitude):
+    h = min(max(altitude, grid[0]), grid[1])
+    x = (h - grid[0]) * grid[2]
+    idx = min(int(x), int(grid[3]))
+    s = x - idx
+    return table[idx] + s * (table[idx + 1] - table[idx])
+
+
+@njit(cache=True)
+def realistic_step(s, p, grid, density, wind, action):
+    """One RealisticRocketSim.step on the flat state ``s`` (in place)."""
+    if s[DONE] != 0.0:
+        return
+    throttle = min(max(action, p[P_MIN_THROTTLE]), 1.0)
+    s[THROTTLE] = throttle
+
+    altitude = s[ALTITUDE]
+    if altitude < 1000:
+        s[PITCH] = 90.0
+    elif altitude < 10000:
+        s[PITCH] = 90.0 - 45.0 * ((altitude - 1000) / 9000.0)
+    else:
+        s[PITCH] = 45.0
+
+    if s[PARACHUTE] == 0.0 and altitude <= p[P_CHUTE_ALT] and s[VELOCITY] < 0:
+        s[PARACHUTE] = 1.0
+        s[DRAG_COEFF] = p[P_CHUTE_CD]
+
+    g = 9.80665 * (EARTH_RADIUS / (EARTH_RADIUS + altitude)) ** 2
+    rho = _lookup(grid, density, altitude)
+    wind_speed = _lookup(grid, wind, altitude)
+    dt = p[P_TIME_STEP]
+
+    if s[FUEL] > 0:
+        flow_rate = p[P_THRUST] / (p[P_ISP] * g)
+        fuel_burn = flow_rate * dt * throttle
+        if fuel_burn > s[FUEL]:
+            fuel_burn = s[FUEL]
+            throttle = 0.0
+        s[FUEL] -= fuel_burn
+        mass = p[P_DRY_MASS] + s[FUEL]
+        thrust_force = p[P_THRUST] * throttle
+    else:
+        thrust_force = 0.0
+        mass = p[P_DRY_MASS]
+    s[MASS] = mass
+
+    pitch_rad = math.radians(s[PITCH])
+    thrust_vertical = thrust_force * math.sin(pitch_rad)
+    thrust_horizontal = thrust_force * math.cos(pitch_rad)
+
+    # Vertical
+    velocity = s[VELOCITY]
+    drag = 0.5 * rho * velocity ** 2 * s[DRAG_COEFF] * p[P_AREA]
+    drag *= -1 if velocity > 0 else 1
+    s[ACCELERATION] = (thrust_vertical - mass * g + drag) / mass
+    s[VELOCITY] = velocity + s[ACCELERATION] * dt
+    s[ALTITUDE] = altitude + s[VELOCITY] * dt
+
+    # Horizontal
+    relative_horizontal_velocity = s[HVEL] - wind_speed
+    drag_horizontal = 0.5 * rho * relative_horizontal_velocity ** 2 * s[DRAG_COEFF] * p[P_AREA]
+    drag_horizontal *= -1 if relative_horizontal_velocity > 0 else 1
+    horiz_acc = (thrust_horizontal + drag_horizontal) / mass
+    s[HVEL] += horiz_acc * dt
+    s[DOWNRANGE] += s[HVEL] * dt
+
+    s[TIME] += dt
+    s[MAX_ALTITUDE] = max(s[MAX_ALTITUDE], s[ALTITUDE])
+
+    if s[ALTITUDE] <= 0 and s[TIME] > 2:
+        s[ALTITUDE] = 0.0
+        s[VELOCITY] = 0.0
+        s[DONE] = 1.0
+        s[LANDED] = 1.0
+
+
+@njit(cache=True)
+def simple_step(s, p, grid, density, action):
+    """One RocketSimulator.update on the flat state ``s`` (in place)."""
+    if s[DONE] != 0.0:
+        return
+    s[THROTTLE] = max(p[P_MIN_THROTTLE], min(action, 1.0))
+
+    if s[PARACHUTE] == 0.0 and s[ALTITUDE] <= p[P_CHUTE_ALT] and s[VELOCITY] < 0:
+        s[PARACHUTE] = 1.0
+        s[DRAG_COEFF] = p[P_CHUTE_CD]
+
+    dt = p[P_TIME_STEP]
+    if s[FUEL] > 0:
+        flow_rate = p[P_THRUST] / (p[P_ISP] * p[P_GRAVITY])
+        fuel_burn = flow_rate * dt * s[THROTTLE]
+        if fuel_burn > s[FUEL]:
+            fuel_burn = s[FUEL]
+            s[THROTTLE] = 0.0
+        s[FUEL] -= fuel_burn
+        s[MASS] = p[P_DRY_MASS] + s[FUEL]
+        actual_thrust = p[P_THRUST] * s[THROTTLE]
+    else:
+        actual_thrust = 0.0
+        s[THROTTLE] = 0.0
+        s[MASS] = p[P_DRY_MASS]
+
+    velocity = s[VELOCITY]
+    rho = _lookup(grid, density, s[ALTITUDE])
+    drag_force = 0.5 * rho * velocity ** 2 * s[DRAG_COEFF] * p[P_AREA]
+    drag_force *= -1 if velocity > 0 else 1
+
+    net_force = actual_thrust - (s[MASS] * p[P_GRAVITY]) + drag_force
+    s[ACCELERATION] = net_force / s[MASS]
+    s[VELOCITY] = velocity + s[ACCELERATION] * dt
+    s[ALTITUDE] += s[VELOCITY] * dt
+    s[TIME] += dt
+
+    if s[ALTITUDE] > s[MAX_ALTITUDE]:
+        s[MAX_ALTITUDE] = s[ALTITUDE]
+
+    if s[ALTITUDE] <= 0 and s[TIME] > 2:
+        s[ALTITUDE] = 0.0
+        s[VELOCITY] = 0.0
+        s[ACCELERATION] = 0.0
+        s[DONE] = 1.0
+        s[LANDED] = 1.0
+
+
+def _state_property(index, cast):
+    def getter(self):
+        return cast(self.state[index])
+
+    def setter(self, value):
+        self.state[index] = value
+
+    return property(getter, setter)
+
+
+def _param_property(index):
+    def getter(self):
+        return float(self.params[index])
+
+    def setter(self, value):
+        self.params[index] = value
+
+    return property(getter, setter)
+
+
+class _FlatState:
+    """Mixin that stores the sim's dynamic fields and parameters in two float64 arrays.
+
+    Attribute access keeps working through properties, so the rest of the
+    scalar sim (reset, render, fly_adaptive, the envs) is unchanged; only
+    ``step`` hands the arrays to the kernel. The state array is already in
+    snapshot layout, so ``snapshot``/``restore`` are plain copies.
+    """
+
+    def _init_arrays(self):
+        self.state = np.zeros(STATE_SIZE)
+        self.params = np.zeros(len(PARAM_FIELDS))
+
+    def snapshot(self):
+        return self.state.copy()
+
+    def restore(self, state):
+        state = np.asarray(state, dtype=float)
+        if state.shape != (STATE_SIZE,):
+            raise ValueError(f"state vector has shape {state.shape}, expected ({STATE_SIZE},)")
+        self.state[:] = state
+
+    def observe(self, out):
+        out[:] = self.state[OBS_INDEX]
+        return out
+
+
+for _i, _name in enumerate(STATE_FIELDS):
+    setattr(_FlatState, _name, _state_property(_i, bool if _name in BOOL_FIELDS else float))
+for _i, _name in enumerate(PARAM_FIELDS):
+    setattr(_FlatState, _name, _param_property(_i))
+
+
+class KernelRealisticRocketSim(_FlatState, RealisticRocketSim):
+    """RealisticRocketSim whose ``step`` runs the compiled ``realistic_step`` kernel.
+
+    Falls back to the pure-Python ``step`` when the atmosphere model is not
+    a linear table.
+    """
+
+    def __init__(self, logger=None, atmosphere_model=None):
+        self._init_arrays()
+        super().__init__(logger=logger, atmosphere_model=atmosphere_model)
+
+    def advance(self, action):
+        if self.atmosphere.method != "linear":
+            return super().advance(action)
+        if self.state[DONE]:
+            return
+
+        profiling = self.profiler.enabled
+        timing = profiling or self.logger.enabled
+        if timing:
+            step_start = time.perf_counter()
+        grid, density, wind = self.atmosphere.linear_tables()
+        realistic_step(self.state, self.params, grid, density, wind, float(action[0]))
+        if timing:
+            log_start = time.perf_counter()
+        if self.logger.enabled:
+            self.logger.log(self.state[LOG_INDEX])
+        if self.state[DONE]:
+            self.logger.end_episode()
+        if timing:
+            step_end = time.perf_counter()
+            self.step_time += step_end - step_start
+            self.log_time += step_end - log_start
+            if profiling:
+                # The atmosphere lookup is fused into the kernel and counted as physics
+                self.profiler.add("physics", log_start - step_start)
+                self.profiler.add("logging", step_end - log_start)
+
+    def get_state(self):
+        s = self.state.tolist()
+        return {
+            "altitude": s[ALTITUDE],
+            "velocity": s[VELOCITY],
+            "acceleration": s[ACCELERATION],
+            "fuel_mass": s[FUEL],
+            "x": s[DOWNRANGE],
+            "vx": s[HVEL],
+            "pitch": s[PITCH]
+        }
+
+
+class KernelRocketSimulator(_FlatState, RocketSimulator):
+    """RocketSimulator whose ``update`` runs the compiled ``simple_step`` kernel."""
+
+    def __init__(self):
+        self._init_arrays()
+        super().__init__()
+
+    def update(self, throttle=None):
+        if throttle is None:
+            throttle = self.throttle
+        profiling = self.profiler.enabled
+        if profiling:
+            step_start = time.perf_counter()
+        grid, density, _ = self.atmosphere.linear_tables()
+        simple_step(self.state, self.params, grid, density, float(throttle))
+        if profiling:
+            # Atmosphere lookup included: it is fused into the kernel
+            self.profiler.add("physics", time.perf_counter() - step_start)
+
+    def get_state(self):
+        s = self.state.tolist()
+        return {
+            "altitude": s[ALTITUDE],
+            "velocity": s[VELOCITY],
+            "acceleration": s[ACCELERATION],
+            "fuel_mass": s[FUEL],
+        }
+
+
+def make_realistic_sim(logger=None, compiled=None):
+    """KernelRealisticRocketSim when Numba is installed (or ``compiled=True``), else RealisticRocketSim."""
+    if compiled is None:
+        compiled = NUMBA_AVAILABLE
+    return KernelRealisticRocketSim(logger=logger) if compiled else RealisticRocketSim(logger=logger)
+
+
+def make_rocket_simulator(compiled=None):
+    if compiled is None:
+        compiled = NUMBA_AVAILABLE
+    return KernelRocketSimulator() if compiled else RocketSimulator()
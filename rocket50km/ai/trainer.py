@@ -4,33 +4,12 @@ import numpy as np
 from stable_baselines3 import PPO
 from stable_baselines3.common.callbacks import EvalCallback, StopTrainingOnRewardThreshold
 from stable_baselines3.common.monitor import Monitor
-from stable_baselines3.common.vec_env import DummyVecEnv
+from stable_baselines3.common.vec_env import DummyVecEnv, VecNormalize
 from ai.rocket_env import RocketEnv
-import gymnasium as gym
-import gym as old_gym
+from ai.callbacks import ThroughputCallback
+from ai.vec_env import VEC_BACKENDS, GymToGymnasiumWrapper, make_vec_env
 
-# Custom wrapper to convert gym spaces to gymnasium spaces
-class GymToGymnasiumWrapper(gym.Wrapper):
-    def __init__(self, env):
-        super().__init__(env)
-        # Convert action space
-        if isinstance(self.action_space, old_gym.spaces.Box):
-            self.action_space = gym.spaces.Box(
-                low=self.action_space.low,
-                high=self.action_space.high,
-                shape=self.action_space.shape,
-                dtype=self.action_space.dtype
-            )
-        # Convert observation space
-        if isinstance(self.observation_space, old_gym.spaces.Box):
-            self.observation_space = gym.spaces.Box(
-                low=self.observation_space.low,
-                high=self.observation_space.high,
-                shape=self.observation_space.shape,
-                dtype=self.observation_space.dtype
-            )
-
-def train_ai():
+def train_ai(n_envs=1, vec_backend=None, normalize_obs=False):
     def make_env():
         def _init():
             env = RocketEnv()
@@ -38,11 +17,14 @@ def train_ai():
             return Monitor(env)
         return _init
 
-    # Create environment
-    env = DummyVecEnv([make_env()])
+    # Create environment (by default n_envs > 1 steps all rockets in one batched sim call)
+    vec_backend = vec_backend or ("batched" if n_envs > 1 else "dummy")
+    env = make_vec_env(n_envs, vec_backend, sim="simple", normalize_obs=normalize_obs)
 
-    # Evaluation environment
+    # Evaluation environment (EvalCallback copies the training obs statistics into it)
     eval_env = DummyVecEnv([make_env()])
+    if normalize_obs:
+        eval_env = VecNormalize(eval_env, training=False, norm_obs=True, norm_reward=False)
 
     # Callbacks for training
     stop_callback = StopTrainingOnRewardThreshold(reward_threshold=200, verbose=1)
@@ -51,7 +33,7 @@ def train_ai():
         callback_on_new_best=stop_callback,
         best_model_save_path="./best_model/",
         log_path="./logs/",
-        eval_freq=10000,
+        eval_freq=max(10000 // n_envs, 1),
         n_eval_episodes=5,
         deterministic=True
     )
@@ -79,13 +61,23 @@ def train_ai():
     )
 
     # Train the model
-    model.learn(total_timesteps=500_000, callback=eval_callback, progress_bar=True)
+    model.learn(total_timesteps=500_000, callback=[eval_callback, ThroughputCallback(verbose=1)], progress_bar=True)
 
     # Save model
     model.save("ai/rocket_policy_final")
+    if normalize_obs:
+        env.save("ai/vec_normalize.pkl")
     print("✅ Training complete and model saved!")
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n-envs", type=int, default=1, help="parallel rockets per rollout step")
+    parser.add_argument("--vec-backend", choices=VEC_BACKENDS, default=None,
+                        help="default: dummy for one env, batched for more")
+    parser.add_argument("--normalize-obs", action="store_true", help="shared VecNormalize observation statistics")
+    args = parser.parse_args()
+
     os.makedirs("best_model", exist_ok=True)
     os.makedirs("logs", exist_ok=True)
-    train_ai()
\ No newline at end of file
+    train_ai(n_envs=args.n_envs, vec_backend=args.vec_backend, normalize_obs=args.normalize_obs)
\ No newline at end of file
@@ -0,0 +1,181 @@
+import functools
+
+import gym as old_gym
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.monitor import Monitor
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv, VecEnv, VecMonitor, VecNormalize
+
+from ai.realistic_env import RealisticRocketEnv, rocket_cfg, engine_cfg, sim_cfg
+from ai.rocket_env import RocketEnv
+from ai.batch_sim import BatchRealisticRocketSim, BatchRocketSimulator
+from ai.flight_logger import NullFlightLogger
+
+VEC_BACKENDS = ("dummy", "subproc", "batched")
+
+
+class BatchRocketVecEnv(VecEnv):
+    """SB3 ``VecEnv`` that steps all N rockets with one batch sim call.
+
+    Observations, rewards and termination match ``RealisticRocketEnv`` /
+    ``RocketEnv``. Finished rockets are auto-reset in place; as with
+    ``DummyVecEnv`` the final observation is returned in
+    ``info["terminal_observation"]`` and time-limit truncation is flagged
+    with ``info["TimeLimit.truncated"]``. The raw per-step ``terminated`` and
+    ``truncated`` arrays are also kept as attributes.
+
+    Each ``step`` repeats the action for ``physics_steps`` sim steps and sums
+    the reward, freezing a rocket as soon as its episode ends.
+    """
+
+    sim_class = None
+
+    def __init__(self, n_envs, physics_steps=None):
+        self.sim = self.sim_class(n_envs)
+        self.render_mode = None
+        observation_space = spaces.Box(
+            low=np.array([0.0, -500.0, -100.0, 0.0], dtype=np.float32),
+            high=np.array([100000.0, 3000.0, 100.0, rocket_cfg["propellant_mass"]], dtype=np.float32),
+            dtype=np.float32
+        )
+        action_space = spaces.Box(
+            low=np.array([engine_cfg["min_throttle"]], dtype=np.float32),
+            high=np.array([1.0], dtype=np.float32),
+            dtype=np.float32
+        )
+        super().__init__(n_envs, observation_space, action_space)
+        self.time_step = self.sim.time_step
+        self.physics_steps = physics_steps or sim_cfg["physics_steps_per_rl_step"]
+        self.control_time_step = self.time_step * self.physics_steps
+        self.terminated = np.zeros(n_envs, dtype=bool)
+        self.truncated = np.zeros(n_envs, dtype=bool)
+        self._actions = None
+
+    def reset(self):
+        self.sim.reset()
+        self.terminated[:] = False
+        self.truncated[:] = False
+        return self._get_obs()
+
+    def step_async(self, actions):
+        self._actions = actions
+
+    def step_wait(self):
+        sim = self.sim
+        reward = np.zeros(self.num_envs)
+        running = np.ones(self.num_envs, dtype=bool)
+        for _ in range(self.physics_steps):
+            sim.step(self._actions, running)
+            reward += np.where(running, self._get_reward(), 0.0)
+            running &= ~sim.done & (sim.time < sim.max_sim_time)
+            if not running.any():
+                break
+        reward = reward.astype(np.float32)
+        obs = self._get_obs()
+        self.terminated = sim.done.copy()
+        self.truncated = sim.time >= sim.max_sim_time
+        dones = self.terminated | self.truncated
+
+        infos = [{} for _ in range(self.num_envs)]
+        if dones.any():
+            for i in np.flatnonzero(dones):
+                infos[i]["terminal_observation"] = obs[i].copy()
+                infos[i]["TimeLimit.truncated"] = bool(self.truncated[i] and not self.terminated[i])
+            sim.reset(dones)
+            obs[dones] = self._get_obs()[dones]
+        return obs, reward, dones, infos
+
+    def _get_obs(self):
+        sim = self.sim
+        return np.stack([sim.altitude, sim.velocity, sim.acceleration, sim.fuel_mass], axis=1).astype(np.float32)
+
+    def _get_reward(self):
+        sim = self.sim
+        reward = (sim.altitude / 1000.0) - (sim.fuel_mass * 0.01)
+        return np.where(sim.landed, 200.0, reward)
+
+    def close(self):
+        pass
+
+    def _indices(self, indices):
+        if indices is None:
+            return range(self.num_envs)
+        if isinstance(indices, int):
+            return [indices]
+        return indices
+
+    def get_attr(self, attr_name, indices=None):
+        return [getattr(self, attr_name) for _ in self._indices(indices)]
+
+    def set_attr(self, attr_name, value, indices=None):
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        method = getattr(self, method_name)
+        return [method(*method_args, **method_kwargs) for _ in self._indices(indices)]
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False for _ in self._indices(indices)]
+
+
+class RealisticRocketVecEnv(BatchRocketVecEnv):
+    sim_class = BatchRealisticRocketSim
+
+
+class RocketVecEnv(BatchRocketVecEnv):
+    sim_class = BatchRocketSimulator
+
+
+# Custom wrapper to convert gym spaces to gymnasium spaces
+class GymToGymnasiumWrapper(gym.Wrapper):
+    def __init__(self, env):
+        super().__init__(env)
+        # Convert action space
+        if isinstance(self.action_space, old_gym.spaces.Box):
+            self.action_space = gym.spaces.Box(
+                low=self.action_space.low,
+                high=self.action_space.high,
+                shape=self.action_space.shape,
+                dtype=self.action_space.dtype
+            )
+        # Convert observation space
+        if isinstance(self.observation_space, old_gym.spaces.Box):
+            self.observation_space = gym.spaces.Box(
+                low=self.observation_space.low,
+                high=self.observation_space.high,
+                shape=self.observation_space.shape,
+                dtype=self.observation_space.dtype
+            )
+
+
+def _make_env(sim, physics_steps):
+    # Module level so SubprocVecEnv can pickle it; no per-step CSV logging in training
+    if sim == "realistic":
+        env = RealisticRocketEnv(logger=NullFlightLogger(), physics_steps=physics_steps)
+    else:
+        env = RocketEnv(physics_steps=physics_steps)
+    return Monitor(GymToGymnasiumWrapper(env))
+
+
+def make_vec_env(n_envs, backend="batched", sim="realistic", physics_steps=None, normalize_obs=False):
+    """Training env with ``n_envs`` rockets.
+
+    ``dummy`` steps ``n_envs`` scalar envs in this process, ``subproc``
+    gives each its own worker process (one core each) and ``batched`` steps
+    them all in one vectorized sim call. With ``normalize_obs`` the result is
+    wrapped in one ``VecNormalize``: the running statistics live in this
+    process and are updated from every worker's observations, so all envs
+    are normalized identically.
+    """
+    if backend not in VEC_BACKENDS:
+        raise ValueError(f"Unknown vec backend: {backend} (choose from {', '.join(VEC_BACKENDS)})")
+    if backend == "batched":
+        vec_class = RealisticRocketVecEnv if sim == "realistic" else RocketVecEnv
+        env = VecMonitor(vec_class(n_envs, physics_steps))
+    else:
+        factory = functools.partial(_make_env, sim, physics_steps)
+        env = (DummyVecEnv if backend == "dummy" else SubprocVecEnv)([factory] * n_envs)
+    if normalize_obs:
+        env = VecNormalize(env, norm_obs=True, norm_reward=False)
+    return env
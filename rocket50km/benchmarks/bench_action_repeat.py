@@ -0,0 +1,41 @@
+# benchmarks/bench_action_repeat.py
+# Run from rocket50km/:  python -m benchmarks.bench_action_repeat
+
+import argparse
+import time
+
+from stable_baselines3 import PPO
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from ai.realistic_env import sim_cfg
+from ai.rocket_env import RocketEnv
+from ai.trainer import GymToGymnasiumWrapper
+
+
+def train_wall_time(physics_steps, sim_steps, n_steps=512):
+    """Wall-clock to train PPO on ``sim_steps`` physics steps of RocketEnv."""
+    env = DummyVecEnv([lambda: GymToGymnasiumWrapper(RocketEnv(physics_steps=physics_steps))])
+    model = PPO("MlpPolicy", env, n_steps=n_steps, batch_size=64, n_epochs=4, seed=0, verbose=0, device="cpu")
+    start = time.perf_counter()
+    model.learn(total_timesteps=sim_steps // physics_steps)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PPO training wall-clock with and without action repeat")
+    parser.add_argument("--sim-steps", type=int, default=40960, help="physics steps of experience per run")
+    args = parser.parse_args()
+
+    repeat = sim_cfg["physics_steps_per_rl_step"]
+    sim_seconds = args.sim_steps * sim_cfg["time_step"]
+    baseline = train_wall_time(1, args.sim_steps)
+    repeated = train_wall_time(repeat, args.sim_steps)
+    for k, wall in ((1, baseline), (repeat, repeated)):
+        print(f"physics_steps={k:3d} | {args.sim_steps // k:6d} policy steps | {wall:7.2f} s | "
+              f"{sim_seconds / wall:8.0f} sim-s per wall-s")
+    print(f"Action repeat x{repeat}: {baseline / repeated:.1f}x less training wall-clock "
+          f"for {sim_seconds:.0f} s of simulated flight")
+
+
+if __name__ == "__main__":
+    main()
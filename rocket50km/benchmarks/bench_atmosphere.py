@@ -0,0 +1,72 @@
+# benchmarks/bench_atmosphere.py
+# Run from rocket50km/:  python -m benchmarks.bench_atmosphere
+
+import math
+import time
+
+import numpy as np
+
+from physics import EXPONENTIAL_ATMOSPHERE
+from rocket import Rocket
+
+# Documented next to EXPONENTIAL_ATMOSPHERE in physics.py
+MAX_RELATIVE_ERROR = 1.1e-5  # below the 150 km table top
+MAX_ABSOLUTE_ERROR = 2.7e-8  # kg/m^3, above it (clamped)
+
+
+def analytic_density(altitude):
+    return 1.225 * math.exp(-altitude / 8500)
+
+
+class AnalyticAtmosphere:
+    """The formula Rocket and main.py used before the table, behind the AtmosphereModel interface."""
+
+    @staticmethod
+    def density(altitude):
+        return analytic_density(altitude)
+
+
+def rocket_apogee(atmosphere, dt=0.1):
+    rocket = Rocket()
+    rocket.atmosphere = atmosphere
+    rocket.throttle = 1.0
+    apogee = 0.0
+    while not (rocket.altitude <= 0 and rocket.time > 3):
+        rocket.update(dt)
+        apogee = max(apogee, rocket.altitude)
+    return apogee
+
+
+def per_call_ns(fn, altitudes):
+    start = time.perf_counter()
+    for h in altitudes:
+        fn(h)
+    return (time.perf_counter() - start) / len(altitudes) * 1e9
+
+
+def main():
+    # Off-grid altitudes: the error peaks between table points
+    altitudes = np.arange(0.0, 250000.0, 1.0) + 0.37
+    table = EXPONENTIAL_ATMOSPHERE.density(altitudes)
+    exact = 1.225 * np.exp(-altitudes / 8500)
+    inside = altitudes <= EXPONENTIAL_ATMOSPHERE.top
+
+    relative = np.max(np.abs(table[inside] / exact[inside] - 1))
+    absolute = np.max(np.abs(table[~inside] - exact[~inside]))
+    print(f"table vs 1.225*exp(-h/8500): max relative error {relative:.2e} below "
+          f"{EXPONENTIAL_ATMOSPHERE.top / 1000:.0f} km, max absolute error {absolute:.2e} kg/m^3 above")
+    assert relative <= MAX_RELATIVE_ERROR, f"relative error {relative:.2e} exceeds {MAX_RELATIVE_ERROR:.1e}"
+    assert absolute <= MAX_ABSOLUTE_ERROR, f"absolute error {absolute:.2e} exceeds {MAX_ABSOLUTE_ERROR:.1e}"
+
+    table_apogee = rocket_apogee(EXPONENTIAL_ATMOSPHERE)
+    exact_apogee = rocket_apogee(AnalyticAtmosphere)
+    print(f"Rocket apogee: table {table_apogee:.3f} m, analytic {exact_apogee:.3f} m "
+          f"(diff {table_apogee - exact_apogee:+.2e} m)")
+
+    samples = altitudes[::25].tolist()
+    print(f"scalar lookup: table {per_call_ns(EXPONENTIAL_ATMOSPHERE.density, samples):.0f} ns, "
+          f"analytic {per_call_ns(analytic_density, samples):.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
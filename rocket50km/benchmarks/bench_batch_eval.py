@@ -0,0 +1,56 @@
+# benchmarks/bench_batch_eval.py
+# Run from rocket50km/:  python -m benchmarks.bench_batch_eval
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from ai.batch_eval import load_policy, rollout
+from ai.realistic_env import RealisticRocketEnv
+from ai.flight_logger import NullFlightLogger
+from dispersion import SPEC_PATH
+
+
+def single_env_episode(policy):
+    """The eval_policy.py / run_trained_agent.py loop: one observation per ``predict``."""
+    env = RealisticRocketEnv(logger=NullFlightLogger())
+    obs, _ = env.reset()
+    total, done = 0.0, False
+    while not done:
+        action, _ = policy.predict(obs, deterministic=True)
+        obs, reward, terminated, truncated, _ = env.step(action)
+        total += reward
+        done = terminated or truncated
+    return total, env.rocket.max_altitude
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched policy rollouts vs the one-flight loop")
+    parser.add_argument("--policy", default="best_model/best_model")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 64, 256, 1024])
+    args = parser.parse_args()
+
+    policy = load_policy(args.policy)
+    with open(SPEC_PATH) as f:
+        spec = json.load(f)
+
+    start = time.perf_counter()
+    ret, apogee = single_env_episode(policy)
+    single = time.perf_counter() - start
+    batch = rollout(policy, 1)
+    assert np.isclose(batch["return"][0], ret, rtol=1e-9) and np.isclose(batch["apogee"][0], apogee, rtol=1e-9), \
+        f"batched rollout differs: return {batch['return'][0]} vs {ret}, apogee {batch['apogee'][0]} vs {apogee}"
+    print(f"✅ parity with RealisticRocketEnv: return {ret:.2f}, apogee {apogee:.1f} m")
+    print(f"single-env loop:       {1 / single:8.1f} episodes/s")
+
+    for n in args.sizes:
+        start = time.perf_counter()
+        rollout(policy, n, spec=spec)
+        elapsed = time.perf_counter() - start
+        print(f"batched, N = {n:5d}:    {n / elapsed:8.1f} episodes/s ({single * n / elapsed:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/bench_batch_sim.py
+# Run from rocket50km/:  python -m benchmarks.bench_batch_sim --n 10000
+
+import argparse
+import time
+
+import numpy as np
+
+from ai.realistic_env import RealisticRocketSim
+from ai.flight_logger import NullFlightLogger
+from ai.batch_sim import BatchRealisticRocketSim
+
+
+def run_scalar(throttle):
+    sim = RealisticRocketSim(logger=NullFlightLogger())
+    traj = []
+    while not sim.done and sim.time < sim.max_sim_time:
+        sim.step([throttle])
+        traj.append((sim.altitude, sim.velocity, sim.downrange, sim.fuel_mass))
+    return np.array(traj)
+
+
+def check_parity(throttles, rtol=1e-6, atol=1e-6):
+    """Compare batch trajectories to the scalar sim step by step."""
+    batch = BatchRealisticRocketSim(len(throttles))
+    scalar = [run_scalar(t) for t in throttles]
+    n_steps = max(len(t) for t in scalar)
+
+    worst = 0.0
+    for k in range(n_steps):
+        batch.step(throttles)
+        got = np.stack([batch.altitude, batch.velocity, batch.downrange, batch.fuel_mass], axis=1)
+        for i, traj in enumerate(scalar):
+            expected = traj[min(k, len(traj) - 1)]
+            if not np.allclose(got[i], expected, rtol=rtol, atol=atol):
+                raise AssertionError(f"Rocket {i} diverged at step {k}: {got[i]} vs {expected}")
+            worst = max(worst, float(np.max(np.abs(got[i] - expected))))
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scalar vs batch RealisticRocketSim throughput")
+    parser.add_argument("--n", type=int, default=10000, help="rockets in the batch run")
+    parser.add_argument("--scalar-flights", type=int, default=5, help="scalar flights to time")
+    args = parser.parse_args()
+
+    worst = check_parity(np.array([0.3, 0.55, 0.8, 1.0]))
+    print(f"✅ Parity OK (max abs deviation {worst:.3e})")
+
+    start = time.perf_counter()
+    for _ in range(args.scalar_flights):
+        run_scalar(1.0)
+    scalar_per_flight = (time.perf_counter() - start) / args.scalar_flights
+
+    rng = np.random.default_rng(0)
+    batch = BatchRealisticRocketSim(args.n)
+    throttles = rng.uniform(batch.min_throttle, 1.0, args.n)
+    start = time.perf_counter()
+    batch.run(throttles)
+    batch_total = time.perf_counter() - start
+
+    print(f"Scalar: {scalar_per_flight * 1e3:9.2f} ms/flight")
+    print(f"Batch:  {batch_total / args.n * 1e3:9.4f} ms/flight ({args.n} flights in {batch_total:.2f} s)")
+    print(f"Speedup: {scalar_per_flight * args.n / batch_total:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
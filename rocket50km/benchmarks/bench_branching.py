@@ -0,0 +1,85 @@
+# benchmarks/bench_branching.py
+# Run from rocket50km/:  python -m benchmarks.bench_branching
+
+import argparse
+import time
+
+import numpy as np
+
+from ai.batch_sim import BatchRealisticRocketSim
+from ai.flight_logger import NullFlightLogger
+from ai.realistic_env import RealisticRocketSim
+from sim_state import STATE_FIELDS
+
+
+def fly(sim, throttle, until=None):
+    while not sim.done and sim.time < sim.max_sim_time and (until is None or sim.time < until):
+        sim.advance((throttle,))
+
+
+def replay(throttles, fork_time):
+    """The old way: every continuation re-flies the prefix from reset()."""
+    results = []
+    for throttle in throttles:
+        sim = RealisticRocketSim(logger=NullFlightLogger())
+        fly(sim, 1.0, until=fork_time)
+        fly(sim, throttle)
+        results.append(sim.snapshot())
+    return np.array(results)
+
+
+def restore(throttles, snapshot):
+    sim = RealisticRocketSim(logger=NullFlightLogger())
+    results = []
+    for throttle in throttles:
+        sim.restore(snapshot)
+        fly(sim, throttle)
+        results.append(sim.snapshot())
+    return np.array(results)
+
+
+def branch(throttles, snapshot):
+    sim = BatchRealisticRocketSim.branch(snapshot, len(throttles))
+    sim.run(throttles)
+    return sim.snapshot()
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="What-if continuations: replay from reset vs snapshot/restore vs batch branch")
+    parser.add_argument("--k", type=int, default=256, help="continuations")
+    parser.add_argument("--fork-time", type=float, default=5.0, help="sim time of the fork (s); the burn ends near T+13 s")
+    args = parser.parse_args()
+
+    throttles = np.linspace(0.4, 1.0, args.k)
+    sim = RealisticRocketSim(logger=NullFlightLogger())
+    fly(sim, 1.0, until=args.fork_time)
+    snapshot = sim.snapshot()
+
+    start = time.perf_counter()
+    for _ in range(10000):
+        sim.restore(snapshot)
+    restore_us = (time.perf_counter() - start) / 10000 * 1e6
+    print(f"state vector: {snapshot.size} float64 ({snapshot.nbytes} B), restore {restore_us:.1f} us")
+
+    n_replay = min(args.k, 32)
+    replayed, replay_s = timed(replay, throttles[:n_replay], args.fork_time)
+    restored, restore_s = timed(restore, throttles, snapshot)
+    branched, branch_s = timed(branch, throttles, snapshot)
+    assert np.array_equal(replayed, restored[:n_replay]) and np.array_equal(restored, branched)
+
+    replay_s *= args.k / n_replay
+    apogee = branched[:, STATE_FIELDS.index("max_altitude")]
+    print(f"{args.k} continuations from T+{args.fork_time:g} s, apogee {apogee.min():.0f}-{apogee.max():.0f} m (identical in all modes)")
+    print(f"  replay from reset:  {replay_s:8.3f} s{' (extrapolated)' if n_replay < args.k else ''}")
+    print(f"  restore + scalar:   {restore_s:8.3f} s ({replay_s / restore_s:.1f}x)")
+    print(f"  batch branch:       {branch_s:8.3f} s ({replay_s / branch_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# benchmarks/bench_dispersion.py
+# Run from rocket50km/:  python -m benchmarks.bench_dispersion
+
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from dispersion import SPEC_PATH, load_results, run_dispersion
+
+
+def main(n_trials=8192, batch_size=1024):
+    with open(SPEC_PATH) as f:
+        spec = json.load(f)
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, cores // 2, cores} - {0})
+
+    reference = None
+    base_rate = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in worker_counts:
+            out_dir = os.path.join(tmp, f"w{workers}")
+            summary = run_dispersion(spec, n_trials, out_dir, seed=42, batch_size=batch_size, workers=workers)
+            columns = {name: np.array(values) for name, values in load_results(out_dir).items()}
+
+            # Same seed and batch size must give identical trials on any worker count
+            if reference is None:
+                reference = columns
+            elif any(not np.array_equal(columns[k], reference[k]) for k in reference):
+                raise AssertionError(f"{workers} workers: results differ from the 1-worker run")
+
+            rate = summary["trials_per_sec"]
+            base_rate = base_rate or rate
+            print(f"workers {workers:3d} | {summary['wall_time']:7.2f} s | {rate:9.0f} trials/s | "
+                  f"speedup {rate / base_rate:5.2f}x | efficiency {rate / base_rate / workers:5.1%}")
+
+    apogee = summary["outputs"]["apogee"]
+    print(f"apogee p5/p50/p95: {apogee['p5']:.0f} / {apogee['p50']:.0f} / {apogee['p95']:.0f} m "
+          f"(reproducible across {worker_counts} workers)")
+
+
+if __name__ == "__main__":
+    main()
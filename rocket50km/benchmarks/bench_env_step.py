@@ -0,0 +1,72 @@
+# benchmarks/bench_env_step.py
+# Run from rocket50km/:  python -m benchmarks.bench_env_step
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from ai.flight_logger import NullFlightLogger
+from ai.realistic_env import RealisticRocketEnv
+from ai.rocket_env import RocketEnv
+
+
+def legacy_obs(rocket):
+    s = rocket.get_state()
+    return np.array([s["altitude"], s["velocity"], s["acceleration"], s["fuel_mass"]], dtype=np.float32)
+
+
+def ns_per_call(fn, n=200000):
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e9
+
+
+def run_steps(env, action, n_steps):
+    for _ in range(n_steps):
+        _, _, terminated, truncated, _ = env.step(action)
+        if terminated or truncated:
+            env.reset()
+
+
+def step_cost(env, n_steps=2000):
+    """ns per env.step, then the traced peak heap use over the same loop."""
+    action = np.array([0.8], dtype=np.float32)
+    env.reset()
+    start = time.perf_counter()
+    run_steps(env, action, n_steps)
+    elapsed = time.perf_counter() - start
+
+    env.reset()
+    tracemalloc.start()
+    run_steps(env, action, n_steps)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed / n_steps * 1e9, peak
+
+
+def main():
+    cases = {
+        "RocketEnv": RocketEnv(),
+        "RocketEnv compiled": RocketEnv(compiled=True),
+        "RealisticRocketEnv": RealisticRocketEnv(logger=NullFlightLogger()),
+        "Realistic compiled": RealisticRocketEnv(logger=NullFlightLogger(), compiled=True),
+    }
+    buf = np.empty(4, dtype=np.float32)
+    for name, env in cases.items():
+        env.reset()
+        env.step([0.8])
+        rocket = env.rocket
+        assert np.array_equal(rocket.observe(buf), legacy_obs(rocket)), name
+
+        legacy_ns = ns_per_call(lambda: legacy_obs(rocket))
+        observe_ns = ns_per_call(lambda: rocket.observe(buf))
+        step_ns, peak = step_cost(env)
+        print(f"{name:20s} obs: dict+array {legacy_ns:6.0f} ns | observe(buf) {observe_ns:6.0f} ns "
+              f"({legacy_ns / observe_ns:.1f}x) | env.step {step_ns:8.0f} ns "
+              f"({env.physics_steps} physics steps) | peak traced heap {peak} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_feasibility.py
+# Run from rocket50km/:  python -m benchmarks.bench_feasibility
+
+import argparse
+import time
+
+import numpy as np
+
+from launch_feasibility.model import predict as feasibility
+
+
+def random_inputs(n, seed=0):
+    rng = np.random.default_rng(seed)
+    values = rng.uniform(feasibility.range_min, feasibility.range_max, size=(n, 10))
+    return [dict(zip(feasibility.ARG_FEATURES, row)) for row in values]
+
+
+def legacy_sequence(v):
+    """The original row-by-row 10-step construction."""
+    x = np.zeros((feasibility.timesteps, feasibility.features))
+    for i, t in enumerate(feasibility.time_axis):
+        s = np.sin(2 * np.pi * t + feasibility.trend_phase)
+        x[i, :10] = v + feasibility.trend_amplitude * s
+        x[i, 10] = x[i, 0] * x[i, 1]
+    return x
+
+
+def legacy_scores(values):
+    """The original per-input loop: 10 separate ``model.predict`` calls each."""
+    scores = []
+    for v in values:
+        x = feasibility.scaler.transform(legacy_sequence(v)).reshape(1, feasibility.timesteps, feasibility.features)
+        predictions = [feasibility.model.predict(x, verbose=0)[0][0] for _ in range(feasibility.mc_samples)]
+        scores.append(np.mean(predictions))
+    return np.array(scores)
+
+
+def batched_scores(values):
+    x = feasibility.build_input_sequences(values)
+    scaled = feasibility.scaler.transform(x.reshape(-1, feasibility.features)).reshape(x.shape)
+    return feasibility.mc_dropout_predict(scaled)[0]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Feasibility scoring: per-input loop vs batched MC dropout")
+    parser.add_argument("--n", type=int, default=1000, help="condition sets in the batched run")
+    parser.add_argument("--legacy-n", type=int, default=20, help="condition sets in the (slow) legacy run")
+    args = parser.parse_args()
+
+    inputs = random_inputs(args.n)
+    values = np.array([[item[k] for k in feasibility.ARG_FEATURES] for item in inputs])
+    batched_scores(values[:2])  # build the graph outside the timings
+
+    assert np.allclose(feasibility.build_input_sequences(values[:50]),
+                       [legacy_sequence(v) for v in values[:50]], rtol=0, atol=1e-12)
+
+    legacy = timed(legacy_scores, values[:args.legacy_n]) / args.legacy_n
+    single = timed(batched_scores, values[:1])
+    batch = timed(batched_scores, values) / args.n
+    print(f"inference, {feasibility.mc_samples} MC samples/input")
+    print(f"  legacy loop (10x model.predict): {legacy * 1e3:9.2f} ms/input")
+    print(f"  one batched pass, 1 input:       {single * 1e3:9.2f} ms/input ({legacy / single:.0f}x)")
+    print(f"  one batched pass, {args.n} inputs: {batch * 1e3:9.3f} ms/input ({legacy / batch:.0f}x)")
+
+    seq_legacy = timed(lambda: [legacy_sequence(v) for v in values]) / args.n
+    seq_vector = timed(feasibility.build_input_sequences, values) / args.n
+    print(f"input construction: loop {seq_legacy * 1e6:.1f} us/input | vectorized {seq_vector * 1e6:.2f} us/input")
+
+    no_plot = timed(feasibility.predict_launch_feasibility_batch, inputs) / args.n
+    plot_cold = timed(lambda: feasibility.predict_launch_feasibility_batch(inputs[:50], plot=True)) / 50
+    plot_cached = timed(lambda: feasibility.predict_launch_feasibility_batch(inputs[:50], plot=True)) / 50
+    print(f"predict_launch_feasibility_batch end to end: no plot {no_plot * 1e3:.3f} ms/input | "
+          f"plot {plot_cold * 1e3:.2f} ms/input | cached plot {plot_cached * 1e3:.3f} ms/input")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# benchmarks/bench_flight_logger.py
+# Run from rocket50km/:  python -m benchmarks.bench_flight_logger
+
+import argparse
+import tempfile
+import time
+
+from ai.realistic_env import RealisticRocketSim
+from ai.flight_logger import NullFlightLogger, BufferedFlightLogger
+
+
+def fly(sim, episodes):
+    start = time.perf_counter()
+    for _ in range(episodes):
+        sim.reset()
+        while not sim.done and sim.time < sim.max_sim_time:
+            sim.step([0.8])
+    sim.logger.flush()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flight logging overhead per logger type")
+    parser.add_argument("--episodes", type=int, default=5)
+    args = parser.parse_args()
+
+    log_dir = tempfile.mkdtemp()
+    loggers = {
+        "null": NullFlightLogger(),
+        "buffered": BufferedFlightLogger(f"{log_dir}/flight_log.csv"),
+        "per-episode": BufferedFlightLogger.per_episode(log_dir, env_id=0),
+    }
+    null_wall = None
+    for name, logger in loggers.items():
+        sim = RealisticRocketSim(logger=logger)
+        wall = fly(sim, args.episodes)
+        null_wall = wall if null_wall is None else null_wall
+        # Two views of the same cost: extra wall time over the null logger, and
+        # the logging share of advance() measured inside the sim
+        print(f"{name:12s} {wall / args.episodes * 1e3:8.2f} ms/episode | "
+              f"+{(wall - null_wall) / null_wall * 100:5.1f}% wall vs null | "
+              f"logging {sim.logging_overhead() * 100:5.1f}% of advance time | "
+              f"{logger.rows_written} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_import.py
+# Run from rocket50km/:  python -m benchmarks.bench_import
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+CASES = {
+    "python -c pass": "pass",
+    "import predict": "import launch_feasibility.model.predict",
+    "import prelaunch_check": "import launch_feasibility.prelaunch_check",
+    "import ai.eval_policy": "import ai.eval_policy",
+    "rejected input": (
+        "import sys, json\n"
+        "from launch_feasibility.model.predict import predict_launch_feasibility\n"
+        "d = json.load(open(sys.argv[1])); d['wind'] = 80\n"
+        "assert isinstance(predict_launch_feasibility(**d), str)\n"
+        "assert 'tensorflow' not in sys.modules, 'validation error path loaded TensorFlow'"
+    ),
+    "first prediction": (
+        "import sys, json\n"
+        "from launch_feasibility.model.predict import predict_launch_feasibility\n"
+        "assert isinstance(predict_launch_feasibility(**json.load(open(sys.argv[1]))), dict)"
+    ),
+}
+
+
+def cold_start(code, cwd, repeats):
+    """Best-of-``repeats`` wall time of a fresh interpreter running ``code``."""
+    env = {**os.environ, "PYTHONPATH": ROOT, "TF_CPP_MIN_LOG_LEVEL": "3"}
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code, os.path.join(ROOT, "launch_input.json")],
+                       cwd=cwd, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start time of the feasibility entry points")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    # Run from an unrelated directory: artifact paths must not depend on cwd
+    with tempfile.TemporaryDirectory() as cwd:
+        for name, code in CASES.items():
+            print(f"{name:24s} {cold_start(code, cwd, args.repeats) * 1e3:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/bench_integrator.py
+# Run from rocket50km/:  python -m benchmarks.bench_integrator
+
+import time
+
+from ai.flight_logger import NullFlightLogger
+from ai.realistic_env import RealisticRocketSim
+from ai.rocket_env import RocketSimulator
+
+
+def euler_flight(make_sim, dt, throttle):
+    """Fixed-step flight; event times are only known to within one step."""
+    sim = make_sim()
+    sim.time_step = dt
+    events = {}
+    steps = 0
+    fuel_before, velocity_before = sim.fuel_mass, sim.velocity
+    while not sim.done and sim.time < sim.max_sim_time:
+        sim.step([throttle])
+        steps += 1
+        if fuel_before > 0 >= sim.fuel_mass:
+            events.setdefault("meco", sim.time)
+        if velocity_before > 0 >= sim.velocity:
+            events.setdefault("apogee", sim.time)
+        if sim.parachute_deployed:
+            events.setdefault("parachute", sim.time)
+        fuel_before, velocity_before = sim.fuel_mass, sim.velocity
+    if sim.landed:
+        events["touchdown"] = sim.time
+    return events, sim.max_altitude, steps
+
+
+def adaptive_flight(make_sim, rtol, throttle):
+    sim = make_sim()
+    result = sim.fly_adaptive(throttle, rtol=rtol, atol=rtol * 1e3)
+    return result["events"], sim.max_altitude, result["n_rhs"]
+
+
+def report(name, make_sim, throttle=1.0):
+    ref_events, ref_apogee, _ = adaptive_flight(make_sim, 1e-10, throttle)
+    print(f"\n{name}: reference apogee {ref_apogee:.2f} m, events "
+          + ", ".join(f"{k}={v:.3f}s" for k, v in ref_events.items()))
+    print(f"{'mode':18s} {'RHS evals':>10s} {'apogee err (m)':>15s} {'max event err (s)':>18s} {'wall (ms)':>10s}")
+
+    runs = [(f"euler dt={dt}", lambda dt=dt: euler_flight(make_sim, dt, throttle)) for dt in (0.05, 0.01)]
+    runs += [(f"rk45 rtol={rtol:g}", lambda rtol=rtol: adaptive_flight(make_sim, rtol, throttle))
+             for rtol in (1e-4, 1e-6, 1e-8)]
+    for label, run in runs:
+        start = time.perf_counter()
+        events, apogee, n_rhs = run()
+        wall = (time.perf_counter() - start) * 1e3
+        event_err = max(abs(events[k] - v) for k, v in ref_events.items() if k in events)
+        print(f"{label:18s} {n_rhs:10d} {abs(apogee - ref_apogee):15.4f} {event_err:18.4f} {wall:10.1f}")
+
+
+def main():
+    report("RocketSimulator", RocketSimulator)
+    report("RealisticRocketSim", lambda: RealisticRocketSim(logger=NullFlightLogger()))
+
+
+if __name__ == "__main__":
+    main()
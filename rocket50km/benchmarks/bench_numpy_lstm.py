@@ -0,0 +1,73 @@
+# benchmarks/bench_numpy_lstm.py
+# Run from rocket50km/:  python -m benchmarks.bench_numpy_lstm
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Parity: the NumPy engine must reproduce the Keras forward pass
+PARITY_ATOL = 1e-5
+
+# Runs in a fresh interpreter per backend so RSS and cold start are not shared
+PROBE = r"""
+import json, resource, sys, time
+start = time.perf_counter()
+import numpy as np
+from launch_feasibility.model import predict as feasibility
+from benchmarks.bench_feasibility import random_inputs
+
+inputs = random_inputs(1000)
+values = np.array([[item[k] for k in feasibility.ARG_FEATURES] for item in inputs])
+x = feasibility.build_input_sequences(values)
+scaled = feasibility.load_artifacts()["scaler"].transform(x.reshape(-1, feasibility.features)).reshape(x.shape)
+feasibility.mc_dropout_predict(scaled[:1])
+cold = time.perf_counter() - start
+
+def timed(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+deterministic = np.asarray(feasibility.load_artifacts()["model"](scaled.astype(np.float32), training=False))[:, 0]
+print(json.dumps({
+    "backend": feasibility.load_artifacts()["backend"],
+    "tensorflow_imported": "tensorflow" in sys.modules,
+    "cold_start_s": cold,
+    "single_ms": timed(lambda: feasibility.mc_dropout_predict(scaled[:1]), 20) * 1e3,
+    "batch_1000_ms": timed(lambda: feasibility.mc_dropout_predict(scaled), 3) * 1e3,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "scores": deterministic.tolist(),
+}))
+"""
+
+
+def probe(backend):
+    env = {**os.environ, "FEASIBILITY_BACKEND": backend, "PYTHONPATH": ROOT, "TF_CPP_MIN_LOG_LEVEL": "3"}
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    import numpy as np
+
+    results = {backend: probe(backend) for backend in ("keras", "numpy")}
+    worst = np.max(np.abs(np.array(results["keras"]["scores"]) - np.array(results["numpy"]["scores"])))
+    if worst > PARITY_ATOL:
+        raise AssertionError(f"NumPy engine differs from Keras by {worst:.2e} (> {PARITY_ATOL:g})")
+    print(f"✅ parity on 1000 inputs: max |keras - numpy| = {worst:.2e}")
+    assert not results["numpy"]["tensorflow_imported"], "numpy backend imported TensorFlow"
+
+    for backend, r in results.items():
+        print(f"{backend:6s} | cold start {r['cold_start_s']:6.2f} s | 1 input x10 MC {r['single_ms']:7.2f} ms | "
+              f"1000 inputs x10 MC {r['batch_1000_ms']:8.1f} ms | max RSS {r['max_rss_mb']:6.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
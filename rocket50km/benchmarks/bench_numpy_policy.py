@@ -0,0 +1,83 @@
+# benchmarks/bench_numpy_policy.py
+# Run from rocket50km/:  python -m benchmarks.bench_numpy_policy
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from ai.export_policy import DEFAULT_POLICY, export, load_vec_normalize
+from controller import NumpyPolicyController
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Parity: the NumPy actor must give PPO.predict(deterministic=True)'s action
+PARITY_ATOL = 1e-5
+
+# Fresh interpreter: building and calling the controller must not pull in torch
+NO_TORCH_PROBE = r"""
+import sys
+from controller import NumpyPolicyController
+NumpyPolicyController().decide_throttle([1000.0, 100.0, 5.0, 800.0])
+print("torch" in sys.modules, "stable_baselines3" in sys.modules)
+"""
+
+
+def random_obs(space, n, seed=0, bound=1e4):
+    # Unbounded dimensions (the legacy 3-obs policy) are drawn from +-bound
+    low, high = np.clip(space.low, -bound, bound), np.clip(space.high, -bound, bound)
+    return np.random.default_rng(seed).uniform(low, high, size=(n, *space.shape)).astype(np.float32)
+
+
+def per_call_us(fn, obs, repeats):
+    start = time.perf_counter()
+    for i in range(repeats):
+        fn(obs[i % len(obs)])
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def main():
+    from stable_baselines3 import PPO
+
+    parser = argparse.ArgumentParser(description="NumPy policy controller: parity and latency vs PPO.predict")
+    parser.add_argument("--policy", default=DEFAULT_POLICY)
+    parser.add_argument("--vec-normalize", default=None)
+    parser.add_argument("--n", type=int, default=10000, help="observations in the parity check")
+    args = parser.parse_args()
+
+    model = PPO.load(args.policy, device="cpu")
+    vec_normalize = load_vec_normalize(args.vec_normalize) if args.vec_normalize else None
+    with tempfile.TemporaryDirectory() as tmp:
+        controller = NumpyPolicyController(export(model, os.path.join(tmp, "actor.npz"), vec_normalize))
+
+    obs = random_obs(model.observation_space, args.n)
+    reference, _ = model.predict(vec_normalize.normalize_obs(obs) if vec_normalize else obs, deterministic=True)
+    batched, _ = controller.predict(obs)
+    single = np.array([controller.decide_throttle(o) for o in obs[:1000]])
+    worst = max(np.max(np.abs(batched - reference)), np.max(np.abs(single - reference[:1000, 0])))
+    if worst > PARITY_ATOL:
+        raise AssertionError(f"NumPy actor differs from PPO.predict by {worst:.2e} (> {PARITY_ATOL:g})")
+    print(f"✅ parity on {args.n} observations: max |PPO.predict - numpy| = {worst:.2e}")
+
+    flags = subprocess.run([sys.executable, "-c", NO_TORCH_PROBE], cwd=ROOT, check=True,
+                           capture_output=True, text=True, env={**os.environ, "PYTHONPATH": ROOT}).stdout.split()
+    assert flags == ["False", "False"], f"controller imported torch / stable_baselines3: {flags}"
+    print("✅ controller runs without importing torch or stable_baselines3")
+
+    sb3_obs = vec_normalize.normalize_obs(obs) if vec_normalize else obs
+    ppo = per_call_us(lambda o: model.predict(o, deterministic=True), sb3_obs, 2000)
+    numpy_single = per_call_us(controller.decide_throttle, obs, 20000)
+    start = time.perf_counter()
+    controller.predict(obs)
+    numpy_batch = (time.perf_counter() - start) / args.n * 1e6
+    print(f"PPO.predict, 1 obs:               {ppo:8.1f} us/call")
+    print(f"decide_throttle, 1 obs:           {numpy_single:8.2f} us/call ({ppo / numpy_single:.0f}x)")
+    print(f"NumpyPolicyController.predict, {args.n} obs: {numpy_batch:8.3f} us/obs")
+
+
+if __name__ == "__main__":
+    main()
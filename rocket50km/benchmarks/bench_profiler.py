@@ -0,0 +1,70 @@
+# benchmarks/bench_profiler.py
+# Run from rocket50km/:  python -m benchmarks.bench_profiler
+
+import time
+
+import numpy as np
+
+from ai.flight_logger import BufferedFlightLogger, NullFlightLogger
+from ai.realistic_env import RealisticRocketEnv
+from ai.rocket_env import RocketEnv
+from launch_feasibility.model import predict as feasibility
+from profiler import PhaseProfiler
+from rocket import Rocket
+
+
+def episode_us_per_step(env, repeats=3):
+    """Best-of-``repeats`` wall time per ``env.step`` over whole episodes; also returns the last info."""
+    action = np.array([0.8], dtype=np.float32)
+    best = float("inf")
+    for _ in range(repeats):
+        env.reset()
+        steps, done = 0, False
+        start = time.perf_counter()
+        while not done:
+            _, _, terminated, truncated, info = env.step(action)
+            steps += 1
+            done = terminated or truncated
+        best = min(best, (time.perf_counter() - start) / steps)
+    return best * 1e6, info
+
+
+def main():
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        envs = {
+            "RealisticRocketEnv, CSV log": lambda profiler: RealisticRocketEnv(
+                logger=BufferedFlightLogger(f"{tmp}/flight_log.csv"), profiler=profiler),
+            "RealisticRocketEnv, no log": lambda profiler: RealisticRocketEnv(
+                logger=NullFlightLogger(), profiler=profiler),
+            "RocketEnv": lambda profiler: RocketEnv(profiler=profiler),
+        }
+        for name, make in envs.items():
+            off, _ = episode_us_per_step(make(None))
+            profiler = PhaseProfiler(verbose=False)
+            on, info = episode_us_per_step(make(profiler))
+            print(f"\n{name}: {off:.1f} us/step profiler off | {on:.1f} us/step on")
+            assert set(info["profile"]) == set(profiler.summary())
+            print(profiler.table())
+
+    rocket = Rocket(profiler=PhaseProfiler(verbose=False))
+    rocket.throttle = 1.0
+    for _ in range(20000):
+        rocket.update(0.05)
+    print("\nRocket.update, 20000 steps")
+    print(rocket.profiler.table())
+
+    feasibility.profiler = PhaseProfiler(verbose=False)
+    from benchmarks.bench_feasibility import random_inputs
+    inputs = random_inputs(256)
+    feasibility.predict_launch_feasibility_batch(inputs[:1])  # includes the one-off model load
+    for _ in range(5):
+        feasibility.predict_launch_feasibility_batch(inputs)
+    feasibility.predict_launch_feasibility_batch(inputs[:8], plot=True)
+    print("\npredict_launch_feasibility_batch, 1 + 5 x 256 + 8 (plotted) inputs")
+    print(feasibility.profiler.table())
+
+
+if __name__ == "__main__":
+    main()
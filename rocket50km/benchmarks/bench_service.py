@@ -0,0 +1,58 @@
+# benchmarks/bench_service.py
+# Run from rocket50km/:  python -m benchmarks.bench_service --clients 16
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from benchmarks.bench_feasibility import random_inputs
+from launch_feasibility.service import FeasibilityClient, make_server
+
+
+def load_test(window_ms, n_clients, per_client, inputs):
+    server = make_server(port=0, window_ms=window_ms)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = FeasibilityClient(f"http://127.0.0.1:{server.server_address[1]}")
+    try:
+        latencies = []
+
+        def worker(k):
+            for j in range(per_client):
+                start = time.perf_counter()
+                client.predict(**inputs[(k * per_client + j) % len(inputs)])
+                latencies.append(time.perf_counter() - start)
+
+        threads = [threading.Thread(target=worker, args=(k,)) for k in range(n_clients)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        wall = time.perf_counter() - start
+        stats = client.stats()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    p50, p99 = np.percentile(np.array(latencies) * 1e3, [50, 99])
+    print(f"window {window_ms:5.1f} ms | client p50 {p50:8.1f} ms  p99 {p99:8.1f} ms | "
+          f"server p50 {stats['p50_ms']:8.1f} ms  p99 {stats['p99_ms']:8.1f} ms | "
+          f"{len(latencies) / wall:7.1f} req/s | {stats['mean_batch_requests']:5.1f} requests/batch")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Feasibility service latency and throughput under load")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent client threads")
+    parser.add_argument("--requests", type=int, default=8, help="sequential requests per client")
+    parser.add_argument("--windows", type=float, nargs="+", default=[0.0, 5.0, 20.0])
+    args = parser.parse_args()
+
+    inputs = random_inputs(256)
+    for window_ms in args.windows:
+        load_test(window_ms, args.clients, args.requests, inputs)
+
+
+if __name__ == "__main__":
+    main()
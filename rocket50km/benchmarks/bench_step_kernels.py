@@ -0,0 +1,78 @@
+# benchmarks/bench_step_kernels.py
+# Run from rocket50km/:  python -m benchmarks.bench_step_kernels
+
+import time
+
+import numpy as np
+
+from ai.flight_logger import NullFlightLogger
+from ai.realistic_env import RealisticRocketSim
+from ai.rocket_env import RocketSimulator
+from ai.step_kernels import NUMBA_AVAILABLE, KernelRealisticRocketSim, KernelRocketSimulator, realistic_step
+
+# Documented tolerance: the kernels replay the Python arithmetic in the same
+# order, so trajectories normally match bit for bit; LLVM may still contract
+# a multiply-add, which stays far below this bound over a full flight.
+RTOL = 1e-9
+FIELDS = ("time", "altitude", "velocity", "acceleration", "fuel_mass", "max_altitude")
+
+
+def throttle_schedule(k):
+    return 0.3 + 0.7 * ((k // 300) % 2)
+
+
+def fly(sim, n_steps):
+    traj = np.empty((n_steps, len(FIELDS)))
+    for k in range(n_steps):
+        sim.step([throttle_schedule(k)])
+        traj[k] = [getattr(sim, f) for f in FIELDS]
+    return traj
+
+
+def per_step_ns(sim, n_steps):
+    action = [0.8]
+    sim.reset()
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        sim.step(action)
+    return (time.perf_counter() - start) / n_steps * 1e9
+
+
+def compare(name, make_python, make_kernel, n_steps=12000):
+    reference = fly(make_python(), n_steps)
+    compiled = fly(make_kernel(), n_steps)
+    bitwise = np.array_equal(reference, compiled)
+    if not np.allclose(compiled, reference, rtol=RTOL, atol=1e-9):
+        worst = np.max(np.abs(compiled - reference))
+        raise AssertionError(f"{name}: kernel diverged from Python (max abs {worst:.3e})")
+
+    # Shorter timing runs so landed rockets (which return immediately) do not dominate
+    python_ns = per_step_ns(make_python(), 2000)
+    kernel_ns = per_step_ns(make_kernel(), 2000)
+    print(f"{name:20s} parity {'bit-for-bit' if bitwise else f'within rtol={RTOL:g}'} | "
+          f"python {python_ns:8.0f} ns/step | kernel {kernel_ns:8.0f} ns/step | {python_ns / kernel_ns:.1f}x")
+
+
+def main():
+    print(f"Numba available: {NUMBA_AVAILABLE}")
+    # Warm up (JIT compile or load the on-disk cache) outside the timings
+    KernelRealisticRocketSim(logger=NullFlightLogger()).step([1.0])
+    KernelRocketSimulator().step([1.0])
+
+    compare("RealisticRocketSim",
+            lambda: RealisticRocketSim(logger=NullFlightLogger()),
+            lambda: KernelRealisticRocketSim(logger=NullFlightLogger()))
+    compare("RocketSimulator", RocketSimulator, KernelRocketSimulator)
+
+    # Bare kernel on the flat state, without the Python-side wrapper and state dict
+    sim = KernelRealisticRocketSim(logger=NullFlightLogger())
+    grid, density, wind = sim.atmosphere.linear_tables()
+    state, n_steps = sim.state.copy(), 2000
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        realistic_step(state, sim.params, grid, density, wind, 0.8)
+    print(f"{'realistic_step':20s} bare kernel {(time.perf_counter() - start) / n_steps * 1e9:8.0f} ns/step")
+
+
+if __name__ == "__main__":
+    main()
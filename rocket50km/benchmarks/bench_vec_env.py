@@ -0,0 +1,74 @@
+# benchmarks/bench_vec_env.py
+# Run from rocket50km/:  python -m benchmarks.bench_vec_env --n-envs 64
+
+import argparse
+import time
+
+import numpy as np
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from ai.flight_logger import NullFlightLogger
+from ai.realistic_env import RealisticRocketEnv
+from ai.rocket_env import RocketEnv
+from ai.trainer import GymToGymnasiumWrapper
+from ai.vec_env import RealisticRocketVecEnv, RocketVecEnv
+
+
+def steps_per_sec(vec_env, n_steps, seed=0):
+    rng = np.random.default_rng(seed)
+    low, high = vec_env.action_space.low, vec_env.action_space.high
+    actions = rng.uniform(low, high, size=(n_steps, vec_env.num_envs, 1)).astype(np.float32)
+    vec_env.reset()
+    start = time.perf_counter()
+    for k in range(n_steps):
+        vec_env.step(actions[k])
+    return n_steps * vec_env.num_envs / (time.perf_counter() - start)
+
+
+def check_parity(vec_env, scalar_env, n_steps=15000):
+    """Env 0 of the vec env must follow the scalar env, including auto-reset."""
+    vec_env.reset()
+    obs, _ = scalar_env.reset()
+    for k in range(n_steps):
+        # float64 so RocketSimulator does not carry a float32 throttle into its physics
+        action = np.array([0.3 + 0.7 * ((k // 500) % 2)])
+        vec_obs, vec_reward, vec_done, vec_info = vec_env.step(np.tile(action, (vec_env.num_envs, 1)))
+        obs, reward, terminated, truncated, _ = scalar_env.step(action)
+        if terminated or truncated:
+            assert vec_done[0], f"step {k}: vec env did not finish"
+            assert np.allclose(vec_info[0]["terminal_observation"], obs)
+            assert vec_info[0]["TimeLimit.truncated"] == (truncated and not terminated)
+            obs, _ = scalar_env.reset()
+        assert np.allclose(vec_obs[0], obs), f"step {k}: {vec_obs[0]} vs {obs}"
+        assert np.isclose(vec_reward[0], reward, rtol=1e-5, atol=1e-4), f"step {k}: {vec_reward[0]} vs {reward}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Steps/sec: DummyVecEnv vs batched VecEnv")
+    parser.add_argument("--n-envs", type=int, default=64)
+    parser.add_argument("--steps", type=int, default=2000, help="vec steps per measurement")
+    args = parser.parse_args()
+
+    check_parity(RealisticRocketVecEnv(2), RealisticRocketEnv(logger=NullFlightLogger()))
+    check_parity(RocketVecEnv(2), RocketEnv())
+    print("✅ Vec env parity OK")
+
+    cases = {
+        "RocketEnv": (lambda: GymToGymnasiumWrapper(RocketEnv()), RocketVecEnv),
+        "RealisticRocketEnv": (
+            lambda: GymToGymnasiumWrapper(RealisticRocketEnv(logger=NullFlightLogger())),
+            RealisticRocketVecEnv
+        ),
+    }
+    for name, (make_env, vec_cls) in cases.items():
+        dummy_1 = steps_per_sec(DummyVecEnv([make_env]), args.steps)
+        dummy_n = steps_per_sec(DummyVecEnv([make_env] * args.n_envs), max(args.steps // args.n_envs, 50))
+        batched = steps_per_sec(vec_cls(args.n_envs), args.steps)
+        print(f"{name:20s} DummyVecEnv x1: {dummy_1:10.0f} steps/s | "
+              f"DummyVecEnv x{args.n_envs}: {dummy_n:10.0f} steps/s | "
+              f"{vec_cls.__name__} x{args.n_envs}: {batched:10.0f} steps/s "
+              f"({batched / dummy_1:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_window_scanner.py
+# Run from rocket50km/:  python -m benchmarks.bench_window_scanner
+
+import argparse
+import time
+
+import numpy as np
+
+from launch_feasibility import window_scanner
+from launch_feasibility.model import predict as feasibility
+
+MINUTES_PER_TWO_WEEKS = 14 * 24 * 60
+
+
+def synthetic_series(n, seed=0):
+    """Smooth minute-level readings: a daily cycle plus a bounded random walk per feature."""
+    rng = np.random.default_rng(seed)
+    mid = (feasibility.range_min + feasibility.range_max) / 2
+    half = (feasibility.range_max - feasibility.range_min) / 2
+    day = np.sin(2 * np.pi * np.arange(n) / (24 * 60))[:, None]
+    walk = np.cumsum(rng.normal(0, 0.01, size=(n, 10)), axis=0)
+    return np.clip(mid + half * (0.5 * day + 0.4 * np.tanh(walk)), feasibility.range_min, feasibility.range_max)
+
+
+def per_window_scores(values, n):
+    """One scaler.transform and one model call per window, the loop the scanner replaces."""
+    scaler = feasibility.load_artifacts()["scaler"]
+    model = feasibility.load_artifacts()["model"]
+    scores = []
+    for seq in window_scanner.window_sequences(values[:n + feasibility.timesteps - 1]):
+        x = scaler.transform(seq).reshape(1, feasibility.timesteps, feasibility.features)
+        scores.append(np.asarray(model(x.astype(np.float32), training=False))[0, 0])
+    return np.array(scores)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Launch-window scan of minute data vs a per-window loop")
+    parser.add_argument("--minutes", type=int, default=MINUTES_PER_TWO_WEEKS)
+    parser.add_argument("--loop-n", type=int, default=200, help="windows scored by the (slow) loop")
+    parser.add_argument("--samples", type=int, default=1)
+    args = parser.parse_args()
+
+    values = synthetic_series(args.minutes)
+    window_scanner.score_windows(values[:20])  # load the model outside the timings
+
+    start = time.perf_counter()
+    loop = per_window_scores(values, args.loop_n)
+    loop_per_window = (time.perf_counter() - start) / args.loop_n
+
+    start = time.perf_counter()
+    scores, _, valid = window_scanner.score_windows(values, args.samples)
+    score_time = time.perf_counter() - start
+    start = time.perf_counter()
+    launch_windows = window_scanner.scan(values, samples=args.samples)
+    scan_time = time.perf_counter() - start
+
+    if args.samples <= 1:
+        worst = np.max(np.abs(scores[:args.loop_n] - loop))
+        assert worst < 1e-5, f"batched scores differ from the per-window loop by {worst:.2e}"
+
+    n = len(scores)
+    print(f"{n} windows ({args.minutes} minutes), {args.samples} MC sample(s)/window, "
+          f"backend {feasibility.load_artifacts()['backend']}")
+    print(f"  per-window loop:  {loop_per_window * 1e3:8.3f} ms/window -> {loop_per_window * n:8.1f} s extrapolated")
+    print(f"  batched scoring:  {score_time / n * 1e3:8.4f} ms/window -> {score_time:8.2f} s "
+          f"({loop_per_window * n / score_time:.0f}x)")
+    print(f"  full scan:        {scan_time:8.2f} s, {valid.sum()} valid windows, {len(launch_windows)} GO windows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+# benchmarks/suite.py
+# Run from rocket50km/:  python -m benchmarks.suite [--out results.json] [--update-baseline]
+#
+# One number per benchmark, written to JSON and compared against
+# benchmarks/baseline.json; exits 1 when any benchmark regresses past its
+# threshold. Re-record the baseline (--update-baseline) on the machine the
+# suite is compared on: absolute timings do not transfer between hosts.
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import types
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+DEFAULT_THRESHOLD = 0.35  # fractional slowdown that counts as a regression; shared hosts vary ~20% run to run
+POLICY_PATH = os.path.join(ROOT, "ppo_rocket_final.zip")
+# Stored in the baseline file itself: its numbers are absolute timings
+BASELINE_NOTE = ("Absolute timings from the machine named in 'machine'; not comparable across hosts. "
+                 "Regenerate with `python -m benchmarks.suite --update-baseline` on each host the suite gates.")
+
+
+def best_of(fn, repeats):
+    """Best-of-``repeats`` wall time of ``fn()`` in seconds, garbage collection paused (as ``timeit`` does)."""
+    best = float("inf")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+# --- sims: wall time of one full-throttle flight ---------------------------------
+#
+# Each timing flies ``flights`` flights so it runs long enough (>~0.2 s) that
+# scheduler noise stays well under the regression threshold.
+
+def per_flight(fly, flights):
+    def measure(repeats):
+        def run():
+            for _ in range(flights):
+                fly()
+        return best_of(run, repeats) / flights
+    return measure
+
+
+def _config_module():
+    """main.py's ``config`` constants, from config.json.
+
+    main.py imports them from a ``config`` module this checkout does not
+    ship; a real one, if present, takes precedence.
+    """
+    try:
+        import config
+        return config
+    except ImportError:
+        pass
+    with open(os.path.join(ROOT, "config.json")) as f:
+        cfg = json.load(f)
+    config = types.ModuleType("config")
+    config.GRAVITY = cfg["environment"]["gravity"]
+    config.ISP = cfg["engine"]["isp"]
+    config.THRUST = cfg["engine"]["thrust"]
+    config.DRAG_COEFF = cfg["rocket"]["drag_coeff"]
+    config.CROSS_SECTION_AREA = cfg["rocket"]["cross_section_area"]
+    config.PROPELLANT_MASS = cfg["rocket"]["propellant_mass"]
+    config.DRY_MASS = cfg["rocket"]["dry_mass"]
+    config.TIME_STEP = cfg["simulation"]["time_step"]
+    config.MAX_G_FORCE = 15.0  # only caps the printed g value
+    sys.modules["config"] = config
+    return config
+
+
+def main_flight():
+    """``main.main`` itself, with a FastClock and its per-step prints sent to a buffer."""
+    _config_module()
+    import main
+    from clock import FastClock
+    with contextlib.redirect_stdout(io.StringIO()):
+        main.main(FastClock())
+
+
+def rocket_flight(dt=0.1, max_steps=100_000):
+    from rocket import Rocket
+    rocket = Rocket()
+    rocket.throttle = 1.0
+    for _ in range(max_steps):
+        rocket.update(dt)
+        if rocket.altitude <= 0 and rocket.time > 3:
+            break
+
+
+def sim_flight(make_sim):
+    def fly():
+        sim = make_sim()
+        while not sim.done and sim.time < sim.max_sim_time:
+            sim.step([1.0])
+    return fly
+
+
+def rocket_simulator():
+    from ai.rocket_env import RocketSimulator
+    return RocketSimulator()
+
+
+def realistic_sim():
+    from ai.flight_logger import NullFlightLogger
+    from ai.realistic_env import RealisticRocketSim
+    return RealisticRocketSim(logger=NullFlightLogger())
+
+
+# --- envs: env.step throughput ---------------------------------------------------
+
+def env_steps_per_sec(make_env, n_steps=5000):
+    def measure(repeats):
+        env = make_env()
+        action = np.array([0.8], dtype=np.float32)
+
+        def run():
+            env.reset()
+            for _ in range(n_steps):
+                _, _, terminated, truncated, _ = env.step(action)
+                if terminated or truncated:
+                    env.reset()
+        return n_steps / best_of(run, repeats)
+    return measure
+
+
+def rocket_env():
+    from ai.rocket_env import RocketEnv
+    return RocketEnv()
+
+
+def realistic_env():
+    from ai.flight_logger import NullFlightLogger
+    from ai.realistic_env import RealisticRocketEnv
+    return RealisticRocketEnv(logger=NullFlightLogger())
+
+
+# --- inference -------------------------------------------------------------------
+
+def ppo_predict_us(repeats, n_calls=500):
+    """Single-observation deterministic ``PPO.predict``, the per-step cost of flying the policy."""
+    from stable_baselines3 import PPO
+    model = PPO.load(POLICY_PATH, device="cpu")
+    obs = np.zeros(model.observation_space.shape, dtype=np.float32)
+    model.predict(obs, deterministic=True)
+
+    def run():
+        for _ in range(n_calls):
+            model.predict(obs, deterministic=True)
+    return best_of(run, repeats) / n_calls * 1e6
+
+
+def cold_import_s(repeats):
+    """Fresh interpreter importing the feasibility predictor (TensorFlow stays lazy)."""
+    from benchmarks.bench_import import CASES, cold_start
+    with tempfile.TemporaryDirectory() as cwd:
+        return cold_start(CASES["import predict"], cwd, repeats)
+
+
+def feasibility_latency_ms(repeats, n_calls=20):
+    """Warm ``predict_launch_feasibility`` on one condition set (MC dropout, no plot)."""
+    from launch_feasibility.model.predict import predict_launch_feasibility
+    with open(os.path.join(ROOT, "launch_input.json")) as f:
+        conditions = json.load(f)
+    predict_launch_feasibility(**conditions)  # model load and graph build stay out of the timing
+
+    def run():
+        for _ in range(n_calls):
+            predict_launch_feasibility(**conditions)
+    return best_of(run, repeats) / n_calls * 1e3
+
+
+# name: (measure(repeats) -> value, unit, higher_is_better)
+BENCHMARKS = {
+    "sim/main_flight": (per_flight(main_flight, 5), "s", False),
+    "sim/rocket_flight": (per_flight(rocket_flight, 20), "s", False),
+    "sim/rocket_simulator_flight": (per_flight(sim_flight(rocket_simulator), 5), "s", False),
+    "sim/realistic_sim_flight": (per_flight(sim_flight(realistic_sim), 3), "s", False),
+    "env/rocket_env": (env_steps_per_sec(rocket_env), "steps/s", True),
+    "env/realistic_env": (env_steps_per_sec(realistic_env), "steps/s", True),
+    "inference/ppo_predict": (ppo_predict_us, "us", False),
+    "inference/cold_import_predict": (cold_import_s, "s", False),
+    "inference/feasibility_latency": (feasibility_latency_ms, "ms", False),
+}
+
+# Subprocess start-up is noisier than in-process loops
+THRESHOLDS = {"inference/cold_import_predict": 0.5}
+
+
+def run(names, repeats):
+    results = {}
+    for name in names:
+        measure, unit, higher_is_better = BENCHMARKS[name]
+        try:
+            value = measure(repeats)
+        except ImportError as e:
+            # e.g. SB3 or TensorFlow not installed; fails the comparison if it has a baseline
+            print(f"{name:34s} skipped: {e}", flush=True)
+            continue
+        results[name] = {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+        print(f"{name:34s} {value:12.4g} {unit}", flush=True)
+    return results
+
+
+def regression(result, base):
+    """Fractional slowdown of ``result`` against ``base`` (positive = worse)."""
+    if result["higher_is_better"]:
+        return base["value"] / result["value"] - 1
+    return result["value"] / base["value"] - 1
+
+
+def compare(results, baseline, names, threshold=None):
+    """Prints the comparison table for ``names``; returns those that regressed past their
+    threshold or have a baseline but no result (skipped, e.g. an import failed)."""
+    failed = []
+    print(f"\n{'benchmark':34s} {'baseline':>12s} {'now':>12s} {'change':>8s} {'limit':>7s}")
+    for name in names:
+        base = baseline.get(name)
+        result = results.get(name)
+        if result is None:
+            if base is not None:
+                print(f"{name:34s} {base['value']:12.4g} {'-':>12s}   MISSING")
+                failed.append(name)
+            continue
+        if base is None:
+            print(f"{name:34s} {'-':>12s} {result['value']:12.4g}   (no baseline)")
+            continue
+        limit = threshold if threshold is not None else base.get("threshold", THRESHOLDS.get(name, DEFAULT_THRESHOLD))
+        change = regression(result, base)
+        status = "REGRESSED" if change > limit else ""
+        print(f"{name:34s} {base['value']:12.4g} {result['value']:12.4g} {change:+8.1%} {limit:7.0%}  {status}")
+        if change > limit:
+            failed.append(name)
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite with regression checks against a baseline")
+    parser.add_argument("--only", nargs="*", default=None, help="benchmark names or prefixes (e.g. sim/ env/rocket_env)")
+    parser.add_argument("--repeats", type=int, default=5, help="best-of repeats per benchmark")
+    parser.add_argument("--out", default=None, help="write the results JSON here")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=None,
+                        help=f"override every regression threshold (default {DEFAULT_THRESHOLD:.0%}, per-benchmark in the baseline)")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS
+             if args.only is None or any(name == p or name.startswith(p) for p in args.only)]
+    if not names:
+        parser.error(f"no benchmark matches {args.only}; choose from {', '.join(BENCHMARKS)}")
+
+    results = run(names, args.repeats)
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "repeats": args.repeats,
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        previous = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                previous = json.load(f)["results"]
+        for name, result in results.items():
+            if "threshold" in previous.get(name, {}):
+                result["threshold"] = previous[name]["threshold"]
+            else:
+                result["threshold"] = THRESHOLDS.get(name, DEFAULT_THRESHOLD)
+        # A partial run (--only) updates its entries and keeps the rest
+        report["results"] = {**previous, **results}
+        report = {"note": BASELINE_NOTE, **report}
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nbaseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nno baseline at {args.baseline}; record one with --update-baseline")
+        return
+    with open(args.baseline) as f:
+        recorded = json.load(f)
+    if recorded.get("machine") != report["machine"] or recorded.get("python") != report["python"]:
+        print(f"\nwarning: baseline recorded on {recorded.get('machine')} (Python {recorded.get('python')}), "
+              f"this is {report['machine']} (Python {report['python']}); timings are absolute, "
+              f"so regenerate it on this host with --update-baseline")
+    failed = compare(results, recorded["results"], names, args.threshold)
+    if failed:
+        print(f"\n{len(failed)} benchmark(s) regressed or missing: {', '.join(failed)}")
+        sys.exit(1)
+    print("\nno regressions")
+
+
+if __name__ == "__main__":
+    main()
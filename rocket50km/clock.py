@@ -0,0 +1,106 @@
+import time
+
+CLOCK_MODES = ("fast", "realtime", "realtime-stats")
+
+
+class FastClock:
+    """Never waits: runs the flight as fast as the CPU allows."""
+
+    def __init__(self):
+        self.sim_time = 0.0
+        self.ticks = 0
+        self._wall_start = None
+
+    def start(self):
+        self.sim_time = 0.0
+        self.ticks = 0
+        self._wall_start = time.perf_counter()
+
+    def tick(self, dt):
+        if self._wall_start is None:
+            self.start()
+        self.sim_time += dt
+        self.ticks += 1
+
+    def summary(self):
+        wall = 0.0 if self._wall_start is None else time.perf_counter() - self._wall_start
+        return {"mode": "fast", "ticks": self.ticks, "sim_time": self.sim_time, "wall_time": wall}
+
+
+class RealTimeClock(FastClock):
+    """Paces sim time to wall time, ``speed`` times faster than real time.
+
+    Waits against absolute deadlines (start + sim_time / speed), so the
+    work done inside each step does not accumulate as drift the way a
+    plain ``time.sleep(dt)`` does.
+    """
+
+    def __init__(self, speed=1.0):
+        super().__init__()
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+
+    def tick(self, dt):
+        super().tick(dt)
+        deadline = self._wall_start + self.sim_time / self.speed
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+        self._record(time.perf_counter() - deadline)
+
+    def _record(self, lateness):
+        pass
+
+    def summary(self):
+        return {**super().summary(), "mode": "realtime", "speed": self.speed}
+
+
+class StatsRealTimeClock(RealTimeClock):
+    """Real-time clock that also records deadline misses and wake-up jitter."""
+
+    def __init__(self, speed=1.0, miss_tolerance=0.001):
+        super().__init__(speed)
+        self.miss_tolerance = miss_tolerance
+        self.lateness = []
+
+    def start(self):
+        super().start()
+        self.lateness = []
+
+    def _record(self, lateness):
+        self.lateness.append(lateness)
+
+    def summary(self):
+        stats = {**super().summary(), "mode": "realtime-stats"}
+        if self.lateness:
+            ordered = sorted(self.lateness)
+            stats.update({
+                "deadline_misses": sum(1 for v in ordered if v > self.miss_tolerance),
+                "jitter_mean_ms": sum(ordered) / len(ordered) * 1e3,
+                "jitter_p99_ms": ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] * 1e3,
+                "jitter_max_ms": ordered[-1] * 1e3,
+            })
+        return stats
+
+
+def make_clock(mode="realtime", speed=1.0):
+    if mode == "fast":
+        return FastClock()
+    if mode == "realtime":
+        return RealTimeClock(speed)
+    if mode == "realtime-stats":
+        return StatsRealTimeClock(speed)
+    raise ValueError(f"Unknown clock mode: {mode} (choose from {', '.join(CLOCK_MODES)})")
+
+
+def add_clock_arguments(parser, default="realtime"):
+    parser.add_argument("--clock", choices=CLOCK_MODES, default=default,
+                        help="fast = no waiting (batch/CI), realtime = paced to wall time")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="real-time multiplier for the realtime clocks")
+    return parser
+
+
+def clock_from_args(args):
+    return make_clock(args.clock, args.speed)
@@ -1,3 +1,6 @@
+import json
+import os
+
 import numpy as np
 
 class PIDController:
@@ -20,4 +23,57 @@ class AIController:
 
     def decide_throttle(self, state):
         # state = [altitude, velocity, acceleration]
-        return self.model.predict(np.array([state]))[0][0]
\ No newline at end of file
+        return self.model.predict(np.array([state]))[0][0]
+
+class NumpyPolicyController:
+    """Deterministic PPO actor in plain NumPy, exported by ``python -m ai.export_policy``.
+
+    Same action as ``PPO.predict(obs, deterministic=True)`` (the Gaussian
+    mean, clipped to the action bounds), with the VecNormalize observation
+    scaling applied when the export carries it. No torch import.
+    """
+
+    _activations = {"linear": None, "relu": lambda x: np.maximum(x, 0, out=x), "tanh": lambda x: np.tanh(x, out=x)}
+
+    def __init__(self, model_path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "ai", "policy_actor.npz")):
+        with np.load(model_path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            self.layers = [
+                (data[f"layer{n}_weight"].astype(np.float32), data[f"layer{n}_bias"].astype(np.float32),
+                 self._activations[activation])
+                for n, activation in enumerate(meta["activations"])
+            ]
+            self.action_low = data["action_low"].astype(np.float32)
+            self.action_high = data["action_high"].astype(np.float32)
+            self.normalize_obs = meta["normalize_obs"]
+            if self.normalize_obs:
+                self.obs_mean = data["obs_mean"]
+                self.obs_std = np.sqrt(data["obs_var"] + float(data["epsilon"]))
+                self.clip_obs = float(data["clip_obs"])
+        self.obs_dim = meta["obs_dim"]
+        self._low, self._high = float(self.action_low[0]), float(self.action_high[0])
+
+    def _forward(self, obs):
+        if self.normalize_obs:
+            obs = np.clip((obs - self.obs_mean) / self.obs_std, -self.clip_obs, self.clip_obs)
+        x = np.asarray(obs, dtype=np.float32)
+        for weight, bias, activation in self.layers:
+            x = x @ weight
+            x += bias
+            if activation is not None:
+                activation(x)
+        return x
+
+    def decide_throttle(self, obs):
+        # obs = [altitude, velocity, acceleration, fuel_mass]; one flight -> float
+        throttle = float(self._forward(obs)[0])
+        return self._high if throttle > self._high else self._low if throttle < self._low else throttle
+
+    def predict(self, obs, state=None, episode_start=None, deterministic=True):
+        """SB3-style batched call, ``(N, obs_dim) -> ((N, 1) actions, None)``, for ai.batch_eval.
+
+        Always the mean action; ``deterministic`` is accepted for signature compatibility.
+        """
+        obs = np.asarray(obs)
+        actions = np.clip(self._forward(obs.reshape(-1, self.obs_dim)), self.action_low, self.action_high)
+        return (actions if obs.ndim > 1 else actions[0]), None
@@ -0,0 +1,209 @@
+"""Monte Carlo dispersion runs of the realistic sim.
+
+Each trial draws rocket/engine/wind parameters from the distributions in a
+spec file and flies one BatchRealisticRocketSim rocket to touchdown.
+Trials are split into fixed-size batches; batch ``i`` always uses the
+random stream ``SeedSequence(seed, spawn_key=(i,))``, so results depend on
+``seed`` and ``batch_size`` only, never on the number of worker processes.
+Finished batches are written straight into one ``.npy`` memmap per column,
+and the percentile summary goes to ``summary.json``.
+
+Only the per-rocket parameters in ``DISPERSABLE_FIELDS`` can be dispersed,
+not every config.json field. Spec format (``mean`` defaults to the
+config.json value)::
+
+    {
+      "engine.thrust": {"dist": "normal", "rel_std": 0.03},
+      "rocket.drag_coeff": {"dist": "uniform", "low": 0.40, "high": 0.50},
+      "environment.wind_scale": {"dist": "uniform", "low": 0.5, "high": 1.5}
+    }
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from ai.batch_sim import BatchRealisticRocketSim
+
+# config.json field -> per-rocket parameter array on BatchRealisticRocketSim.
+# Only these can vary per trial. The other config.json fields are either not
+# used by the realistic sim (environment.gravity/air_density/wind_speed: it
+# flies the rocketpy_env profile; stages.parachute_deploy_alt: it deploys at
+# 10 km; simulation.target_altitude/physics_steps_per_rl_step: env settings)
+# or shared by the whole batch (simulation.time_step/max_sim_time,
+# engine.min_throttle).
+DISPERSABLE_FIELDS = {
+    "rocket.dry_mass": "dry_mass",
+    "rocket.propellant_mass": "propellant_mass",
+    "rocket.cross_section_area": "cross_section_area",
+    "rocket.drag_coeff": "base_drag_coeff",
+    "engine.thrust": "thrust",
+    "engine.isp": "isp",
+    # Not in config.json: multiplier on the rocketpy_env wind profile (nominal 1.0)
+    "environment.wind_scale": "wind_scale",
+}
+DISTRIBUTIONS = ("normal", "uniform")
+OUTPUT_COLUMNS = ("apogee", "downrange", "landing_velocity", "flight_time", "landed")
+PERCENTILES = (1, 5, 50, 95, 99)
+
+SPEC_PATH = os.path.join(os.path.dirname(__file__), 'dispersion_spec.json')
+
+
+def nominal_values():
+    sim = BatchRealisticRocketSim(1)
+    return {field: float(getattr(sim, attr)[0]) for field, attr in DISPERSABLE_FIELDS.items()}
+
+
+def validate_spec(spec):
+    for field, dist in spec.items():
+        if field not in DISPERSABLE_FIELDS:
+            raise ValueError(f"Cannot disperse {field!r}: only the realistic sim's per-rocket parameters can "
+                             f"vary per trial (choose from {', '.join(DISPERSABLE_FIELDS)}); other config.json "
+                             f"fields are unused by that sim or shared by the whole batch")
+        kind = dist.get("dist")
+        if kind not in DISTRIBUTIONS:
+            raise ValueError(f"{field}: unknown dist {kind!r} (choose from {', '.join(DISTRIBUTIONS)})")
+        if kind == "normal" and ("std" in dist) == ("rel_std" in dist):
+            raise ValueError(f"{field}: normal needs exactly one of 'std' or 'rel_std'")
+        if kind == "uniform" and not {"low", "high"} <= dist.keys():
+            raise ValueError(f"{field}: uniform needs 'low' and 'high'")
+    return spec
+
+
+def sample_parameters(spec, n, rng, nominal):
+    """Draw ``n`` values per spec field. Fields are sampled in sorted order so
+    adding a field never reshuffles the draws of the ones before it."""
+    samples = {}
+    for field in sorted(spec):
+        dist = spec[field]
+        if dist["dist"] == "normal":
+            mean = dist.get("mean", nominal[field])
+            std = dist["std"] if "std" in dist else dist["rel_std"] * abs(mean)
+            values = rng.normal(mean, std, n)
+        else:
+            values = rng.uniform(dist["low"], dist["high"], n)
+        if "min" in dist or "max" in dist:
+            values = np.clip(values, dist.get("min", -np.inf), dist.get("max", np.inf))
+        samples[field] = values
+    return samples
+
+
+def run_batch(spec, seed, batch_index, n, throttle=1.0):
+    """Fly one batch of ``n`` trials; returns a dict of column arrays."""
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(batch_index,)))
+    sim = BatchRealisticRocketSim(n)
+    samples = sample_parameters(spec, n, rng, nominal_values())
+    for field, values in samples.items():
+        setattr(sim, DISPERSABLE_FIELDS[field], values)
+    sim.reset()  # picks up the dispersed propellant and drag coefficient
+    sim.run(throttle)
+    return {
+        **samples,
+        "apogee": sim.max_altitude,
+        "downrange": sim.downrange,
+        "landing_velocity": sim.landing_velocity,
+        "flight_time": sim.time,
+        "landed": sim.landed,
+    }
+
+
+def summarize(columns):
+    """Mean, std and ``PERCENTILES`` per column; all None for an empty column (e.g. no trial landed)."""
+    summary = {}
+    for name, values in columns.items():
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            summary[name] = {"mean": None, "std": None, **{f"p{q}": None for q in PERCENTILES}}
+            continue
+        summary[name] = {
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            **{f"p{q}": float(v) for q, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))},
+        }
+    return summary
+
+
+def run_dispersion(spec, n_trials, out_dir, seed=0, batch_size=2048, workers=None, throttle=1.0):
+    """Run ``n_trials`` trials and stream them into ``out_dir``; returns the summary dict."""
+    validate_spec(spec)
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(out_dir, exist_ok=True)
+    batches = [(i, start, min(batch_size, n_trials - start))
+               for i, start in enumerate(range(0, n_trials, batch_size))]
+
+    columns = {}
+    for name in [*sorted(spec), *OUTPUT_COLUMNS]:
+        dtype = bool if name == "landed" else np.float64
+        columns[name] = open_memmap(os.path.join(out_dir, f"{name}.npy"), mode="w+",
+                                    dtype=dtype, shape=(n_trials,))
+
+    def store(start, result):
+        for name, values in result.items():
+            columns[name][start:start + len(values)] = values
+
+    wall_start = time.perf_counter()
+    if workers == 1:
+        for i, start, n in batches:
+            store(start, run_batch(spec, seed, i, n, throttle))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_batch, spec, seed, i, n, throttle): start for i, start, n in batches}
+            for future in as_completed(futures):
+                store(futures[future], future.result())
+    wall_time = time.perf_counter() - wall_start
+
+    for values in columns.values():
+        values.flush()
+    landed = columns["landed"]
+    summary = {
+        "n_trials": n_trials,
+        "seed": seed,
+        "batch_size": batch_size,
+        "workers": workers,
+        "throttle": throttle,
+        "wall_time": wall_time,
+        "trials_per_sec": n_trials / wall_time,
+        "landed_fraction": float(landed.mean()) if n_trials else 0.0,
+        "spec": spec,
+        "columns": {name: str(values.dtype) for name, values in columns.items()},
+        "outputs": summarize({name: columns[name][landed] for name in OUTPUT_COLUMNS if name != "landed"}),
+    }
+    with open(os.path.join(out_dir, "summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def load_results(out_dir):
+    """Memory-map every column written by ``run_dispersion``."""
+    with open(os.path.join(out_dir, "summary.json")) as f:
+        names = json.load(f)["columns"]
+    return {name: np.load(os.path.join(out_dir, f"{name}.npy"), mmap_mode="r") for name in names}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo dispersion of the realistic rocket sim")
+    parser.add_argument("--spec", default=SPEC_PATH, help="JSON distributions per config.json field")
+    parser.add_argument("--trials", type=int, default=10000)
+    parser.add_argument("--out", default="dispersion_results")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=2048)
+    parser.add_argument("--workers", type=int, default=None, help="default: one per CPU core")
+    parser.add_argument("--throttle", type=float, default=1.0)
+    args = parser.parse_args()
+
+    with open(args.spec) as f:
+        spec = json.load(f)
+    summary = run_dispersion(spec, args.trials, args.out, seed=args.seed, batch_size=args.batch_size,
+                             workers=args.workers, throttle=args.throttle)
+
+    print(f"🎲 {summary['n_trials']} trials on {summary['workers']} workers in {summary['wall_time']:.1f}s "
+          f"({summary['trials_per_sec']:.0f} trials/s), landed {summary['landed_fraction']:.1%}")
+    print(f"{'':18s}" + "".join(f"{'p' + str(q):>11s}" for q in PERCENTILES))
+    for name, stats in summary["outputs"].items():
+        print(f"{name:18s}" + "".join(f"{'-':>11s}" if stats[f"p{q}"] is None else f"{stats[f'p{q}']:11.2f}"
+                                      for q in PERCENTILES))
+    print(f"Results: {args.out}/")
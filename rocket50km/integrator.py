@@ -0,0 +1,220 @@
+import math
+import numpy as np
+
+# Dormand-Prince 5(4) tableau
+C = [0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0]
+A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+# 5th-order weights minus embedded 4th-order weights
+E = np.array([71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40])
+
+SAFETY = 0.9
+MIN_FACTOR = 0.2
+MAX_FACTOR = 10.0
+
+
+class Event:
+    """Zero crossing of ``fn(t, y)``; direction -1 only fires on a falling crossing."""
+
+    def __init__(self, name, fn, direction=0, terminal=False):
+        self.name = name
+        self.fn = fn
+        self.direction = direction
+        self.terminal = terminal
+
+    def crossed(self, g0, g1):
+        if self.direction < 0:
+            return g0 > 0 >= g1
+        if self.direction > 0:
+            return g0 < 0 <= g1
+        return (g0 > 0 >= g1) or (g0 < 0 <= g1)
+
+
+class IntegrationResult:
+    def __init__(self, t, y, events, n_rhs, n_steps, n_rejected, terminal_event):
+        self.t = t
+        self.y = y
+        self.events = events              # {name: (t_event, y_event)}
+        self.n_rhs = n_rhs
+        self.n_steps = n_steps
+        self.n_rejected = n_rejected
+        self.terminal_event = terminal_event
+
+
+def _hermite(t0, y0, f0, t1, y1, f1, t):
+    """Cubic Hermite interpolant between two accepted steps."""
+    h = t1 - t0
+    s = (t - t0) / h
+    h00 = (1 + 2 * s) * (1 - s) ** 2
+    h10 = s * (1 - s) ** 2
+    h01 = s * s * (3 - 2 * s)
+    h11 = s * s * (s - 1)
+    return h00 * y0 + h10 * h * f0 + h01 * y1 + h11 * h * f1
+
+
+def _locate_root(event, t0, y0, f0, t1, y1, f1, g0, g1, tol=1e-10, max_iter=60):
+    """Illinois false position on the interpolated event function."""
+    a, b, ga, gb = t0, t1, g0, g1
+    side = 0
+    t = b
+    for _ in range(max_iter):
+        t = (a * gb - b * ga) / (gb - ga) if gb != ga else 0.5 * (a + b)
+        g = event.fn(t, _hermite(t0, y0, f0, t1, y1, f1, t))
+        if abs(b - a) < tol or g == 0:
+            break
+        if (g > 0) == (gb > 0):
+            b, gb = t, g
+            if side == -1:
+                ga *= 0.5
+            side = -1
+        else:
+            a, ga = t, g
+            if side == 1:
+                gb *= 0.5
+            side = 1
+    return t, _hermite(t0, y0, f0, t1, y1, f1, t)
+
+
+def _rms_norm(x):
+    return math.sqrt(float(np.dot(x, x)) / x.size)
+
+
+def dormand_prince(rhs, t0, y0, t_end, events=(), rtol=1e-6, atol=1e-6, first_step=None, max_step=np.inf):
+    """Integrate ``y' = rhs(t, y)`` from ``t0`` to ``t_end`` with RK45 error control.
+
+    Non-terminal events are recorded; the first terminal event stops the
+    integration exactly at the located root.
+    """
+    t = float(t0)
+    y = np.array(y0, dtype=float)
+    f = np.asarray(rhs(t, y), dtype=float)
+    n_rhs = 1
+    n_steps = n_rejected = 0
+    atol = np.broadcast_to(np.asarray(atol, dtype=float), y.shape)
+
+    if first_step is None:
+        scale = atol + rtol * np.abs(y)
+        d0, d1 = _rms_norm(y / scale), _rms_norm(f / scale)
+        h = 0.01 * d0 / d1 if d0 > 1e-5 and d1 > 1e-5 else 1e-6
+    else:
+        h = first_step
+    h = min(h, max_step, t_end - t)
+
+    found = {}
+    g_prev = [ev.fn(t, y) for ev in events]
+    k = [None] * 7
+
+    while t < t_end:
+        h = min(h, t_end - t)
+        k[0] = f
+        for i in range(1, 7):
+            dy = sum(a * ki for a, ki in zip(A[i], k) if a != 0.0)
+            k[i] = np.asarray(rhs(t + C[i] * h, y + h * dy), dtype=float)
+        n_rhs += 6
+        y_new = y + h * sum(a * ki for a, ki in zip(A[6], k) if a != 0.0)
+        err = h * sum(e * ki for e, ki in zip(E, k) if e != 0.0)
+        scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+        err_norm = _rms_norm(err / scale)
+
+        if err_norm > 1.0:
+            h *= max(MIN_FACTOR, SAFETY * err_norm ** -0.2)
+            n_rejected += 1
+            continue
+
+        t_new, f_new = t + h, k[6]
+        n_steps += 1
+
+        terminal = None
+        for idx, ev in enumerate(events):
+            g_new = ev.fn(t_new, y_new)
+            if ev.name not in found and ev.crossed(g_prev[idx], g_new):
+                t_ev, y_ev = _locate_root(ev, t, y, f, t_new, y_new, f_new, g_prev[idx], g_new)
+                found[ev.name] = (t_ev, y_ev)
+                if ev.terminal and (terminal is None or t_ev < found[terminal.name][0]):
+                    terminal = ev
+            g_prev[idx] = g_new
+
+        if terminal is not None:
+            t_ev, y_ev = found[terminal.name]
+            # Drop anything located past the terminal root
+            found = {name: v for name, v in found.items() if v[0] <= t_ev}
+            return IntegrationResult(t_ev, y_ev, found, n_rhs, n_steps, n_rejected, terminal.name)
+
+        t, y, f = t_new, y_new, f_new
+        factor = MAX_FACTOR if err_norm == 0 else min(MAX_FACTOR, SAFETY * err_norm ** -0.2)
+        h = min(h * factor, max_step)
+
+    return IntegrationResult(t, y, found, n_rhs, n_steps, n_rejected, None)
+
+
+def integrate_flight(rhs, y0, t_end, parachute_altitude, rtol=1e-6, atol=1e-6, max_step=np.inf,
+                     t0=0.0, chute=False):
+    """Fly a 1-D/2-D rocket through its burn, coast and parachute phases.
+
+    ``rhs(t, y, burning, chute)`` returns dy/dt for a state laid out as
+    ``[altitude, velocity, ..., fuel_mass]``. Each of MECO (fuel runs out),
+    apogee, parachute deployment and touchdown is located by root finding,
+    and the integration restarts there with the new phase flags, so the
+    thrust and drag discontinuities never fall inside a step.
+
+    The flight resumes at time ``t0`` with the parachute already open when
+    ``chute`` is set; ``t_end`` and every event time are absolute.
+
+    Returns ``(t, y, event_times, event_states, stats)``.
+    """
+    meco = Event("meco", lambda t, y: y[-1], direction=-1, terminal=True)
+    apogee = Event("apogee", lambda t, y: y[1], direction=-1, terminal=True)
+    parachute = Event("parachute", lambda t, y: y[0] - parachute_altitude, direction=-1, terminal=True)
+    touchdown = Event("touchdown", lambda t, y: y[0], direction=-1, terminal=True)
+
+    t = float(t0)
+    y = np.array(y0, dtype=float)
+    burning = y[-1] > 0
+    event_times, event_states = {}, {}
+    stats = {"n_rhs": 0, "n_steps": 0, "n_rejected": 0}
+    if not chute and y[0] <= parachute_altitude and y[1] < 0:
+        # Already falling below the deploy altitude: the chute opens right away
+        chute = True
+        event_times["parachute"] = t
+        event_states["parachute"] = y.copy()
+    pending = [ev for ev in (meco, apogee, parachute, touchdown)
+               if (burning or ev is not meco) and (not chute or ev is not parachute)]
+
+    while t < t_end:
+        result = dormand_prince(
+            lambda tt, yy: rhs(tt, yy, burning, chute), t, y, t_end,
+            events=pending, rtol=rtol, atol=atol, max_step=max_step
+        )
+        for key in stats:
+            stats[key] += getattr(result, key)
+        t, y = result.t, np.array(result.y)
+        name = result.terminal_event
+        if name is None:
+            break
+
+        event_times[name] = t
+        event_states[name] = y.copy()
+        pending = [ev for ev in pending if ev.name != name]
+
+        if name == "meco":
+            y[-1] = 0.0
+            burning = False
+        elif name == "apogee" and not chute and y[0] <= parachute_altitude:
+            # Apogee below the deploy altitude: the chute opens as soon as we fall
+            chute = True
+            event_times["parachute"] = t
+            event_states["parachute"] = y.copy()
+            pending = [ev for ev in pending if ev.name != "parachute"]
+        elif name == "parachute":
+            chute = True
+        elif name == "touchdown":
+            break
+
+    return t, y, event_times, event_states, stats
@@ -1,48 +1,151 @@
 # launch_feasibility/model/generate_synthetic_data.py
+#
+# Chunked, vectorized synthetic launch data. Each chunk is sampled from its
+# own seeded stream, labelled with boolean masks over the predict.thresholds
+# rules and written straight out, so memory is bounded by --chunk-size and
+# the output is identical for any chunk boundary placement of the same seed.
+#
+#   python launch_feasibility/model/generate_synthetic_data.py                      # legacy 1000-row CSV
+#   python launch_feasibility/model/generate_synthetic_data.py --n 10000000 --format npy --out data/launch_shards
 
-import numpy as np
-import pandas as pd
+import argparse
+import json
 import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import numpy as np
+
+from launch_feasibility.model.predict import FEATURES, ranges, thresholds
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:  # Parquet output is optional; .npy shards need only NumPy
+    PARQUET_AVAILABLE = False
+
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+CSV_PATH = os.path.join(MODEL_DIR, "synthetic_launch_data.csv")
+FORMATS = ("csv", "npy", "parquet")
+MANIFEST = "manifest.json"
+LABEL = "Outcome"
+
+# Rows per random stream: fixed, so chunk size never changes the samples
+BLOCK_ROWS = 65536
+
+
+def _block(seed, index, rows):
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+    low = np.array([ranges[f][0] for f in FEATURES], dtype=float)
+    high = np.array([ranges[f][1] for f in FEATURES], dtype=float)
+    return rng.uniform(low, high, size=(rows, len(FEATURES)))
+
+
+def sample_features(start, rows, seed=42, dtype=np.float32, cache=None):
+    """Rows ``start:start + rows`` of the dataset for ``seed``, shape (rows, 10).
+
+    ``cache`` (a dict, owned by the caller) keeps the last block drawn, so
+    consecutive small reads do not redraw the same ``BLOCK_ROWS`` block.
+    """
+    out = np.empty((rows, len(FEATURES)), dtype=dtype)
+    first, last = start // BLOCK_ROWS, (start + rows - 1) // BLOCK_ROWS
+    for b in range(first, last + 1):
+        key = (seed, b)
+        block = cache.get(key) if cache is not None else None
+        if block is None:
+            block = _block(seed, b, BLOCK_ROWS)
+            if cache is not None:
+                cache.clear()
+                cache[key] = block
+        lo = max(start, b * BLOCK_ROWS)
+        hi = min(start + rows, (b + 1) * BLOCK_ROWS)
+        out[lo - start:hi - start] = block[lo - b * BLOCK_ROWS:hi - b * BLOCK_ROWS]
+    return out
+
+
+def label_outcomes(features):
+    """1 where every ``thresholds`` rule holds, else 0 (vectorized over rows)."""
+    ok = np.ones(len(features), dtype=bool)
+    for i, feature in enumerate(FEATURES):
+        rule = thresholds.get(feature, {})
+        if "min" in rule:
+            ok &= features[:, i] >= rule["min"]
+        if "max" in rule:
+            ok &= features[:, i] <= rule["max"]
+    return ok.astype(np.uint8)
+
+
+def iter_chunks(n, seed=42, chunk_size=1_000_000, dtype=np.float32):
+    """Yield ``(features, labels)`` chunks covering ``n`` rows."""
+    cache = {}  # chunks smaller than BLOCK_ROWS reuse the block they share
+    for start in range(0, n, chunk_size):
+        features = sample_features(start, min(chunk_size, n - start), seed, dtype, cache)
+        yield features, label_outcomes(features)
+
+
+def _shard_name(k, suffix):
+    return f"shard-{k:05d}{suffix}"
+
+
+def write_dataset(out, n, seed=42, chunk_size=1_000_000, fmt="npy"):
+    """Stream ``n`` rows to ``out``: a CSV file, or a directory of shards plus manifest.json."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format: {fmt} (choose from {', '.join(FORMATS)})")
+    if fmt == "parquet" and not PARQUET_AVAILABLE:
+        raise ImportError("Parquet output needs pyarrow; use --format npy")
+
+    if fmt == "csv":
+        with open(out, "w") as f:
+            f.write(",".join([*FEATURES, LABEL]) + "\n")
+            for features, labels in iter_chunks(n, seed, chunk_size, dtype=np.float64):
+                np.savetxt(f, np.column_stack([features, labels]), delimiter=",",
+                           fmt=["%.17g"] * len(FEATURES) + ["%d"])
+        return out
+
+    os.makedirs(out, exist_ok=True)
+    shards = []
+    for k, (features, labels) in enumerate(iter_chunks(n, seed, chunk_size)):
+        if fmt == "npy":
+            shard = {"features": _shard_name(k, "-features.npy"), "labels": _shard_name(k, "-labels.npy")}
+            np.save(os.path.join(out, shard["features"]), features)
+            np.save(os.path.join(out, shard["labels"]), labels)
+        else:
+            shard = {"path": _shard_name(k, ".parquet")}
+            table = pa.table({**{f: features[:, i] for i, f in enumerate(FEATURES)}, LABEL: labels})
+            pq.write_table(table, os.path.join(out, shard["path"]))
+        shards.append({**shard, "rows": len(labels), "positives": int(labels.sum())})
+
+    with open(os.path.join(out, MANIFEST), "w") as f:
+        json.dump({"format": fmt, "features": FEATURES, "label": LABEL, "rows": n, "seed": seed,
+                   "chunk_size": chunk_size, "shards": shards}, f, indent=2)
+    return out
+
+
+def iter_shards(dataset_dir):
+    """Yield ``(features, labels)`` per shard of a written dataset; ``.npy`` shards are memory-mapped."""
+    with open(os.path.join(dataset_dir, MANIFEST)) as f:
+        manifest = json.load(f)
+    for shard in manifest["shards"]:
+        if manifest["format"] == "npy":
+            yield (np.load(os.path.join(dataset_dir, shard["features"]), mmap_mode="r"),
+                   np.load(os.path.join(dataset_dir, shard["labels"]), mmap_mode="r"))
+        else:
+            table = pq.read_table(os.path.join(dataset_dir, shard["path"]))
+            features = np.column_stack([table[f].to_numpy() for f in manifest["features"]])
+            yield features, table[manifest["label"]].to_numpy()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic launch outcome data")
+    parser.add_argument("--n", type=int, default=1000, help="number of samples")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000, help="rows generated and written at a time")
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("--out", default=None, help=f"default: {CSV_PATH} for csv, else a shard directory")
+    args = parser.parse_args()
 
-np.random.seed(42)
-
-N = 1000  # Number of synthetic samples
-
-data = {
-    "Temperature_C": np.random.uniform(-10, 40, N),
-    "Wind_Speed_kmph": np.random.uniform(0, 50, N),
-    "Atmospheric_Pressure_hPa": np.random.uniform(950, 1050, N),
-    "Humidity_percent": np.random.uniform(10, 100, N),
-    "Visibility_km": np.random.uniform(1, 20, N),
-    "Cloud_Cover_percent": np.random.uniform(0, 100, N),
-    "Engine_Thrust_kN": np.random.uniform(500, 1000, N),
-    "Fuel_Pump_Pressure_bar": np.random.uniform(50, 150, N),
-    "Avionics_Status": np.random.uniform(0.9, 1.0, N),
-    "Sensor_Reliability": np.random.uniform(0.85, 1.0, N),
-}
-
-# Assign outcomes based on simple heuristic
-def label(row):
-    if (
-        0 <= row["Temperature_C"] <= 35 and
-        row["Wind_Speed_kmph"] <= 30 and
-        970 <= row["Atmospheric_Pressure_hPa"] <= 1030 and
-        row["Humidity_percent"] <= 85 and
-        row["Visibility_km"] >= 5 and
-        row["Cloud_Cover_percent"] <= 70 and
-        row["Engine_Thrust_kN"] >= 600 and
-        row["Fuel_Pump_Pressure_bar"] >= 70 and
-        row["Avionics_Status"] >= 0.95 and
-        row["Sensor_Reliability"] >= 0.9
-    ):
-        return 1  # Successful
-    else:
-        return 0  # Failed
-
-df = pd.DataFrame(data)
-df["Outcome"] = df.apply(label, axis=1)
-
-# Save as CSV
-output_path = "launch_feasibility/model/synthetic_launch_data.csv"
-df.to_csv(output_path, index=False)
-print(f"✅ Saved {len(df)} synthetic samples to {output_path}")
+    out = args.out or (CSV_PATH if args.format == "csv" else os.path.join(MODEL_DIR, "synthetic_shards"))
+    write_dataset(out, args.n, args.seed, args.chunk_size, args.format)
+    print(f"✅ Saved {args.n} synthetic samples to {out}")
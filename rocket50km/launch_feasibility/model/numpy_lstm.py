@@ -0,0 +1,137 @@
+# launch_feasibility/model/numpy_lstm.py
+"""NumPy-only forward pass of the launch LSTM (no TensorFlow at runtime).
+
+``export`` dumps the Keras model's layer weights and the MinMaxScaler
+parameters to one ``.npz``; ``load`` rebuilds the same stack
+(LSTM 64 -> Dropout -> LSTM 32 -> Dropout -> LSTM 16 -> Dropout ->
+Dense 16 relu -> Dense 1 sigmoid) as a ``NumpyLSTM`` that is called like
+the Keras model, ``model(x, training=False)``, including MC dropout.
+
+Re-export after retraining (run from rocket50km/):
+    python -m launch_feasibility.model.numpy_lstm
+"""
+import json
+import os
+
+import numpy as np
+
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+WEIGHTS_PATH = os.path.join(MODEL_DIR, "launch_model.npz")
+
+_ACTIVATIONS = {
+    "linear": lambda z: z,
+    "relu": lambda z: np.maximum(z, 0),
+    "tanh": np.tanh,
+    # tanh form: no overflow for large negative z
+    "sigmoid": lambda z: 0.5 * (1.0 + np.tanh(0.5 * z)),
+}
+
+
+class MinMaxParams:
+    """The ``transform`` of a fitted MinMaxScaler (``clip=False``), from its saved parameters."""
+
+    def __init__(self, scale, min_):
+        self.scale_ = scale
+        self.min_ = min_
+
+    def transform(self, X):
+        X = np.array(X, dtype=float)
+        X *= self.scale_
+        X += self.min_
+        return X
+
+
+class NumpyLSTM:
+    """Batched inference over a list of ``(type, config, weights)`` layers."""
+
+    def __init__(self, layers, dtype=np.float32):
+        self.dtype = dtype
+        self.layers = [(kind, config, [w.astype(dtype) for w in weights]) for kind, config, weights in layers]
+
+    def __call__(self, x, training=False, rng=None):
+        """(B, T, F) scaled sequences -> (B, 1) scores. ``training=True`` applies dropout, as Keras does."""
+        x = np.asarray(x, dtype=self.dtype)
+        if training and rng is None:
+            rng = np.random.default_rng()
+        for kind, config, weights in self.layers:
+            if kind == "lstm":
+                x = self._lstm(x, *weights, config)
+            elif kind == "dropout":
+                if training:
+                    rate = config["rate"]
+                    keep = rng.random(x.shape, dtype=self.dtype) >= rate
+                    x = np.where(keep, x / self.dtype(1 - rate), self.dtype(0))
+            elif kind == "dense":
+                kernel, bias = weights
+                x = _ACTIVATIONS[config["activation"]](x @ kernel + bias)
+            else:
+                raise ValueError(f"unsupported layer type {kind!r}")
+        return x
+
+    @staticmethod
+    def _lstm(x, kernel, recurrent, bias, config):
+        act = _ACTIVATIONS[config["activation"]]
+        gate = _ACTIVATIONS[config["recurrent_activation"]]
+        batch, steps, _ = x.shape
+        units = recurrent.shape[0]
+        # Input projections for every timestep in one matmul; Keras gate order i, f, c, o
+        xw = x @ kernel + bias
+        h = np.zeros((batch, units), dtype=x.dtype)
+        c = np.zeros((batch, units), dtype=x.dtype)
+        outputs = np.empty((batch, steps, units), dtype=x.dtype) if config["return_sequences"] else None
+        for t in range(steps):
+            z = xw[:, t] + h @ recurrent
+            i = gate(z[:, :units])
+            f = gate(z[:, units:2 * units])
+            g = act(z[:, 2 * units:3 * units])
+            o = gate(z[:, 3 * units:])
+            c = f * c + i * g
+            h = o * act(c)
+            if outputs is not None:
+                outputs[:, t] = h
+        return outputs if outputs is not None else h
+
+
+def export(keras_model, scaler, path=WEIGHTS_PATH):
+    """Write the model layers and scaler parameters of a trained Keras model to ``path``."""
+    layers, arrays = [], {}
+    for n, layer in enumerate(keras_model.layers):
+        kind = type(layer).__name__.lower()
+        config = layer.get_config()
+        if kind == "lstm":
+            if config.get("go_backwards") or config.get("dropout") or config.get("recurrent_dropout"):
+                raise ValueError(f"{layer.name}: only plain forward LSTMs are supported")
+            spec = {k: config[k] for k in ("activation", "recurrent_activation", "return_sequences")}
+        elif kind == "dropout":
+            spec = {"rate": config["rate"]}
+        elif kind == "dense":
+            spec = {"activation": config["activation"]}
+        else:
+            raise ValueError(f"{layer.name}: unsupported layer type {type(layer).__name__}")
+        weights = layer.get_weights()
+        for k, w in enumerate(weights):
+            arrays[f"layer{n}_{k}"] = w
+        layers.append({"type": kind, "config": spec, "n_weights": len(weights)})
+    np.savez_compressed(path, layers=np.array(json.dumps(layers)),
+                        scaler_scale=scaler.scale_, scaler_min=scaler.min_, **arrays)
+    return path
+
+
+def load(path=WEIGHTS_PATH, dtype=np.float32):
+    """Return ``(NumpyLSTM, MinMaxParams)`` from an exported ``.npz``."""
+    with np.load(path, allow_pickle=False) as data:
+        layers = [
+            (spec["type"], spec["config"], [data[f"layer{n}_{k}"] for k in range(spec["n_weights"])])
+            for n, spec in enumerate(json.loads(str(data["layers"])))
+        ]
+        scaler = MinMaxParams(data["scaler_scale"], data["scaler_min"])
+    return NumpyLSTM(layers, dtype), scaler
+
+
+if __name__ == "__main__":
+    import joblib
+    from tensorflow.keras.models import load_model
+
+    path = export(load_model(os.path.join(MODEL_DIR, "launch_model.keras")),
+                  joblib.load(os.path.join(MODEL_DIR, "scaler.save")))
+    print(f"✅ Exported {path} ({os.path.getsize(path) / 1024:.0f} KB)")
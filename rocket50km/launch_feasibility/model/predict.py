@@ -1,16 +1,68 @@
 # launch_feasibility/model/predict.py
 
-import numpy as np
-import matplotlib.pyplot as plt
 import base64
+import functools
 import io
-import joblib
-from tensorflow.keras.models import load_model
+import os
+import threading
+
+import numpy as np
+
+from profiler import NULL_PROFILER, PhaseProfiler
+
+# Artifacts live next to this file, whatever the working directory
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(MODEL_DIR, "launch_model.keras")
+SCALER_PATH = os.path.join(MODEL_DIR, "scaler.save")
+Y_TRAIN_PATH = os.path.join(MODEL_DIR, "y_train.npy")
+
+# "keras", "numpy" (exported weights, no TensorFlow) or "auto": Keras when
+# TensorFlow is installed, else NumPy
+BACKEND = os.environ.get("FEASIBILITY_BACKEND", "auto")
+
+# Opt-in stage timing for predict_launch_feasibility_batch: assign a
+# profiler.PhaseProfiler, or set FEASIBILITY_PROFILE=1
+profiler = PhaseProfiler(verbose=False) if os.environ.get("FEASIBILITY_PROFILE") else NULL_PROFILER
+
+# TensorFlow, the model and the scaler are loaded on first use, once per
+# process (a forked child reloads rather than reuse the parent's TF state)
+_artifacts = None
+_artifacts_pid = None
+_load_lock = threading.Lock()
+
+
+def _load(backend):
+    if backend in ("auto", "keras"):
+        try:
+            import joblib
+            from tensorflow.keras.models import load_model
+        except ImportError:
+            if backend == "keras":
+                raise
+        else:
+            return {"backend": "keras", "model": load_model(MODEL_PATH), "scaler": joblib.load(SCALER_PATH)}
+    from launch_feasibility.model import numpy_lstm
+    model, scaler = numpy_lstm.load()
+    return {"backend": "numpy", "model": model, "scaler": scaler}
 
-# Load model and artifacts
-model = load_model("launch_feasibility/model/launch_model.keras")
-scaler = joblib.load("launch_feasibility/model/scaler.save")
-y_train = np.load("launch_feasibility/model/y_train.npy")
+
+def load_artifacts():
+    """Return ``{"backend", "model", "scaler", "y_train"}``, loading them on the first call."""
+    global _artifacts, _artifacts_pid
+    pid = os.getpid()
+    if _artifacts is None or _artifacts_pid != pid:
+        with _load_lock:
+            if _artifacts is None or _artifacts_pid != pid:
+                _artifacts = {**_load(BACKEND), "y_train": np.load(Y_TRAIN_PATH)}
+                _artifacts_pid = pid
+    return _artifacts
+
+
+def __getattr__(name):
+    # Keeps ``predict.model`` / ``predict.scaler`` / ``predict.y_train`` working, lazily
+    if name in ("model", "scaler", "y_train"):
+        return load_artifacts()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Thresholds for validation
 ranges = {
@@ -42,95 +94,172 @@ thresholds = {
 is_manned = True
 # === FIXED: Static 0.5 threshold ===
 dynamic_threshold = 0.5
+# Scores at or above this are a GO decision
+go_threshold = 0.25
+
+# predict_launch_feasibility keyword -> feature, in model input column order
+ARG_FEATURES = {
+    "temp": "Temperature_C",
+    "wind": "Wind_Speed_kmph",
+    "pressure": "Atmospheric_Pressure_hPa",
+    "humidity": "Humidity_percent",
+    "visibility": "Visibility_km",
+    "clouds": "Cloud_Cover_percent",
+    "thrust": "Engine_Thrust_kN",
+    "pump_pressure": "Fuel_Pump_Pressure_bar",
+    "avionics": "Avionics_Status",
+    "sensors": "Sensor_Reliability",
+}
+FEATURES = list(ARG_FEATURES.values())
+
+timesteps = 10
+features = 11
+time_axis = np.linspace(0, 1, timesteps)
+
+# Simulated 10-step trend: value + amplitude * sin(2*pi*t + phase) per feature
+trend_amplitude = np.array([5, 3, 10, 5, 2, 5, 10, 5, 0.01, 0.01])
+trend_phase = np.arange(10) * 0.5
+
+# Monte Carlo dropout passes per input, all run in a single forward pass
+mc_samples = 10
+# Sequences per forward pass (inputs x MC samples), bounds peak memory
+max_batch_rows = 8192
+# Rendered trend plots kept, keyed by the raw input values
+plot_cache_size = 128
+
+range_min = np.array([ranges[f][0] for f in FEATURES], dtype=float)
+range_max = np.array([ranges[f][1] for f in FEATURES], dtype=float)
+threshold_min = np.array([thresholds.get(f, {}).get("min", np.nan) for f in FEATURES], dtype=float)
+threshold_max = np.array([thresholds.get(f, {}).get("max", np.nan) for f in FEATURES], dtype=float)
+
 
-def predict_launch_feasibility(temp, wind, pressure, humidity, visibility, clouds, thrust, pump_pressure, avionics, sensors):
-    timesteps = 10
-    features = 11
-    time = np.linspace(0, 1, timesteps)
-
-    # Initial input dictionary
-    inputs = {
-        "Temperature_C": temp,
-        "Wind_Speed_kmph": wind,
-        "Atmospheric_Pressure_hPa": pressure,
-        "Humidity_percent": humidity,
-        "Visibility_km": visibility,
-        "Cloud_Cover_percent": clouds,
-        "Engine_Thrust_kN": thrust,
-        "Fuel_Pump_Pressure_bar": pump_pressure,
-        "Avionics_Status": avionics,
-        "Sensor_Reliability": sensors
-    }
-
-    # Validate inputs
-    for feature, value in inputs.items():
-        min_val, max_val = ranges.get(feature, (-float('inf'), float('inf')))
-        if not (min_val <= value <= max_val):
-            return f"Error: {feature} value {value} out of range [{min_val}, {max_val}]"
-
-    # Simulate 10 time steps
-    input_data = np.zeros((timesteps, features))
-    for i, t in enumerate(time):
-        input_data[i] = [
-            temp + 5 * np.sin(2 * np.pi * t),
-            wind + 3 * np.sin(2 * np.pi * t + 0.5),
-            pressure + 10 * np.sin(2 * np.pi * t + 1),
-            humidity + 5 * np.sin(2 * np.pi * t + 1.5),
-            visibility + 2 * np.sin(2 * np.pi * t + 2),
-            clouds + 5 * np.sin(2 * np.pi * t + 2.5),
-            thrust + 10 * np.sin(2 * np.pi * t + 3),
-            pump_pressure + 5 * np.sin(2 * np.pi * t + 3.5),
-            avionics + 0.01 * np.sin(2 * np.pi * t + 4),
-            sensors + 0.01 * np.sin(2 * np.pi * t + 4.5),
-            (temp + 5 * np.sin(2 * np.pi * t)) * (wind + 3 * np.sin(2 * np.pi * t + 0.5))
-        ]
-
-    # Scale input
-    input_scaled = scaler.transform(input_data)
-    pred_input = input_scaled.reshape(1, timesteps, features)
-
-    # Monte Carlo prediction
-    predictions = [model.predict(pred_input, verbose=0)[0][0] for _ in range(10)]
-    score = np.mean(predictions)
-    uncertainty = np.std(predictions)
-
-    # Check rule-based violations
-    max_inputs = {k: np.max(input_data[:, i]) for i, k in enumerate(inputs)}
-    min_inputs = {k: np.min(input_data[:, i]) for i, k in enumerate(inputs)}
-    violations = []
-
-    for feature in inputs:
-        thresh = thresholds.get(feature, {})
-        if "min" in thresh and min_inputs[feature] < thresh["min"]:
-            violations.append(f"{feature}: {min_inputs[feature]:.2f} < {thresh['min']}")
-        if "max" in thresh and max_inputs[feature] > thresh["max"]:
-            violations.append(f"{feature}: {max_inputs[feature]:.2f} > {thresh['max']}")
-
-    # Decision logic
-    decision = "✅ Good to go" if score >= 0.25 else "❌ No go"
-
-    alert = "🚨 RED ALERT 🚨\n" + "\n".join(violations) if violations else "✅ All systems within limits"
-
-    # Optional: create base64-encoded plot
-    plt.figure(figsize=(8, 4))
-    plt.plot(time, input_data[:, 0], label="Temperature")
-    plt.plot(time, input_data[:, 1], label="Wind Speed")
-    plt.xlabel("Time")
-    plt.ylabel("Value")
-    plt.legend()
-    plt.title("Environmental Trends")
+def build_input_sequences(values):
+    """(B, 10) raw inputs -> (B, timesteps, features) simulated trends, unscaled."""
+    values = np.asarray(values, dtype=float)
+    trend = trend_amplitude * np.sin(2 * np.pi * time_axis[:, None] + trend_phase)
+    sequences = np.empty((len(values), timesteps, features))
+    sequences[:, :, :10] = values[:, None, :] + trend
+    sequences[:, :, 10] = sequences[:, :, 0] * sequences[:, :, 1]
+    return sequences
+
+
+def mc_dropout_predict(sequences_scaled, samples=mc_samples):
+    """Score scaled sequences with ``samples`` dropout-enabled passes each.
+
+    Every input is repeated ``samples`` times and the whole stack goes
+    through one ``model(x, training=True)`` call, so dropout stays active
+    and the K samples cost a single graph dispatch. Returns (mean, std) per
+    input; ``samples <= 1`` is a plain deterministic pass.
+    """
+    model = load_artifacts()["model"]
+    x = np.asarray(sequences_scaled, dtype=np.float32)
+    if samples <= 1:
+        score = np.asarray(model(x, training=False))[:, 0]
+        return score, np.zeros_like(score)
+    per_chunk = max(1, max_batch_rows // samples)
+    scores = []
+    for start in range(0, len(x), per_chunk):
+        chunk = np.repeat(x[start:start + per_chunk], samples, axis=0)
+        scores.append(np.asarray(model(chunk, training=True))[:, 0].reshape(-1, samples))
+    scores = np.concatenate(scores)
+    return scores.mean(axis=1), scores.std(axis=1)
+
+
+def _validation_error(item, row_ok):
+    for name, feature, ok in zip(ARG_FEATURES, FEATURES, row_ok):
+        if not ok:
+            min_val, max_val = ranges[feature]
+            return f"Error: {feature} value {item[name]} out of range [{min_val}, {max_val}]"
+
+
+def violations(row_min, row_max):
+    """``thresholds`` breaches of per-feature minima/maxima over a window, as alert lines."""
+    found = []
+    for i, feature in enumerate(FEATURES):
+        if row_min[i] < threshold_min[i]:
+            found.append(f"{feature}: {row_min[i]:.2f} < {thresholds[feature]['min']}")
+        if row_max[i] > threshold_max[i]:
+            found.append(f"{feature}: {row_max[i]:.2f} > {thresholds[feature]['max']}")
+    return found
+
+
+@functools.lru_cache(maxsize=plot_cache_size)
+def _plot_base64(values):
+    # Agg canvas on a bare Figure: no pyplot state, no GUI toolkit import,
+    # and the interactive backend of the calling script is left alone
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    input_data = build_input_sequences([values])[0]
+    fig = Figure(figsize=(8, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(time_axis, input_data[:, 0], label="Temperature")
+    ax.plot(time_axis, input_data[:, 1], label="Wind Speed")
+    ax.set_xlabel("Time")
+    ax.set_ylabel("Value")
+    ax.legend()
+    ax.set_title("Environmental Trends")
     buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    buf.seek(0)
-    img_str = base64.b64encode(buf.getvalue()).decode('utf-8')
-    plt.close()
-
-    return {
-        "score": round(score, 4),
-        "uncertainty": round(uncertainty, 4),
-        "decision": decision,
-        "threshold": round(dynamic_threshold, 4),
-        "violations": violations,
-        "alert": alert,
-        "img_base64": img_str
-    }
+    fig.savefig(buf, format='png')
+    return base64.b64encode(buf.getvalue()).decode('utf-8')
+
+
+def trend_plot_base64(item):
+    """Base64 PNG of the simulated temperature/wind trend for one input dict (cached)."""
+    return _plot_base64(tuple(float(item[name]) for name in ARG_FEATURES))
+
+
+def predict_launch_feasibility_batch(inputs, samples=mc_samples, plot=False):
+    """Score many condition sets at once.
+
+    ``inputs`` is a sequence of dicts with the ``predict_launch_feasibility``
+    keywords (the launch_input.json layout). Returns one entry per input in
+    the same order: the result dict, or the validation error string.
+    ``img_base64`` is None unless ``plot`` is set.
+    """
+    with profiler.phase("validation"):
+        inputs = list(inputs)
+        values = np.array([[item[name] for name in ARG_FEATURES] for item in inputs], dtype=float).reshape(-1, 10)
+        in_range = (values >= range_min) & (values <= range_max)
+        valid = in_range.all(axis=1)
+        results = [_validation_error(item, row_ok) for item, row_ok in zip(inputs, in_range)]
+    if not valid.any():
+        return results
+
+    # Only inputs that passed validation reach the model (and trigger loading it)
+    with profiler.phase("load"):
+        scaler = load_artifacts()["scaler"]
+    with profiler.phase("sequences"):
+        input_data = build_input_sequences(values[valid])
+    with profiler.phase("scaling"):
+        scaled = scaler.transform(input_data.reshape(-1, features)).reshape(input_data.shape)
+    with profiler.phase("inference"):
+        scores, uncertainties = mc_dropout_predict(scaled, samples)
+    with profiler.phase("plot"):
+        images = [trend_plot_base64(inputs[i]) if plot else None for i in np.flatnonzero(valid)]
+
+    with profiler.phase("results"):
+        mins = input_data[:, :, :10].min(axis=1)
+        maxs = input_data[:, :, :10].max(axis=1)
+        for k, i in enumerate(np.flatnonzero(valid)):
+            breaches = violations(mins[k], maxs[k])
+            results[i] = {
+                "score": round(float(scores[k]), 4),
+                "uncertainty": round(float(uncertainties[k]), 4),
+                "decision": "✅ Good to go" if scores[k] >= go_threshold else "❌ No go",
+                "threshold": round(dynamic_threshold, 4),
+                "violations": breaches,
+                "alert": "🚨 RED ALERT 🚨\n" + "\n".join(breaches) if breaches else "✅ All systems within limits",
+                "img_base64": images[k],
+            }
+    return results
+
+
+def predict_launch_feasibility(temp, wind, pressure, humidity, visibility, clouds, thrust, pump_pressure, avionics, sensors,
+                               samples=mc_samples, plot=False):
+    return predict_launch_feasibility_batch([{
+        "temp": temp, "wind": wind, "pressure": pressure, "humidity": humidity, "visibility": visibility,
+        "clouds": clouds, "thrust": thrust, "pump_pressure": pump_pressure, "avionics": avionics, "sensors": sensors,
+    }], samples, plot)[0]
+
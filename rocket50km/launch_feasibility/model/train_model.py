@@ -1,52 +1,188 @@
 # rocket50km/launch_feasibility/model/train_model.py
+#
+# Streaming training for the launch LSTM. Condition rows are read lazily from
+# the .npy shards written by generate_synthetic_data.py (memory-mapped), turned
+# into 10-step windows with the same build_input_sequences() that predict.py
+# uses, scaled by one MinMaxScaler fitted in a single streaming pass, and fed
+# to Keras through a prefetching tf.data pipeline. RAM use is bounded by the
+# batch size and the dataset only by disk.
+#
+#   python launch_feasibility/model/train_model.py                                  # 100k-row default set
+#   python launch_feasibility/model/generate_synthetic_data.py --n 10000000 --format npy --out data/launch_shards
+#   python launch_feasibility/model/train_model.py --data data/launch_shards --epochs 5
 
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import joblib
 import numpy as np
-from sklearn.model_selection import train_test_split
+import tensorflow as tf
 from sklearn.preprocessing import MinMaxScaler
+from tensorflow.keras.callbacks import Callback
 from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import LSTM, Dense, Dropout
 from tensorflow.keras.optimizers import Adam
-import joblib
-import os
 
-# Settings
-timesteps = 10
-features = 11
-samples = 1000
-output_folder = "launch_feasibility/model"
-
-os.makedirs(output_folder, exist_ok=True)
-
-# Simulate realistic LSTM training data
-X = np.random.rand(samples, timesteps, features)
-
-# === ✅ FORCE GOOD LAUNCH OUTCOMES ===
-# Give the model y values close to 1.0 (success)
-y = np.linspace(0.8, 1.0, samples)  # high confidence
-np.random.shuffle(y)
-
-# Scale each sample
-scaler = MinMaxScaler()
-X_scaled = np.array([scaler.fit_transform(sample) for sample in X])
-
-# Train/test split
-X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=0.2, random_state=42)
-
-# LSTM Model
-model = Sequential([
-    LSTM(64, activation='tanh', return_sequences=True, input_shape=(timesteps, features)),
-    Dropout(0.2),
-    LSTM(32, activation='tanh', return_sequences=True),
-    Dropout(0.2),
-    LSTM(16, activation='tanh'),
-    Dropout(0.2),
-    Dense(16, activation='relu'),
-    Dense(1, activation='sigmoid')
-])
-model.compile(optimizer=Adam(), loss='mse')
-model.fit(X_train, y_train, epochs=30, batch_size=32, verbose=1)
-
-# Save model and data
-model.save(f"{output_folder}/launch_model.keras")
-joblib.dump(scaler, f"{output_folder}/scaler.save")
-np.save(f"{output_folder}/y_train.npy", y_train)
+from launch_feasibility.model.generate_synthetic_data import MANIFEST, iter_shards, write_dataset
+from launch_feasibility.model.numpy_lstm import export as export_numpy_weights
+from launch_feasibility.model.predict import build_input_sequences, features, timesteps
+
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DATA = os.path.join(MODEL_DIR, "synthetic_shards")
+
+# Rows per streaming pass when fitting the scaler
+SCALER_CHUNK_ROWS = 65536
+
+
+def fit_scaler(dataset_dir, chunk_rows=SCALER_CHUNK_ROWS):
+    """One ``partial_fit`` pass over every window of the dataset (train and validation rows alike)."""
+    scaler = MinMaxScaler()
+    for rows, _ in iter_shards(dataset_dir):
+        for start in range(0, len(rows), chunk_rows):
+            windows = build_input_sequences(rows[start:start + chunk_rows])
+            scaler.partial_fit(windows.reshape(-1, features))
+    return scaler
+
+
+def split_ranges(dataset_dir, val_fraction):
+    """``[(shard, start, stop)]`` row ranges per split; the last ``val_fraction`` of each shard validates."""
+    with open(os.path.join(dataset_dir, MANIFEST)) as f:
+        shards = json.load(f)["shards"]
+    train, val = [], []
+    for k, shard in enumerate(shards):
+        n_val = int(shard["rows"] * val_fraction)
+        train.append((k, 0, shard["rows"] - n_val))
+        val.append((k, shard["rows"] - n_val, shard["rows"]))
+    return train, val
+
+
+def _batches(ranges, batch_size):
+    return [(k, s, min(s + batch_size, stop)) for k, start, stop in ranges for s in range(start, stop, batch_size)]
+
+
+def make_dataset(dataset_dir, ranges, scaler, batch_size=256, shuffle=False, seed=0):
+    """A prefetching ``tf.data.Dataset`` of scaled ``(windows, labels)`` batches over ``ranges``.
+
+    Batches are contiguous row blocks (cheap reads from the memory maps);
+    with ``shuffle`` the block order and the rows inside each block are
+    reshuffled every epoch.
+    """
+    shards = list(iter_shards(dataset_dir))
+    batches = _batches(ranges, batch_size)
+    epoch = [0]
+
+    def generate():
+        rng = np.random.default_rng([seed, epoch[0]])
+        epoch[0] += 1
+        order = rng.permutation(len(batches)) if shuffle else range(len(batches))
+        for b in order:
+            k, start, stop = batches[b]
+            rows, labels = shards[k]
+            rows, labels = np.asarray(rows[start:stop]), np.asarray(labels[start:stop])
+            if shuffle:
+                perm = rng.permutation(len(rows))
+                rows, labels = rows[perm], labels[perm]
+            windows = build_input_sequences(rows)
+            scaled = scaler.transform(windows.reshape(-1, features)).reshape(windows.shape)
+            yield scaled.astype(np.float32), labels.astype(np.float32)
+
+    signature = (tf.TensorSpec((None, timesteps, features), tf.float32), tf.TensorSpec((None,), tf.float32))
+    dataset = tf.data.Dataset.from_generator(generate, output_signature=signature)
+    # A known length lets Keras end each epoch cleanly instead of "running out of data"
+    dataset = dataset.apply(tf.data.experimental.assert_cardinality(len(batches)))
+    return dataset.prefetch(tf.data.AUTOTUNE), len(batches)
+
+
+def save_labels(dataset_dir, ranges, path):
+    """Stream the labels of ``ranges`` into one ``.npy`` without holding them all in memory."""
+    shards = list(iter_shards(dataset_dir))
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32,
+                                    shape=(sum(stop - start for _, start, stop in ranges),))
+    n = 0
+    for k, start, stop in ranges:
+        out[n:n + stop - start] = shards[k][1][start:stop]
+        n += stop - start
+    out.flush()
+    return path
+
+
+class Throughput(Callback):
+    """Logs training samples/sec per epoch (and adds it to the epoch logs)."""
+
+    def __init__(self, samples_per_epoch):
+        super().__init__()
+        self.samples_per_epoch = samples_per_epoch
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._start = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        rate = self.samples_per_epoch / (time.perf_counter() - self._start)
+        if logs is not None:
+            logs["samples_per_sec"] = rate
+        print(f"epoch {epoch + 1}: {rate:,.0f} samples/sec")
+
+
+def build_model():
+    model = Sequential([
+        LSTM(64, activation='tanh', return_sequences=True, input_shape=(timesteps, features)),
+        Dropout(0.2),
+        LSTM(32, activation='tanh', return_sequences=True),
+        Dropout(0.2),
+        LSTM(16, activation='tanh'),
+        Dropout(0.2),
+        Dense(16, activation='relu'),
+        Dense(1, activation='sigmoid')
+    ])
+    model.compile(optimizer=Adam(), loss='mse')
+    return model
+
+
+def train(dataset_dir, out_dir=MODEL_DIR, epochs=30, batch_size=256, val_fraction=0.2, seed=42):
+    start = time.perf_counter()
+    scaler = fit_scaler(dataset_dir)
+    print(f"scaler fitted in one pass over {int(scaler.n_samples_seen_) // timesteps:,} windows "
+          f"({time.perf_counter() - start:.1f} s)")
+
+    train_ranges, val_ranges = split_ranges(dataset_dir, val_fraction)
+    train_data, train_steps = make_dataset(dataset_dir, train_ranges, scaler, batch_size, shuffle=True, seed=seed)
+    val_data, _ = make_dataset(dataset_dir, val_ranges, scaler, batch_size)
+    n_train = sum(stop - start for _, start, stop in train_ranges)
+    print(f"{n_train:,} training windows in {train_steps} batches of {batch_size}")
+
+    tf.random.set_seed(seed)
+    model = build_model()
+    model.fit(train_data, validation_data=val_data if val_fraction else None, epochs=epochs,
+              shuffle=False, callbacks=[Throughput(n_train)], verbose=2)
+
+    # Same artifacts predict.py loads, plus the NumPy copy for TensorFlow-free inference
+    os.makedirs(out_dir, exist_ok=True)
+    model.save(os.path.join(out_dir, "launch_model.keras"))
+    joblib.dump(scaler, os.path.join(out_dir, "scaler.save"))
+    save_labels(dataset_dir, train_ranges, os.path.join(out_dir, "y_train.npy"))
+    export_numpy_weights(model, scaler, os.path.join(out_dir, "launch_model.npz"))
+    return model, scaler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the launch feasibility LSTM from sharded data")
+    parser.add_argument("--data", default=DEFAULT_DATA,
+                        help="shard directory from generate_synthetic_data.py --format npy (created if missing)")
+    parser.add_argument("--n", type=int, default=100_000, help="rows to generate when --data does not exist")
+    parser.add_argument("--out", default=MODEL_DIR, help="where the model, scaler and weights are written")
+    parser.add_argument("--epochs", type=int, default=30)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--val-fraction", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.data, MANIFEST)):
+        write_dataset(args.data, args.n, args.seed, fmt="npy")
+        print(f"✅ Generated {args.n} synthetic samples in {args.data}")
+    train(args.data, args.out, args.epochs, args.batch_size, args.val_fraction, args.seed)
+    print(f"✅ Saved launch_model.keras, scaler.save, y_train.npy and launch_model.npz to {args.out}")
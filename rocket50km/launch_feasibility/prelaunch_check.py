@@ -1,6 +1,6 @@
-from launch_feasibility.model.predict import predict_launch_feasibility
+from launch_feasibility.service import predict_launch_feasibility
 
-def run_prelaunch_check():
+def run_prelaunch_check(service_url=None):
     print("\n🧪 Running AI Prelaunch Feasibility Check...\n")
 
     # Example input values
@@ -25,28 +25,25 @@ def run_prelaunch_check():
         thrust=thrust,
         pump_pressure=pump_pressure,
         avionics=avionics,
-        sensors=sensors
+        sensors=sensors,
+        plot=True,  # returned as plot_html
+        service_url=service_url  # None: FEASIBILITY_SERVICE_URL if set, else in-process
     )
 
     # 🪛 Debug print
     print("Raw Result from AI:", result)
 
-    # ✅ If model returned an error message instead of tuple
-    if not isinstance(result, tuple):
+    # ✅ If model returned an error message instead of a result dict
+    if not isinstance(result, dict):
         return {
             "error": result
         }
 
-    try:
-        return {
-            "score": float(result[0].split(":")[1].split("±")[0].strip()),
-            "uncertainty": float(result[0].split("±")[1].strip()),
-            "decision": result[1].split(":")[1].strip(),
-            "violations": result[2].split(":")[1].strip(),
-            "alert": result[3],
-            "plot_html": result[4]
-        }
-    except Exception as e:
-        return {
-            "error": f"Failed to parse result. Raw output: {result}. Error: {str(e)}"
-        }
+    return {
+        "score": result["score"],
+        "uncertainty": result["uncertainty"],
+        "decision": result["decision"],
+        "violations": result["violations"],
+        "alert": result["alert"],
+        "plot_html": result["img_base64"]
+    }
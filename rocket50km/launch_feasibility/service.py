@@ -0,0 +1,274 @@
+# launch_feasibility/service.py
+"""Warm feasibility scoring service on localhost HTTP (stdlib only, offline).
+
+The server loads the LSTM once and keeps it in memory. Concurrent requests
+are queued and coalesced into micro-batches: the batcher takes the first
+waiting request, keeps collecting for up to ``window_ms`` (or until
+``max_batch`` requests) and scores them all with one
+``predict_launch_feasibility_batch`` call.
+
+    POST /predict        one launch_input.json-style dict -> result dict
+    POST /predict_batch  list of dicts -> list of results
+                         (add ``?plot=1`` to fill ``img_base64``)
+    GET  /stats          request count, batch sizes, p50/p99 latency, throughput
+    GET  /health
+
+A rejected input comes back as ``{"error": "<validation message>"}``;
+``FeasibilityClient.predict`` turns that back into the string
+``predict_launch_feasibility`` returns. A missing or non-numeric field is
+an HTTP 400 and never reaches the batcher.
+
+Run from rocket50km/:  python -m launch_feasibility.service --port 8765
+"""
+import argparse
+import collections
+import json
+import os
+import queue
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from launch_feasibility.model import predict as feasibility
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Clients (prelaunch_check, eval_policy) use the service when this is set
+SERVICE_URL_ENV = "FEASIBILITY_SERVICE_URL"
+
+
+class MicroBatcher:
+    """Coalesces single scoring requests into batched model calls on one thread."""
+
+    def __init__(self, window_ms=5.0, max_batch=256, samples=feasibility.mc_samples, history=10000):
+        self.window = window_ms / 1000.0
+        self.max_batch = max_batch
+        self.samples = samples
+        self._queue = queue.Queue()
+        self._latencies = collections.deque(maxlen=history)
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.batches = 0
+        self._first_request = None
+        self._last_done = None
+        self._thread = threading.Thread(target=self._run, name="feasibility-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, inputs):
+        """Queue one or more input dicts; returns a Future of the list of results."""
+        future = Future()
+        self._queue.put((time.perf_counter(), list(inputs), future))
+        return future
+
+    def _collect(self):
+        pending = [self._queue.get()]
+        size = len(pending[0][1])
+        deadline = time.perf_counter() + self.window
+        while size < self.max_batch:
+            # Past the window, still take whatever is already queued
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            pending.append(item)
+            size += len(item[1])
+        return pending
+
+    def _run(self):
+        while True:
+            pending = self._collect()
+            inputs = [item for _, items, _ in pending for item in items]
+            try:
+                results = feasibility.predict_launch_feasibility_batch(inputs, self.samples)
+            except Exception:
+                # One bad request must not fail the others coalesced with it: score each on its own
+                outcomes = [self._score_alone(items) for _, items, _ in pending]
+            else:
+                outcomes, offset = [], 0
+                for _, items, _ in pending:
+                    outcomes.append((results[offset:offset + len(items)], None))
+                    offset += len(items)
+            done = time.perf_counter()
+            with self._stats_lock:
+                for (arrived, _, future), (result, error) in zip(pending, outcomes):
+                    if error is None:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(error)
+                    self._latencies.append(done - arrived)
+                    if self._first_request is None:
+                        self._first_request = arrived
+                self.requests += len(pending)
+                self.batches += 1
+                self._last_done = done
+
+    def _score_alone(self, items):
+        """``(results, None)``, or ``(None, exception)`` if this request's inputs fail to score."""
+        try:
+            return feasibility.predict_launch_feasibility_batch(items, self.samples), None
+        except Exception as e:  # reported to this request's client only
+            return None, e
+
+    def stats(self):
+        with self._stats_lock:
+            latencies = np.array(self._latencies) * 1e3
+            stats = {"requests": self.requests, "batches": self.batches,
+                     "mean_batch_requests": self.requests / self.batches if self.batches else 0.0,
+                     "window_ms": self.window * 1e3, "max_batch": self.max_batch}
+            if len(latencies):
+                p50, p99 = np.percentile(latencies, [50, 99])
+                elapsed = self._last_done - self._first_request
+                stats.update({"p50_ms": float(p50), "p99_ms": float(p99), "max_ms": float(latencies.max()),
+                              "throughput_rps": self.requests / elapsed if elapsed > 0 else 0.0})
+            return stats
+
+
+def _coerce(item):
+    """The input dict with every feature as a float; ValueError names a missing or non-numeric one."""
+    if not isinstance(item, dict):
+        raise ValueError(f"expected an object of inputs, got {type(item).__name__}")
+    missing = [name for name in feasibility.ARG_FEATURES if name not in item]
+    if missing:
+        raise ValueError(f"missing inputs: {', '.join(missing)}")
+    coerced = {}
+    for name in feasibility.ARG_FEATURES:
+        try:
+            coerced[name] = float(item[name])
+        except (ValueError, TypeError):
+            raise ValueError(f"input {name!r} must be a number, got {item[name]!r}") from None
+    return coerced
+
+
+def _encode(result):
+    return {"error": result} if isinstance(result, str) else result
+
+
+class _Handler(BaseHTTPRequestHandler):
+    batcher = None
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self._send(200, self.batcher.stats())
+        elif self.path == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path not in ("/predict", "/predict_batch"):
+            self._send(404, {"error": f"unknown path {url.path}"})
+            return
+        plot = urllib.parse.parse_qs(url.query).get("plot", ["0"])[0] not in ("0", "false", "")
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            inputs = [payload] if url.path == "/predict" else payload
+            inputs = [_coerce(item) for item in inputs]
+        except (ValueError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+            return
+        try:
+            results = self.batcher.submit(inputs).result()
+        except Exception as e:
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        if plot:
+            # Rendered here, on the request thread, so plots never hold up the batch
+            for item, result in zip(inputs, results):
+                if isinstance(result, dict):
+                    result["img_base64"] = feasibility.trend_plot_base64(item)
+        encoded = [_encode(r) for r in results]
+        self._send(200, encoded[0] if url.path == "/predict" else encoded)
+
+    def log_message(self, format, *args):
+        pass  # keep the per-request access log off the latency path
+
+
+class _Server(ThreadingHTTPServer):
+    # The default listen backlog of 5 drops bursts of concurrent clients into
+    # a 1 s SYN retry, which shows up as p99 latency
+    request_queue_size = 128
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, window_ms=5.0, max_batch=256,
+                samples=feasibility.mc_samples, warm=True):
+    """Build (but do not start) the HTTP server; ``port=0`` picks a free port."""
+    if warm:
+        # Load the model and trace the graph before the first real request
+        midpoint = (feasibility.range_min + feasibility.range_max) / 2
+        feasibility.predict_launch_feasibility_batch([dict(zip(feasibility.ARG_FEATURES, midpoint))], samples)
+    handler = type("FeasibilityHandler", (_Handler,), {"batcher": MicroBatcher(window_ms, max_batch, samples)})
+    server = _Server((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+class FeasibilityClient:
+    """Talks to a running service; ``predict`` mirrors ``predict_launch_feasibility``."""
+
+    def __init__(self, url=None, timeout=30.0):
+        self.url = (url or os.environ.get(SERVICE_URL_ENV) or f"http://{DEFAULT_HOST}:{DEFAULT_PORT}").rstrip("/")
+        self.timeout = timeout
+
+    def _request(self, path, payload=None):
+        data = None if payload is None else json.dumps(payload).encode()
+        request = urllib.request.Request(self.url + path, data=data, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+    @staticmethod
+    def _decode(result):
+        return result["error"] if set(result) == {"error"} else result
+
+    def predict(self, plot=False, **inputs):
+        return self._decode(self._request("/predict?plot=1" if plot else "/predict", inputs))
+
+    def predict_batch(self, inputs, plot=False):
+        path = "/predict_batch?plot=1" if plot else "/predict_batch"
+        return [self._decode(r) for r in self._request(path, list(inputs))]
+
+    def stats(self):
+        return self._request("/stats")
+
+
+def predict_launch_feasibility(service_url=None, plot=False, **inputs):
+    """Score through the service when a URL is given or set in the environment, else in-process."""
+    service_url = service_url or os.environ.get(SERVICE_URL_ENV)
+    if service_url:
+        return FeasibilityClient(service_url).predict(plot=plot, **inputs)
+    return feasibility.predict_launch_feasibility(plot=plot, **inputs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Warm launch feasibility scoring service")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--window-ms", type=float, default=5.0, help="micro-batch collection window")
+    parser.add_argument("--max-batch", type=int, default=256, help="max inputs per model call")
+    parser.add_argument("--samples", type=int, default=feasibility.mc_samples, help="MC dropout samples")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.window_ms, args.max_batch, args.samples)
+    print(f"🛰️  Feasibility service on http://{args.host}:{server.server_address[1]} "
+          f"(window {args.window_ms} ms, max batch {args.max_batch})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"📊 {server.RequestHandlerClass.batcher.stats()}")
+        server.server_close()
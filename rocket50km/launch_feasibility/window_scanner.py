@@ -0,0 +1,152 @@
+# launch_feasibility/window_scanner.py
+#
+# Finds launch windows in a time series of forecast conditions. Every 10-row
+# window of the series (the sequence length the model was trained on) is
+# scored in large batches, and consecutive GO windows are merged into launch
+# windows with the thresholds rules they break.
+#
+# Run from rocket50km/:
+#   python -m launch_feasibility.window_scanner forecast.csv
+#   python -m launch_feasibility.window_scanner forecast.npy --samples 10 --json windows.json
+#
+# CSV columns are the model features (Temperature_C, ...) or the
+# predict_launch_feasibility keywords (temp, wind, ...), plus an optional
+# time column. A .npy file is an (N, 10) array in keyword order.
+
+import argparse
+import csv
+import json
+import time
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from launch_feasibility.model import predict as feasibility
+
+TIME_COLUMN = "time"
+
+
+def load_series(path, time_column=TIME_COLUMN):
+    """Return ``(times, values)``: an (N,) array of row labels (row numbers when absent) and (N, 10) readings."""
+    if path.endswith(".npy"):
+        values = np.load(path).astype(float)
+        return np.arange(len(values)), values
+
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+    columns = []
+    for name, feature in feasibility.ARG_FEATURES.items():
+        if feature in header:
+            columns.append(header.index(feature))
+        elif name in header:
+            columns.append(header.index(name))
+        else:
+            raise ValueError(f"{path}: missing column {feature} (or {name})")
+    values = np.array([[row[c] for c in columns] for row in rows], dtype=float)
+    times = np.array([row[header.index(time_column)] for row in rows]) if time_column in header else np.arange(len(rows))
+    return times, values
+
+
+def window_sequences(values):
+    """(N, 10) readings -> (N - 9, timesteps, features) unscaled model inputs, one per window end."""
+    windows = sliding_window_view(values, feasibility.timesteps, axis=0).transpose(0, 2, 1)
+    sequences = np.empty((len(windows), feasibility.timesteps, feasibility.features))
+    sequences[:, :, :10] = windows
+    sequences[:, :, 10] = windows[:, :, 0] * windows[:, :, 1]
+    return sequences
+
+
+def score_windows(values, samples=1, chunk_windows=feasibility.max_batch_rows):
+    """Score every window of ``values``.
+
+    Returns ``(scores, uncertainties, valid)`` per window, indexed by the
+    window's last row minus 9. Windows with a reading outside ``ranges``
+    are not scored (NaN) and are never GO, as ``predict_launch_feasibility``
+    rejects such inputs.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values) - feasibility.timesteps + 1
+    scores = np.full(max(n, 0), np.nan)
+    uncertainties = np.full(max(n, 0), np.nan)
+    if n <= 0:
+        return scores, uncertainties, np.zeros(0, dtype=bool)
+
+    row_ok = ((values >= feasibility.range_min) & (values <= feasibility.range_max)).all(axis=1)
+    valid = sliding_window_view(row_ok, feasibility.timesteps).all(axis=1)
+    scaler = feasibility.load_artifacts()["scaler"]
+    # Chunked so peak memory is bounded however long the series is
+    for start in range(0, n, chunk_windows):
+        stop = min(start + chunk_windows, n)
+        keep = np.flatnonzero(valid[start:stop]) + start
+        if not len(keep):
+            continue
+        x = window_sequences(values[start:stop + feasibility.timesteps - 1])[keep - start]
+        scaled = scaler.transform(x.reshape(-1, feasibility.features)).reshape(x.shape)
+        scores[keep], uncertainties[keep] = feasibility.mc_dropout_predict(scaled, samples)
+    return scores, uncertainties, valid
+
+
+def go_runs(go):
+    """``[(first, last)]`` inclusive index ranges of consecutive True entries."""
+    edges = np.diff(np.concatenate([[0], go.astype(np.int8), [0]]))
+    return list(zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1))
+
+
+def scan(values, times=None, samples=1):
+    """Contiguous GO launch windows of a (N, 10) series, in time order.
+
+    A window is labelled by its last row, the time a GO decision could be
+    made from the 10 readings up to it. Each launch window reports the
+    first and last such time, its scores and the ``thresholds`` violations
+    over all readings it spans.
+    """
+    values = np.asarray(values, dtype=float)
+    times = np.arange(len(values)) if times is None else np.asarray(times)
+    scores, uncertainties, valid = score_windows(values, samples)
+    go = valid & (scores >= feasibility.go_threshold)
+    lag = feasibility.timesteps - 1
+
+    launch_windows = []
+    for first, last in go_runs(go):
+        span = values[first:last + lag + 1]
+        launch_windows.append({
+            "start": times[first + lag].item(),
+            "end": times[last + lag].item(),
+            "start_index": int(first + lag),
+            "end_index": int(last + lag),
+            "windows": int(last - first + 1),
+            "min_score": round(float(scores[first:last + 1].min()), 4),
+            "mean_score": round(float(scores[first:last + 1].mean()), 4),
+            "max_uncertainty": round(float(uncertainties[first:last + 1].max()), 4),
+            "violations": feasibility.violations(span.min(axis=0), span.max(axis=0)),
+        })
+    return launch_windows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scan a forecast time series for GO launch windows")
+    parser.add_argument("series", help="CSV (feature or keyword columns, optional time column) or (N, 10) .npy")
+    parser.add_argument("--time-column", default=TIME_COLUMN)
+    parser.add_argument("--samples", type=int, default=1,
+                        help=f"MC dropout passes per window (predict_launch_feasibility uses {feasibility.mc_samples})")
+    parser.add_argument("--json", default=None, help="also write the launch windows here")
+    args = parser.parse_args()
+
+    times, values = load_series(args.series, args.time_column)
+    start = time.perf_counter()
+    launch_windows = scan(values, times, args.samples)
+    elapsed = time.perf_counter() - start
+
+    n_windows = max(len(values) - feasibility.timesteps + 1, 0)
+    print(f"Scored {n_windows} windows in {elapsed:.2f} s ({n_windows / max(elapsed, 1e-9):,.0f} windows/s)")
+    for w in launch_windows:
+        print(f"✅ GO {w['start']} -> {w['end']} ({w['windows']} windows, min score {w['min_score']})")
+        for v in w["violations"]:
+            print(f"    🚨 {v}")
+    if not launch_windows:
+        print("❌ No GO windows")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(launch_windows, f, indent=2)
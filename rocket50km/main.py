@@ -1,16 +1,18 @@
-import time
-import math
+import argparse
 from config import (GRAVITY, ISP, THRUST, DRAG_COEFF, CROSS_SECTION_AREA,
                     PROPELLANT_MASS, DRY_MASS, TIME_STEP, MAX_G_FORCE)
+from physics import EXPONENTIAL_ATMOSPHERE
+from clock import RealTimeClock, add_clock_arguments, clock_from_args
 
 def get_air_density(altitude):
-    return 1.225 * math.exp(-altitude / 8500)
+    return EXPONENTIAL_ATMOSPHERE.density(altitude)
 
 def calculate_drag(velocity, altitude):
     rho = get_air_density(altitude)
     return 0.5 * rho * DRAG_COEFF * CROSS_SECTION_AREA * velocity**2 * (-1 if velocity > 0 else 1)
 
-def main():
+def main(clock=None):
+    clock = clock if clock is not None else RealTimeClock()
     time_elapsed = 0
     altitude = 0
     velocity = 0
@@ -67,11 +69,12 @@ def main():
         if altitude <= 0 and time_elapsed > 3:
             break
 
-        time.sleep(TIME_STEP)
+        clock.tick(TIME_STEP)
         time_elapsed += TIME_STEP
 
     print("\n✅ Flight Complete")
     print(f"🛰 Max Altitude: {max_altitude / 1000:.2f} km")
 
 if __name__ == "__main__":
-    main()
+    parser = add_clock_arguments(argparse.ArgumentParser())
+    main(clock_from_args(parser.parse_args()))
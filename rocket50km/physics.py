@@ -1,3 +1,4 @@
+import json
 import math
 import numpy as np
 
@@ -15,7 +16,139 @@ class Atmosphere:
 class DragCalculator:
     @staticmethod
     def calculate(velocity, altitude, area, cd, is_parachute=False):
+        # Analytic on purpose: a table would smooth the density jump at 25 km
         rho = Atmosphere.get_density(altitude)
         drag_area = area * (50 if is_parachute else 1)
         drag_force = 0.5 * rho * cd * drag_area * velocity * abs(velocity)
-        return -drag_force if velocity > 0 else drag_force
\ No newline at end of file
+        return -drag_force if velocity > 0 else drag_force
+
+class AtmosphereModel:
+    """Density and wind profile on a uniform altitude grid, shared by every sim.
+
+    Lookups interpolate linearly or with a monotone cubic (PCHIP) and clamp
+    outside the table, for Python floats and NumPy altitude arrays alike.
+    With ``resolution`` the profile is resampled once into a fine linear
+    cache table, so cubic accuracy costs no more than a linear lookup.
+    """
+
+    def __init__(self, altitudes, density, wind=None, method="linear", resolution=None):
+        altitudes = np.ascontiguousarray(altitudes, dtype=float)
+        density = np.ascontiguousarray(density, dtype=float)
+        wind = np.zeros_like(density) if wind is None else np.ascontiguousarray(wind, dtype=float)
+        if method not in ("linear", "cubic"):
+            raise ValueError(f"Unknown interpolation method: {method}")
+        steps = np.diff(altitudes)
+        if len(altitudes) < 2 or not np.allclose(steps, steps[0]):
+            raise ValueError("AtmosphereModel needs a uniform altitude grid with at least two points")
+
+        if resolution is not None:
+            fine = np.arange(altitudes[0], altitudes[-1] + 0.5 * resolution, resolution)
+            source = AtmosphereModel(altitudes, density, wind, method=method)
+            altitudes, density, wind = fine, source.density(fine), source.wind_speed(fine)
+            method = "linear"
+
+        self.method = method
+        self.altitudes = altitudes
+        self.base = float(altitudes[0])
+        self.top = float(altitudes[-1])
+        self.step = float(altitudes[1] - altitudes[0])
+        self._inv_step = 1.0 / self.step
+        self._last = len(altitudes) - 2
+        self._tables = {"density": density, "wind": wind}
+        self._slopes = {name: self._pchip_slopes(v) for name, v in self._tables.items()} if method == "cubic" else {}
+        # Python-list copies keep the scalar path free of NumPy scalar overhead
+        self._lists = {name: v.tolist() for name, v in self._tables.items()}
+        self._slope_lists = {name: v.tolist() for name, v in self._slopes.items()}
+        self._linear_tables = None
+
+    @classmethod
+    def from_profile(cls, path, **kwargs):
+        """Load a RocketPy profile written by ``rocketpy_env/generate_env_profile.py``."""
+        with open(path, 'r') as f:
+            profile = json.load(f)
+        altitudes = sorted(int(k) for k in profile["air_density"])
+        density = [profile["air_density"][str(a)] for a in altitudes]
+        wind = [profile["wind_speed"].get(str(a), 0.0) for a in altitudes]
+        return cls(altitudes, density, wind, **kwargs)
+
+    @classmethod
+    def from_function(cls, density_fn, top=150000, step=100, wind_fn=None, **kwargs):
+        altitudes = np.arange(0, top + step, step, dtype=float)
+        density = [density_fn(a) for a in altitudes]
+        wind = None if wind_fn is None else [wind_fn(a) for a in altitudes]
+        return cls(altitudes, density, wind, **kwargs)
+
+    @classmethod
+    def exponential(cls, sea_level_density=1.225, scale_height=8500, **kwargs):
+        return cls.from_function(lambda h: sea_level_density * math.exp(-h / scale_height), **kwargs)
+
+    @classmethod
+    def constant(cls, density, wind=0.0):
+        return cls([0.0, 1.0], [density, density], [wind, wind])
+
+    def density(self, altitude):
+        return self._lookup("density", altitude)
+
+    def linear_tables(self):
+        """(grid, density, wind) arrays for compiled kernels that do their own linear lookup."""
+        if self.method != "linear":
+            raise ValueError("linear_tables() needs a linear model; build one with resolution= for cubic accuracy")
+        if self._linear_tables is None:
+            grid = np.array([self.base, self.top, self._inv_step, self._last], dtype=float)
+            self._linear_tables = (grid, self._tables["density"], self._tables["wind"])
+        return self._linear_tables
+
+    def wind_speed(self, altitude):
+        return self._lookup("wind", altitude)
+
+    def _pchip_slopes(self, values):
+        delta = np.diff(values) / self.step
+        slopes = np.empty_like(values)
+        slopes[0], slopes[-1] = delta[0], delta[-1]
+        same_sign = delta[:-1] * delta[1:] > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            harmonic = 2.0 / (1.0 / delta[:-1] + 1.0 / delta[1:])
+        slopes[1:-1] = np.where(same_sign, harmonic, 0.0)
+        return slopes
+
+    def _lookup(self, name, altitude):
+        # isinstance first: np.ndim alone costs about as much as the scalar lookup
+        if isinstance(altitude, (int, float)) or np.ndim(altitude) == 0:
+            return self._lookup_scalar(name, float(altitude))
+        h = np.clip(np.asarray(altitude, dtype=float), self.base, self.top)
+        x = (h - self.base) * self._inv_step
+        idx = np.minimum(x.astype(np.intp), self._last)
+        s = x - idx
+        values = self._tables[name]
+        y0, y1 = values[idx], values[idx + 1]
+        if self.method == "linear":
+            return y0 + s * (y1 - y0)
+        slopes = self._slopes[name]
+        return self._hermite(s, y0, y1, slopes[idx] * self.step, slopes[idx + 1] * self.step)
+
+    def _lookup_scalar(self, name, h):
+        h = min(max(h, self.base), self.top)
+        x = (h - self.base) * self._inv_step
+        idx = min(int(x), self._last)
+        s = x - idx
+        values = self._lists[name]
+        y0, y1 = values[idx], values[idx + 1]
+        if self.method == "linear":
+            return y0 + s * (y1 - y0)
+        slopes = self._slope_lists[name]
+        return self._hermite(s, y0, y1, slopes[idx] * self.step, slopes[idx + 1] * self.step)
+
+    @staticmethod
+    def _hermite(s, y0, y1, m0, m1):
+        s2 = s * s
+        s3 = s2 * s
+        return ((2 * s3 - 3 * s2 + 1) * y0 + (s3 - 2 * s2 + s) * m0
+                + (-2 * s3 + 3 * s2) * y1 + (s3 - s2) * m1)
+
+
+# Table-backed scale-height model used by Rocket and main.py, in place of
+# 1.225 * exp(-h / 8500). The cubic on the 100 m grid stays within 1.1e-5
+# relative error up to 150 km; above that the table clamps to the 150 km
+# density (2.7e-8 kg/m^3), off by less than that in absolute terms.
+# benchmarks/bench_atmosphere.py checks the bound.
+EXPONENTIAL_ATMOSPHERE = AtmosphereModel.exponential(method="cubic")
@@ -0,0 +1,109 @@
+import contextlib
+import time
+
+PHASES = ("physics", "atmosphere", "logging", "observation", "reward")
+
+
+class NullProfiler:
+    """Records nothing. Instrumented code checks ``enabled`` once per call and skips every timer."""
+
+    enabled = False
+
+    def add(self, phase, seconds):
+        pass
+
+    def phase(self, name):
+        return _NULL_PHASE
+
+    def mark(self):
+        return None
+
+    def summary(self, since=None):
+        return {}
+
+    def report(self, since=None):
+        return {}
+
+
+# Shared defaults: instrumented code never has to test for None
+NULL_PROFILER = NullProfiler()
+_NULL_PHASE = contextlib.nullcontext()
+
+
+class PhaseProfiler:
+    """Accumulates wall time and call counts per named phase.
+
+    Pass one to a sim, env or ``predict`` (``predict.profiler = ...``);
+    totals accumulate until ``reset()``. The sims and envs record the
+    ``PHASES`` (physics, atmosphere, logging, observation, reward), the
+    feasibility path its own stages. ``summary``/``report``/``table`` take
+    a ``since=mark()`` to cover only what was recorded after the mark: the
+    envs mark at ``reset()`` and report the episode alone, printing its
+    ``table()`` with ``verbose``.
+    """
+
+    enabled = True
+
+    def __init__(self, verbose=True):
+        self.verbose = verbose
+        self.reset()
+
+    def reset(self):
+        self.seconds = {}
+        self.calls = {}
+
+    def add(self, phase, seconds):
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def phase(self, name):
+        """Context manager timing one block; for coarse phases only (it costs a few microseconds)."""
+        return _Timed(self, name)
+
+    def mark(self):
+        """Current totals, to pass as ``since`` later."""
+        return dict(self.seconds), dict(self.calls)
+
+    def summary(self, since=None):
+        """``{phase: {"seconds", "calls", "mean_us", "share"}}``, slowest phase first."""
+        seconds, calls = self.seconds, self.calls
+        if since is not None:
+            seconds = {p: t - since[0].get(p, 0.0) for p, t in seconds.items()}
+            calls = {p: n - since[1].get(p, 0) for p, n in calls.items()}
+            seconds = {p: t for p, t in seconds.items() if calls[p]}
+        total = sum(seconds.values()) or 1.0
+        return {
+            phase: {
+                "seconds": t,
+                "calls": calls[phase],
+                "mean_us": t / calls[phase] * 1e6,
+                "share": t / total,
+            }
+            for phase, t in sorted(seconds.items(), key=lambda item: -item[1])
+        }
+
+    def report(self, since=None):
+        """Episode-end hook for the envs: prints ``table(since)`` when ``verbose``, returns ``summary(since)``."""
+        if self.verbose:
+            print(self.table(since))
+        return self.summary(since)
+
+    def table(self, since=None):
+        lines = [f"{'phase':14s}{'seconds':>11s}{'calls':>11s}{'mean us':>11s}{'share':>8s}"]
+        for phase, s in self.summary(since).items():
+            lines.append(f"{phase:14s}{s['seconds']:11.4f}{s['calls']:11d}{s['mean_us']:11.2f}{s['share']:8.1%}")
+        return "\n".join(lines)
+
+
+class _Timed:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
@@ -1,13 +1,24 @@
 import json
 import os
+import time
 import numpy as np
+from physics import EXPONENTIAL_ATMOSPHERE
+from profiler import NULL_PROFILER
+from sim_state import SnapshotState
 
-class Rocket:
-    def __init__(self):
+class Rocket(SnapshotState):
+    # mass is derived from propellant_mass; done/landed are left to the caller
+    SNAPSHOT_FIELDS = ("time", "altitude", "velocity", "acceleration", "throttle", "fuel_mass")
+    SNAPSHOT_RENAMES = {"fuel_mass": "propellant_mass"}
+
+    def __init__(self, profiler=None):
         config_path = os.path.join(os.path.dirname(__file__), 'config.json')
         with open(config_path) as f:
             self.config = json.load(f)
         
+        self.atmosphere = EXPONENTIAL_ATMOSPHERE
+        # Opt-in per-phase timing (profiler.PhaseProfiler)
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
         self.reset()
     
     def reset(self):
@@ -27,6 +38,9 @@ class Rocket:
     
     def update(self, dt):
         config = self.config
+        profiling = self.profiler.enabled
+        if profiling:
+            step_start = time.perf_counter()
 
         if self.propellant_mass > 0:
             thrust = self.throttle * config["engine"]["thrust"]
@@ -39,8 +53,11 @@ class Rocket:
 
         gravity_force = self.g0 * (self.earth_radius / (self.earth_radius + self.altitude))**2 * self.mass
 
-        scale_height = 8500
-        air_density = 1.225 * np.exp(-self.altitude / scale_height)
+        if profiling:
+            atmosphere_start = time.perf_counter()
+        air_density = self.atmosphere.density(self.altitude)
+        if profiling:
+            atmosphere_time = time.perf_counter() - atmosphere_start
 
         drag_coeff = config["rocket"]["drag_coeff"]
         cross_section = config["rocket"]["cross_section_area"]
@@ -63,6 +80,10 @@ class Rocket:
 
         self.time += dt
 
+        if profiling:
+            self.profiler.add("atmosphere", atmosphere_time)
+            self.profiler.add("physics", time.perf_counter() - step_start - atmosphere_time)
+
         return {
             "altitude": self.altitude,
             "velocity": self.velocity,
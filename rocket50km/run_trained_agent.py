@@ -1,9 +1,12 @@
 # run_trained_agent.py
 
-import time
+import argparse
 import numpy as np
 from stable_baselines3 import PPO
 from ai.realistic_env import RealisticRocketEnv
+from clock import add_clock_arguments, clock_from_args
+
+clock = clock_from_args(add_clock_arguments(argparse.ArgumentParser()).parse_args())
 
 # Load environment and model
 env = RealisticRocketEnv()
@@ -17,4 +20,4 @@ while not done:
     action, _ = model.predict(obs, deterministic=True)
     obs, reward, done, truncated, _ = env.step(action)
     env.render()
-    time.sleep(0.05)  # simulate real-time
+    clock.tick(env.control_time_step)  # real-time unless --clock fast
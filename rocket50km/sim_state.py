@@ -0,0 +1,97 @@
+import numpy as np
+
+# Fixed-size flight state shared by every sim: snapshot() returns these
+# fields as one float64 vector (booleans as 0/1). It is also the compiled
+# kernels' state array (ai.step_kernels), so their snapshots are plain copies.
+STATE_FIELDS = (
+    "time", "altitude", "velocity", "acceleration", "throttle", "pitch_angle",
+    "downrange", "horizontal_velocity", "fuel_mass", "mass", "drag_coeff",
+    "parachute_deployed", "done", "landed", "max_altitude",
+)
+STATE_SIZE = len(STATE_FIELDS)
+BOOL_FIELDS = ("parachute_deployed", "done", "landed")
+
+# The 1-D sims have no pitch or horizontal motion; their snapshots leave those slots at 0
+VERTICAL_FIELDS = tuple(f for f in STATE_FIELDS if f not in ("pitch_angle", "downrange", "horizontal_velocity"))
+
+
+def _layout(fields, renames):
+    return tuple((STATE_FIELDS.index(f), renames.get(f, f), f in BOOL_FIELDS) for f in fields)
+
+
+class SnapshotState:
+    """Mixin adding ``snapshot()`` / ``restore()`` over ``SNAPSHOT_FIELDS``.
+
+    A snapshot holds the dynamic state only. Parameters (thrust, isp,
+    dry_mass, time_step, ...) and the logger are left alone, so restore a
+    snapshot into a sim configured like the one that took it; a restored
+    ``RealisticRocketSim`` keeps appending to its current log instead of
+    truncating it the way ``reset()`` does.
+    """
+
+    __slots__ = ()
+
+    SNAPSHOT_FIELDS = STATE_FIELDS
+    # layout field -> attribute name, for sims that name a field differently
+    SNAPSHOT_RENAMES = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._snapshot_layout = _layout(cls.SNAPSHOT_FIELDS, cls.SNAPSHOT_RENAMES)
+
+    def snapshot(self):
+        """The current state as a float64 vector of ``STATE_SIZE`` (see ``STATE_FIELDS``)."""
+        state = np.zeros(STATE_SIZE)
+        for index, attr, _ in self._snapshot_layout:
+            state[index] = getattr(self, attr)
+        return state
+
+    def restore(self, state):
+        """Continue from ``state``, a vector returned by ``snapshot()`` on this or any other sim."""
+        values = np.asarray(state, dtype=float).tolist()
+        if len(values) != STATE_SIZE:
+            raise ValueError(f"state vector has {len(values)} entries, expected {STATE_SIZE}")
+        for index, attr, is_bool in self._snapshot_layout:
+            setattr(self, attr, bool(values[index]) if is_bool else values[index])
+
+
+class BatchSnapshotState:
+    """Batch-sim counterpart of ``SnapshotState``: one state row per rocket."""
+
+    SNAPSHOT_FIELDS = STATE_FIELDS
+
+    def snapshot(self):
+        """The state of every rocket, shape (N, ``STATE_SIZE``)."""
+        state = np.zeros((self.n_rockets, STATE_SIZE))
+        for field in self.SNAPSHOT_FIELDS:
+            state[:, STATE_FIELDS.index(field)] = getattr(self, field)
+        return state
+
+    def restore(self, state, mask=None):
+        """Load ``state``, shape (N, ``STATE_SIZE``) or one (``STATE_SIZE``,) vector for every rocket.
+
+        With a boolean ``mask`` only the selected rockets are overwritten.
+        ``landing_velocity`` of restored rockets is cleared: it is recorded
+        at touchdown and not part of the state vector.
+        """
+        state = np.broadcast_to(np.asarray(state, dtype=float), (self.n_rockets, STATE_SIZE))
+        rows = slice(None) if mask is None else mask
+        for field in self.SNAPSHOT_FIELDS:
+            column = state[:, STATE_FIELDS.index(field)]
+            if field in BOOL_FIELDS:
+                column = column != 0
+            getattr(self, field)[rows] = column[rows]
+        self.landing_velocity[rows] = 0.0
+
+    @classmethod
+    def branch(cls, state, k, **kwargs):
+        """``k`` rockets continuing from one ``snapshot()`` vector.
+
+        Steer each continuation through ``step``/``run`` with per-rocket
+        actions, e.g. ``run(throttles)`` with ``throttles`` of shape (k,);
+        only the rest of the flight is simulated, not the prefix up to the
+        snapshot. ``kwargs`` go to the constructor.
+        """
+        sim = cls(k, **kwargs)
+        sim.restore(state)
+        return sim
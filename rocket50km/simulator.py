@@ -1,7 +1,9 @@
-import time
+import argparse
 from ai.rocket_env import RocketSimulator
+from clock import RealTimeClock, add_clock_arguments, clock_from_args
 
-def run_flight_simulation():
+def run_flight_simulation(clock=None):
+    clock = clock if clock is not None else RealTimeClock()
     rocket = RocketSimulator()
     print("🚀 Launching...\n")
 
@@ -11,15 +13,17 @@ def run_flight_simulation():
 
         if int(rocket.time * 10) % 20 == 0:
             print(
-                f"Time: {telemetry['time']:.1f}s | Altitude: {telemetry['altitude']:.2f} m | "
+                f"Time: {rocket.time:.1f}s | Altitude: {telemetry['altitude']:.2f} m | "
                 f"Velocity: {telemetry['velocity']:.2f} m/s | Fuel: {telemetry['fuel_mass']:.1f} kg"
             )
 
-        time.sleep(rocket.time_step)
+        clock.tick(rocket.time_step)
 
     print("\n🛬 Landed.")
     print(f"✅ Max altitude reached: {rocket.max_altitude:.2f} meters")
+    print(f"⏱️  Clock: {clock.summary()}")
 
 # Optional: allow standalone run
 if __name__ == "__main__":
-    run_flight_simulation()
+    parser = add_clock_arguments(argparse.ArgumentParser())
+    run_flight_simulation(clock_from_args(parser.parse_args()))
@@ -1,44 +1,65 @@
 # train_rl_agent.py
 
 import os
+import argparse
 import gym
 import torch
 from stable_baselines3 import PPO
 from stable_baselines3.common.callbacks import CheckpointCallback
-from ai.realistic_env import RealisticRocketEnv  # Use your actual env import
-
-# Create the environment
-env = RealisticRocketEnv()
-
-# Set up PPO model
-model = PPO(
-    policy="MlpPolicy",
-    env=env,
-    verbose=1,
-    tensorboard_log="./ppo_tensorboard/",
-    learning_rate=3e-4,
-    n_steps=2048,
-    batch_size=64,
-    gae_lambda=0.95,
-    gamma=0.99,
-    clip_range=0.2,
-    ent_coef=0.01
-)
-
-# Save checkpoints
-checkpoint_callback = CheckpointCallback(
-    save_freq=5000,
-    save_path="./checkpoints/",
-    name_prefix="ppo_rocket"
-)
-
-# Train the agent
-model.learn(
-    total_timesteps=200_000,  # You can increase this
-    callback=checkpoint_callback
-)
-
-# Save the final model
-model.save("ppo_rocket_final")
-
-print("✅ Training complete. Model saved as 'ppo_rocket_final.zip'")
+from ai.callbacks import ThroughputCallback
+from ai.vec_env import VEC_BACKENDS, make_vec_env
+
+
+def main():
+    # A function, so SubprocVecEnv workers can import this module without re-running training
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n-envs", type=int, default=1, help="parallel rockets per rollout step")
+    parser.add_argument("--vec-backend", choices=VEC_BACKENDS, default="batched",
+                        help="dummy: envs in this process, subproc: one process per env, batched: one vectorized sim")
+    parser.add_argument("--normalize-obs", action="store_true",
+                        help="shared VecNormalize observation statistics, saved to vec_normalize.pkl")
+    parser.add_argument("--total-timesteps", type=int, default=200_000)
+    parser.add_argument("--tensorboard-log", default="./ppo_tensorboard/", help="'' to disable")
+    args = parser.parse_args()
+
+    # Create the environment (no per-step CSV logging during training)
+    env = make_vec_env(args.n_envs, args.vec_backend, normalize_obs=args.normalize_obs)
+
+    # Set up PPO model
+    model = PPO(
+        policy="MlpPolicy",
+        env=env,
+        verbose=1,
+        tensorboard_log=args.tensorboard_log or None,
+        learning_rate=3e-4,
+        n_steps=2048,
+        batch_size=64,
+        gae_lambda=0.95,
+        gamma=0.99,
+        clip_range=0.2,
+        ent_coef=0.01
+    )
+
+    # Save checkpoints
+    checkpoint_callback = CheckpointCallback(
+        save_freq=max(5000 // args.n_envs, 1),
+        save_path="./checkpoints/",
+        name_prefix="ppo_rocket"
+    )
+
+    # Train the agent
+    model.learn(
+        total_timesteps=args.total_timesteps,  # You can increase this
+        callback=[checkpoint_callback, ThroughputCallback(verbose=1)]  # steps/s, rollout and update time -> tensorboard
+    )
+
+    # Save the final model
+    model.save("ppo_rocket_final")
+    if args.normalize_obs:
+        env.save("vec_normalize.pkl")  # needed to run the policy: ai.export_policy --vec-normalize
+
+    print("✅ Training complete. Model saved as 'ppo_rocket_final.zip'")
+
+
+if __name__ == "__main__":
+    main()